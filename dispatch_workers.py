@@ -13,31 +13,81 @@ Usage:
 """
 from __future__ import annotations
 
+import atexit
+import heapq
+import itertools
 import json
+import logging
 import os
+import queue
 import re
+import select
 import subprocess
 import shutil
+import signal
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+log = logging.getLogger(__name__)
+
 # Default config path next to this script
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "dispatch_config.json"
 TASK_FILE = ".current_task.txt"
 SUGGESTED_FILE = "suggested_tasks.txt"
 
-# Open null device once; used for worker stdout/stderr to avoid any pipe (and thus _readerthread) on Windows where pipe decoding can raise UnicodeDecodeError.
-_NULL_DEV = open(os.devnull, "wb")  # noqa: SIM115
 TASK_QUEUE_FILE = "task_queue.json"
 MERGE_LOCK_FILE = ".dispatch_merge.lock"
 PENDING_MERGE_RETRIES_FILE = ".dispatch_pending_merge_retries.json"
+# Changes since the last snapshot, one JSON op per line; folded into the snapshot once it grows past the limit.
+PENDING_MERGE_RETRIES_LOG = ".dispatch_pending_merge_retries.log"
+PENDING_MERGE_LOG_COMPACT_BYTES = 64 * 1024
 MERGE_SLOT_TIMEOUT_SECS = 120
+# Returned by a merge that gave up waiting for the merge slot; it is queued again rather than dropped.
+MERGE_SLOT_BUSY = object()
+# Pending merges are retried as soon as task state changes (a conflict task may have closed), at most every
+# RETRY_PENDING_MIN_INTERVAL_SECS; RETRY_PENDING_INTERVAL_SECS is the fallback for changes that can't be seen.
 RETRY_PENDING_INTERVAL_SECS = 45
-
-# On Windows, run worker via a tiny wrapper so we never attach to the real process's stdout/stderr (avoids _readerthread + cp1252 decode errors).
-_USE_WRAPPER_WIN = sys.platform == "win32"
+RETRY_PENDING_MIN_INTERVAL_SECS = 5
+# task_queue.json and the pending-retry file are written compact; DISPATCH_PRETTY_JSON=1 indents them for hand editing.
+_JSON_DUMP_KWARGS: dict[str, Any] = (
+    {"indent": 2} if os.environ.get("DISPATCH_PRETTY_JSON", "").strip() == "1" else {"separators": (",", ":")}
+)
+
+# Bead IDs in plain bd output (e.g. ozon-4id, bd-1a2b3).
+_BEAD_PATTERN = re.compile(r"\b([a-z]+-[a-zA-Z0-9]+)\b")
+# Recent bd ready / bd list open results with the .beads state they were read at (task_state_signature).
+# Reused for _BD_TTL seconds (slots freeing together share one query), or up to _BD_STABLE_TTL while no
+# .beads file has changed since; cleared when this process changes beads.
+_BD_CACHE: dict[str, tuple[float, int, list[dict[str, Any]]]] = {}
+_BD_TTL = 2.0
+_BD_STABLE_TTL = 10.0
+# Worktree branch -> slot number, per worktree prefix (ozon-w3 -> 3).
+_BRANCH_RE_CACHE: dict[str, re.Pattern[str]] = {}
+
+# Windows: start console workers without a window. Their output goes to the null device, so no pipe is ever read or decoded (no cp1252 errors).
+_WORKER_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+# Everything the dispatcher opens is non-inheritable (PEP 446), so POSIX workers can skip subprocess's close-all-fds pass in the child.
+_WORKER_CLOSE_FDS = sys.platform == "win32"
+
+# POSIX: each worker leads its own session/process group, so stopping it reaches the editors/LSPs it started,
+# and a Ctrl+C in the dispatcher's terminal is handled by the dispatcher rather than hitting workers directly.
+_WORKER_NEW_SESSION = sys.platform != "win32"
+
+# For commands whose output is never read: no pipes, no reader thread on Windows, nothing to decode.
+_RUN_SILENT = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
 
 # Use UTF-8 for all subprocess output so bd/git/aider output never triggers UnicodeDecodeError (cp1252 on Windows).
 _SUBPROCESS_ENCODING = {"encoding": "utf-8", "errors": "replace"} if sys.platform == "win32" else {}
@@ -62,6 +112,21 @@ DEFAULT_TASKS = [
 ]
 
 
+def start_status_log() -> QueueListener:
+    """Send status lines through a queue to one stdout-writing thread, so logging from the loop or the merge
+    thread never waits on the terminal. Flushed by stop() (registered with atexit)."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stdout_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return listener
+
+
 def load_config(path: Path) -> dict[str, Any]:
     with open(path, encoding="utf-8") as f:
         return json.load(f)
@@ -81,40 +146,136 @@ def use_beads(repo_root: Path) -> bool:
     return (repo_root / ".beads").exists() and (shutil.which("bd") is not None)
 
 
+def task_state_signature(repo_root: Path, beads_mode: bool) -> int:
+    """Newest mtime_ns among the files holding task status (.beads/*, or task_queue.json); 0 if none exist.
+    Changes whenever a task or bead is created, claimed or closed, by this process or any other."""
+    if not beads_mode:
+        try:
+            return task_queue_path(repo_root).stat().st_mtime_ns
+        except OSError:
+            return 0
+    newest = 0
+    try:
+        with os.scandir(repo_root / ".beads") as it:
+            for entry in it:
+                try:
+                    newest = max(newest, entry.stat().st_mtime_ns)
+                except OSError:
+                    continue  # removed while scanning (e.g. a sqlite journal)
+    except OSError:
+        pass
+    return newest
+
+
+def _atomic_write_json(path: Path, obj: Any) -> None:
+    """Write obj as JSON to a temp file beside path, then os.replace it in, so readers never see a half-written file."""
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, **_JSON_DUMP_KWARGS)
+    os.replace(tmp, path)
+
+
 # ---------- File-based task queue (no Beads required) ----------
 def task_queue_path(repo_root: Path) -> Path:
     return repo_root / TASK_QUEUE_FILE
 
 
+# Parsed task_queue.json, reused while the file's mtime and size are unchanged (another process writing it invalidates).
+# "index" is built on first use: (task id -> task, pending task ids in queue order).
+_TQ_CACHE: dict[str, Any] = {"path": None, "mtime_ns": -1, "size": -1, "data": None, "index": None}
+# Held around read-modify-save of the queue: conflict tasks are added from the merge thread.
+_TQ_LOCK = threading.RLock()
+# Status changes made with save=False and not written yet (task id -> status); reapplied if the file is
+# reloaded, dropped once the queue is saved. See flush_task_queue.
+_TQ_UNSAVED: dict[str, str] = {}
+
+
+def _remember_task_queue(path: Path, st: os.stat_result, data: dict[str, Any]) -> None:
+    _TQ_CACHE.update(path=path, mtime_ns=st.st_mtime_ns, size=st.st_size, data=data, index=None)
+
+
+def _build_task_index(data: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], deque[str]]:
+    by_id: dict[str, dict[str, Any]] = {}
+    for t in data["tasks"]:
+        by_id.setdefault(t.get("id"), t)
+    pending = deque(t["id"] for t in data["tasks"] if t.get("status") == "pending")
+    return by_id, pending
+
+
+def _task_queue_index(repo_root: Path) -> tuple[dict[str, Any], dict[str, dict[str, Any]], deque[str]]:
+    """(data, by_id, pending) for the current queue; the index is kept with the cached data until the next save/reload.
+    Held under _TQ_LOCK: the merge thread saves the queue (conflict tasks), which resets the cached index."""
+    with _TQ_LOCK:
+        data = load_task_queue(repo_root)
+        if data is not _TQ_CACHE["data"]:
+            return (data, *_build_task_index(data))
+        if _TQ_CACHE["index"] is None:
+            _TQ_CACHE["index"] = _build_task_index(data)
+        return (data, *_TQ_CACHE["index"])
+
+
 def load_task_queue(repo_root: Path) -> dict[str, Any]:
+    """Return the task queue. The dict is shared with the cache: callers that modify it must save_task_queue it."""
     path = task_queue_path(repo_root)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return {"tasks": [], "next_id": 1}
+    if _TQ_CACHE["path"] == path and _TQ_CACHE["mtime_ns"] == st.st_mtime_ns and _TQ_CACHE["size"] == st.st_size:
+        return _TQ_CACHE["data"]
     with open(path, encoding="utf-8") as f:
-        return json.load(f)
+        data = json.load(f)
+    with _TQ_LOCK:
+        if _TQ_UNSAVED:
+            for t in data["tasks"]:
+                if t.get("id") in _TQ_UNSAVED:
+                    t["status"] = _TQ_UNSAVED[t["id"]]
+        _remember_task_queue(path, st, data)
+    return data
 
 
 def save_task_queue(repo_root: Path, data: dict[str, Any]) -> None:
     path = task_queue_path(repo_root)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with _TQ_LOCK:
+        _atomic_write_json(path, data)
+        _remember_task_queue(path, path.stat(), data)
+        _TQ_UNSAVED.clear()
 
 
-def get_next_pending_from_queue(repo_root: Path) -> dict[str, Any] | None:
-    data = load_task_queue(repo_root)
-    for t in data["tasks"]:
-        if t.get("status") == "pending":
+def flush_task_queue(repo_root: Path) -> None:
+    """Write status changes made with save=False (on top of any newer copy of the file another process wrote)."""
+    with _TQ_LOCK:
+        if _TQ_UNSAVED:
+            save_task_queue(repo_root, load_task_queue(repo_root))
+
+
+def get_next_pending_from_queue(repo_root: Path, exclude: set[str] | frozenset[str] = frozenset()) -> dict[str, Any] | None:
+    """First pending task whose id is not in exclude (e.g. picked but not yet marked in_progress)."""
+    _, by_id, pending = _task_queue_index(repo_root)
+    for task_id in pending:
+        if task_id not in exclude:
+            t = by_id[task_id]
             return {"id": t["id"], "title": t.get("title", t["id"])}
     return None
 
 
-def mark_task_status(repo_root: Path, task_id: str, status: str) -> None:
-    data = load_task_queue(repo_root)
-    for t in data["tasks"]:
-        if t["id"] == task_id:
-            t["status"] = status
-            break
-    save_task_queue(repo_root, data)
+def mark_task_status(repo_root: Path, task_id: str, status: str, save: bool = True) -> None:
+    mark_tasks_status(repo_root, [task_id], status, save)
+
+
+def mark_tasks_status(repo_root: Path, task_ids: list[str], status: str, save: bool = True) -> None:
+    """Set status on several tasks with one write of task_queue.json; save=False leaves the write to flush_task_queue."""
+    with _TQ_LOCK:
+        data, by_id, _ = _task_queue_index(repo_root)
+        for task_id in task_ids:
+            t = by_id.get(task_id)
+            if t is not None:
+                t["status"] = status
+                _TQ_UNSAVED[task_id] = status
+        if data is _TQ_CACHE["data"]:
+            _TQ_CACHE["index"] = None  # pending list changed
+        if save or data is not _TQ_CACHE["data"]:
+            save_task_queue(repo_root, data)
 
 
 # ---------- Merge slot (Gas Town-style: serialize merges) ----------
@@ -122,20 +283,57 @@ def _merge_lock_path(repo_root: Path) -> Path:
     return repo_root / MERGE_LOCK_FILE
 
 
+def _try_create_merge_lock(lock_path: Path) -> bool:
+    try:
+        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    os.write(fd, str(os.getpid()).encode())
+    os.close(fd)
+    return True
+
+
+def _merge_lock_watcher(lock_path: Path):
+    """inotify watch for files leaving the lock's directory, or None (no inotify_simple / not Linux)."""
+    if INotify is None:
+        return None
+    try:
+        watcher = INotify()
+    except OSError:
+        return None
+    try:
+        watcher.add_watch(str(lock_path.parent), inotify_flags.DELETE | inotify_flags.MOVED_FROM)
+    except OSError:
+        watcher.close()
+        return None
+    return watcher
+
+
 def acquire_merge_slot(repo_root: Path, timeout_secs: float = MERGE_SLOT_TIMEOUT_SECS) -> bool:
-    """Acquire the merge slot (file lock). Returns True if acquired. Blocks up to timeout_secs."""
+    """Acquire the merge slot (file lock). Returns True if acquired. Blocks up to timeout_secs.
+
+    While the lock is held elsewhere, waits on inotify for it to be removed (if inotify_simple is installed); otherwise re-checks every second.
+    """
     lock_path = _merge_lock_path(repo_root)
+    if _try_create_merge_lock(lock_path):
+        return True
     deadline = time.monotonic() + timeout_secs
-    while time.monotonic() < deadline:
-        try:
-            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-            os.write(fd, str(os.getpid()).encode())
-            os.close(fd)
-            return True
-        except FileExistsError:
-            time.sleep(1.0)
-            continue
-    return False
+    # Watch before re-checking so a release between the two can't be missed.
+    watcher = _merge_lock_watcher(lock_path)
+    try:
+        while True:
+            if _try_create_merge_lock(lock_path):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if watcher is None:
+                time.sleep(min(1.0, remaining))
+            else:
+                watcher.read(timeout=int(remaining * 1000) + 1)
+    finally:
+        if watcher is not None:
+            watcher.close()
 
 
 def release_merge_slot(repo_root: Path) -> None:
@@ -151,48 +349,142 @@ def _pending_retries_path(repo_root: Path) -> Path:
     return repo_root / PENDING_MERGE_RETRIES_FILE
 
 
+def _pending_retries_log_path(repo_root: Path) -> Path:
+    return repo_root / PENDING_MERGE_RETRIES_LOG
+
+
+# Parsed pending retries, reused while the snapshot and journal stats are unchanged; appends from this process write through.
+_PENDING_CACHE: dict[str, Any] = {"key": None, "data": None}
+# The merge thread (retry_pending_merges) and the main loop (add_pending_merge_retries) both use the cache and journal.
+_PENDING_LOCK = threading.RLock()
+
+
+def _file_stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _pending_cache_key(repo_root: Path) -> tuple[Any, ...]:
+    return (
+        repo_root,
+        _file_stat_key(_pending_retries_path(repo_root)),
+        _file_stat_key(_pending_retries_log_path(repo_root)),
+    )
+
+
+def _apply_pending_log_entry(pending: dict[str, str], entry: dict[str, str]) -> None:
+    if entry.get("op") == "add":
+        pending[entry["branch"]] = entry["id"]
+    elif entry.get("op") == "del":
+        pending.pop(entry.get("branch"), None)
+
+
 def load_pending_merge_retries(repo_root: Path) -> dict[str, str]:
-    """Returns { branch_name: bead_or_task_id }."""
+    """Returns { branch_name: bead_or_task_id }: the snapshot with the journal replayed on top (a copy; safe to mutate)."""
+    with _PENDING_LOCK:
+        return dict(_load_pending_merge_retries(repo_root))
+
+
+def _load_pending_merge_retries(repo_root: Path) -> dict[str, str]:
+    key = _pending_cache_key(repo_root)
+    if _PENDING_CACHE["key"] == key:
+        return _PENDING_CACHE["data"]
     p = _pending_retries_path(repo_root)
-    if not p.exists():
-        return {}
+    pending: dict[str, str] = {}
+    if key[1] is not None:
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+            pending = data.get("pending", data) if isinstance(data.get("pending"), dict) else {}
+        except (json.JSONDecodeError, OSError):
+            pending = {}
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        return data.get("pending", data) if isinstance(data.get("pending"), dict) else {}
-    except (json.JSONDecodeError, OSError):
-        return {}
+        lines = _pending_retries_log_path(repo_root).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn last line from an interrupted append
+        _apply_pending_log_entry(pending, entry)
+    _PENDING_CACHE.update(key=key, data=pending)
+    return pending
 
 
 def save_pending_merge_retries(repo_root: Path, pending: dict[str, str]) -> None:
-    p = _pending_retries_path(repo_root)
-    p.write_text(json.dumps({"pending": pending}, indent=2), encoding="utf-8")
+    """Write a full snapshot and drop the journal it supersedes."""
+    with _PENDING_LOCK:
+        _atomic_write_json(_pending_retries_path(repo_root), {"pending": pending})
+        _pending_retries_log_path(repo_root).unlink(missing_ok=True)
+        _PENDING_CACHE.update(key=_pending_cache_key(repo_root), data=dict(pending))
 
 
-def _bd_open_id_set(repo_root: Path) -> set[str]:
-    """Set of open bead IDs (for detecting newly created bead)."""
-    beads = bd_list_open_json(repo_root)
-    return {str(b.get("id") or b.get("bead_id") or b.get("hash") or "") for b in beads if b.get("id") or b.get("bead_id") or b.get("hash")}
+def _append_pending_merge_log(repo_root: Path, entries: list[dict[str, str]]) -> None:
+    with _PENDING_LOCK:
+        cached = _PENDING_CACHE["key"] == _pending_cache_key(repo_root)
+        with open(_pending_retries_log_path(repo_root), "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries))
+            size = f.tell()
+        if cached:
+            for e in entries:
+                _apply_pending_log_entry(_PENDING_CACHE["data"], e)
+            _PENDING_CACHE["key"] = _pending_cache_key(repo_root)
+        if size > PENDING_MERGE_LOG_COMPACT_BYTES:
+            save_pending_merge_retries(repo_root, load_pending_merge_retries(repo_root))
 
 
-def bd_is_closed(repo_root: Path, bead_id: str) -> bool:
-    """True if the bead is closed/done."""
-    r = subprocess.run(
-        ["bd", "show", bead_id, "--json"],
+def add_pending_merge_retries(repo_root: Path, pending: dict[str, str]) -> None:
+    """Record { branch_name: bead_or_task_id }: merge each branch again once its id is closed (one journal write)."""
+    _append_pending_merge_log(repo_root, [{"op": "add", "branch": b, "id": i} for b, i in pending.items()])
+
+
+def remove_pending_merge_retries(repo_root: Path, branch_names: list[str]) -> None:
+    _append_pending_merge_log(repo_root, [{"op": "del", "branch": b} for b in branch_names])
+
+
+@lru_cache(maxsize=None)
+def _bd_executable() -> str:
+    """Full path of bd, resolved once rather than searched on PATH for every spawn."""
+    return shutil.which("bd") or "bd"
+
+
+def _run_bd(repo_root: Path, *args: str, timeout: float = 10, capture: bool = True) -> subprocess.CompletedProcess:
+    """Run one bd command in repo_root, capturing its output as text (capture=False discards it)."""
+    if not capture:
+        return subprocess.run([_bd_executable(), *args], cwd=repo_root, timeout=timeout, **_RUN_SILENT)
+    return subprocess.run(
+        [_bd_executable(), *args],
         cwd=repo_root,
         capture_output=True,
         text=True,
-        timeout=10,
+        timeout=timeout,
         **_SUBPROCESS_ENCODING,
     )
+
+
+def _created_bead_id(stdout: str) -> str | None:
+    """ID of the bead printed by `bd create` (JSON object/list, or the first bead-like token in plain output)."""
+    try:
+        data = json.loads(stdout)
+    except (json.JSONDecodeError, TypeError):
+        m = _BEAD_PATTERN.search(stdout or "")
+        return m.group(1) if m else None
+    if isinstance(data, list):
+        data = data[0] if data else {}
+    if not isinstance(data, dict):
+        return None
+    bid = data.get("id") or data.get("bead_id") or data.get("hash")
+    return str(bid) if bid else None
+
+
+def bd_is_closed(repo_root: Path, bead_id: str) -> bool:
+    """True if the bead is closed/done."""
+    r = _run_bd(repo_root, "show", bead_id, "--json", timeout=10)
     if r.returncode != 0:
-        r = subprocess.run(
-            ["bd", "list", "--status", "closed", "--json"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=15,
-            **_SUBPROCESS_ENCODING,
-        )
+        r = _run_bd(repo_root, "list", "--status", "closed", "--json", timeout=15)
         if r.returncode != 0 or not r.stdout.strip():
             return False
         try:
@@ -216,11 +508,12 @@ def bd_is_closed(repo_root: Path, bead_id: str) -> bool:
 
 def task_queue_is_done(repo_root: Path, task_id: str) -> bool:
     """True if the task in task_queue.json is done."""
-    data = load_task_queue(repo_root)
-    for t in data["tasks"]:
-        if t.get("id") == task_id:
-            return (t.get("status") or "").lower() in ("done", "closed")
-    return False
+    _, by_id, _ = _task_queue_index(repo_root)
+    return _task_is_done(by_id.get(task_id))
+
+
+def _task_is_done(task: dict[str, Any] | None) -> bool:
+    return task is not None and (task.get("status") or "").lower() in ("done", "closed")
 
 
 def retry_pending_merges(
@@ -230,16 +523,26 @@ def retry_pending_merges(
     base_branch: str,
     beads_mode: bool,
     use_merge_slot: bool,
+    use_merge_tree: bool = True,
 ) -> None:
     """Check pending conflict-resolution tasks; if any are closed, retry merging that branch (Gas Town-style auto-retry)."""
     pending = load_pending_merge_retries(repo_root)
     if not pending:
         return
     # Match branch name to worktree: ozon-w3 -> index 2
-    branch_re = re.compile(re.escape(prefix) + r"(\d+)$")
+    branch_re = _BRANCH_RE_CACHE.get(prefix)
+    if branch_re is None:
+        branch_re = _BRANCH_RE_CACHE[prefix] = re.compile(re.escape(prefix) + r"(\d+)$")
+    items = list(pending.items())
+    if beads_mode:
+        # Each bd_is_closed is its own bd process; probe all beads at once, merges below stay serialized.
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+            closed = list(pool.map(lambda item: bd_is_closed(repo_root, item[1]), items))
+    else:
+        _, by_id, _ = _task_queue_index(repo_root)  # one queue lookup for all branches
+        closed = [_task_is_done(by_id.get(task_id)) for _, task_id in items]
     to_remove: list[str] = []
-    for branch_name, task_or_bead_id in list(pending.items()):
-        is_closed = bd_is_closed(repo_root, task_or_bead_id) if beads_mode else task_queue_is_done(repo_root, task_or_bead_id)
+    for (branch_name, _), is_closed in zip(items, closed):
         if not is_closed:
             continue
         m = branch_re.match(branch_name)
@@ -254,17 +557,15 @@ def retry_pending_merges(
         if use_merge_slot and not acquire_merge_slot(repo_root, timeout_secs=30):
             continue
         try:
-            ok, _ = merge_worktree_into_main(repo_root, worktree_path, branch_name, base_branch)
+            ok, _ = merge_worktree_into_main(repo_root, worktree_path, branch_name, base_branch, use_merge_tree)
             if ok:
                 to_remove.append(branch_name)
-                print(f"[merge] retried and merged {branch_name} -> {base_branch} (conflict was resolved)", flush=True)
+                log.info("[merge] retried and merged %s -> %s (conflict was resolved)", branch_name, base_branch)
         finally:
             if use_merge_slot:
                 release_merge_slot(repo_root)
-    for branch_name in to_remove:
-        pending.pop(branch_name, None)
     if to_remove:
-        save_pending_merge_retries(repo_root, pending)
+        remove_pending_merge_retries(repo_root, to_remove)
 
 
 def seed_task_queue_if_missing(repo_root: Path) -> None:
@@ -282,12 +583,10 @@ def seed_task_queue_if_missing(repo_root: Path) -> None:
 
 def _parse_bd_bead_lines(stdout: str) -> list[dict[str, Any]]:
     """Parse bd output for bead IDs (e.g. ozon-4id, bd-1a2b3)."""
-    bead_pattern = re.compile(r"\b([a-z]+-[a-zA-Z0-9]+)\b")
     seen = set()
     beads = []
     for line in (stdout or "").splitlines():
-        for m in bead_pattern.finditer(line):
-            bid = m.group(1)
+        for bid in _BEAD_PATTERN.findall(line):
             if bid not in seen and "-" in bid:
                 seen.add(bid)
                 beads.append({"id": bid, "title": line.strip() or bid})
@@ -317,13 +616,13 @@ def _beads_from_list(data: Any) -> list[dict[str, Any]]:
 def bd_list_status_json(repo_root: Path, status: str) -> list[dict[str, Any]]:
     """Return beads for a specific status from bd list; fail-safe on timeout/errors."""
     for args in (
-        ["bd", "list", "--status", status, "--json"],
-        ["bd", "list", "--json"],
-        ["bd", "list", "--status", status],
-        ["bd", "list"],
+        ["list", "--status", status, "--json"],
+        ["list", "--json"],
+        ["list", "--status", status],
+        ["list"],
     ):
         try:
-            r = subprocess.run(args, cwd=repo_root, capture_output=True, text=True, timeout=30, **_SUBPROCESS_ENCODING)
+            r = _run_bd(repo_root, *args, timeout=30)
         except (subprocess.TimeoutExpired, FileNotFoundError):
             continue
         if r.returncode != 0:
@@ -334,7 +633,7 @@ def bd_list_status_json(repo_root: Path, status: str) -> list[dict[str, Any]]:
         try:
             data = json.loads(raw)
             beads = _beads_from_list(data)
-            if args[1:3] == ["list", "--json"]:
+            if args == ["list", "--json"]:
                 beads = [b for b in beads if (str((next((x for x in (data if isinstance(data, list) else data.get("issues", [])) if isinstance(x, dict) and str(x.get("id") or x.get("hash") or x.get("key")) == b["id"]), {}) ).get("status", "")).lower() == status.lower())]
             if beads:
                 return beads
@@ -345,35 +644,40 @@ def bd_list_status_json(repo_root: Path, status: str) -> list[dict[str, Any]]:
     return []
 
 
+def _bd_cached(repo_root: Path, name: str, fetch) -> list[dict[str, Any]]:
+    hit = _BD_CACHE.get(name)
+    now = time.monotonic()
+    if hit is not None:
+        age = now - hit[0]
+        if age < _BD_TTL:
+            return hit[2]
+        if age < _BD_STABLE_TTL and task_state_signature(repo_root, True) == hit[1]:
+            return hit[2]
+    signature = task_state_signature(repo_root, True)  # taken before the query, so a write during it invalidates
+    beads = fetch()
+    _BD_CACHE[name] = (now, signature, beads)
+    return beads
+
+
 def bd_list_open_json(repo_root: Path) -> list[dict[str, Any]]:
     """Return open beads (no dependency check). Used when bd ready is empty."""
-    return bd_list_status_json(repo_root, "open")
+    return _bd_cached(repo_root, "open", lambda: bd_list_status_json(repo_root, "open"))
 
 
 def bd_ready_json(repo_root: Path) -> list[dict[str, Any]]:
     """Return list of ready beads from `bd ready --json`. Fallback to parsing `bd ready` lines."""
+    return _bd_cached(repo_root, "ready", lambda: _bd_ready_uncached(repo_root))
+
+
+def _bd_ready_uncached(repo_root: Path) -> list[dict[str, Any]]:
     try:
-        r = subprocess.run(
-            ["bd", "ready", "--json"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            **_SUBPROCESS_ENCODING,
-        )
+        r = _run_bd(repo_root, "ready", "--json", timeout=30)
         if r.returncode == 0 and r.stdout.strip():
             return json.loads(r.stdout)
     except (json.JSONDecodeError, subprocess.TimeoutExpired, FileNotFoundError):
         pass
     try:
-        r = subprocess.run(
-            ["bd", "ready"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            **_SUBPROCESS_ENCODING,
-        )
+        r = _run_bd(repo_root, "ready", timeout=30)
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return []
     if r.returncode != 0:
@@ -383,62 +687,56 @@ def bd_ready_json(repo_root: Path) -> list[dict[str, Any]]:
 
 def bd_show(repo_root: Path, bead_id: str) -> str:
     """Return full bead description for task file."""
-    r = subprocess.run(
-        ["bd", "show", bead_id],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
+    r = _run_bd(repo_root, "show", bead_id, timeout=10)
     if r.returncode != 0:
         return f"Task: {bead_id}\n( Run bd show {bead_id} in repo for details. )"
     return r.stdout or f"Task: {bead_id}"
 
 
 def bd_claim(repo_root: Path, bead_id: str) -> bool:
-    """Mark bead in_progress (claim)."""
-    r = subprocess.run(
-        ["bd", "update", bead_id, "--status", "in_progress"],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
+    """Mark bead in_progress (claim). Leaves _BD_CACHE alone: the dispatcher skips beads it has assigned anyway."""
+    r = _run_bd(repo_root, "update", bead_id, "--status", "in_progress", timeout=10, capture=False)
     return r.returncode == 0
 
 
+def bd_claim_many(repo_root: Path, bead_ids: list[str]) -> set[str]:
+    """Claim several beads with one `bd update id1 id2 ...`; if that fails, claim one by one to find which succeed."""
+    if len(bead_ids) > 1:
+        r = _run_bd(repo_root, "update", *bead_ids, "--status", "in_progress", timeout=30, capture=False)
+        if r.returncode == 0:
+            return set(bead_ids)
+    return {bid for bid in bead_ids if bd_claim(repo_root, bid)}
+
+
 def bd_reopen(repo_root: Path, bead_id: str) -> bool:
     """Re-open bead for retry."""
-    r = subprocess.run(
-        ["bd", "update", bead_id, "--status", "open"],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
+    _BD_CACHE.clear()
+    r = _run_bd(repo_root, "update", bead_id, "--status", "open", timeout=10, capture=False)
     return r.returncode == 0
 
 
 def bd_close(repo_root: Path, bead_id: str) -> bool:
     """Close bead quickly; sync is done periodically in main loop."""
-    r = subprocess.run(
-        ["bd", "close", bead_id],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
+    _BD_CACHE.clear()
+    r = _run_bd(repo_root, "close", bead_id, timeout=10, capture=False)
     return r.returncode == 0
 
 
 def bd_sync(repo_root: Path) -> None:
     """Best-effort periodic sync to avoid blocking task-close path."""
-    subprocess.run(
-        ["bd", "sync"],
-        cwd=repo_root,
+    _run_bd(repo_root, "sync", timeout=30, capture=False)
+
+
+def _git(cwd: Path, *args: str, timeout: float = 10, capture: bool = True) -> subprocess.CompletedProcess:
+    """Run one git command in cwd, capturing its output as text (capture=False discards it). Every call has a timeout."""
+    if not capture:
+        return subprocess.run(["git", *args], cwd=cwd, timeout=timeout, **_RUN_SILENT)
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
         capture_output=True,
-        timeout=30,
+        text=True,
+        timeout=timeout,
         **_SUBPROCESS_ENCODING,
     )
 
@@ -449,13 +747,15 @@ def write_task_file(worktree_root: Path, content: str) -> None:
 
 def prune_stale_worktrees(repo_root: Path) -> None:
     """Remove registered worktrees whose directories are missing (e.g. after Remove-Item worktrees)."""
-    subprocess.run(
-        ["git", "worktree", "prune"],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=15,
-        **_SUBPROCESS_ENCODING,
-    )
+    _git(repo_root, "worktree", "prune", timeout=15, capture=False)
+
+
+def list_local_branches(repo_root: Path) -> set[str] | None:
+    """Names of all local branches in one git call, or None if git fails."""
+    r = _git(repo_root, "for-each-ref", "--format=%(refname:short)", "refs/heads/")
+    if r.returncode != 0:
+        return None
+    return {line.strip() for line in (r.stdout or "").splitlines() if line.strip()}
 
 
 def ensure_worktree(
@@ -463,58 +763,32 @@ def ensure_worktree(
     worktree_path: Path,
     worktree_branch: str,
     base_branch: str = "main",
+    existing_branches: set[str] | None = None,
 ) -> bool:
-    """Create worktree if it doesn't exist. Uses a dedicated branch per worktree so main isn't checked out twice."""
+    """Create worktree if it doesn't exist. Uses a dedicated branch per worktree so main isn't checked out twice.
+
+    existing_branches (from list_local_branches) says up front whether the branch must be created.
+    """
     if worktree_path.exists():
         # The directory can exist with stale/broken .git metadata (e.g. after prune/manual deletion).
         # Validate it's an actual git worktree before reusing it.
-        chk = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=worktree_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-            **_SUBPROCESS_ENCODING,
-        )
+        chk = _git(worktree_path, "rev-parse", "--is-inside-work-tree", timeout=5)
         if chk.returncode == 0 and (chk.stdout or "").strip().lower() == "true":
             return True
-        print(f"[worktree] stale folder detected, recreating: {worktree_path}", flush=True)
+        log.info("[worktree] stale folder detected, recreating: %s", worktree_path)
         try:
             shutil.rmtree(worktree_path)
         except OSError as e:
             print(f"[worktree] failed to remove stale folder {worktree_path}: {e}", file=sys.stderr)
             return False
-    # Ensure the worktree branch exists (create from base_branch if not)
-    r = subprocess.run(
-        ["git", "rev-parse", "--verify", worktree_branch],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
-    if r.returncode != 0:
-        r2 = subprocess.run(
-            ["git", "branch", worktree_branch, base_branch],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=10,
-            **_SUBPROCESS_ENCODING,
-        )
-        if r2.returncode != 0:
-            err = (r2.stderr or r2.stdout or "").strip()
-            if err:
-                print(err, file=sys.stderr)
-            return False
-    r = subprocess.run(
-        ["git", "worktree", "add", str(worktree_path), worktree_branch],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=30,
-        **_SUBPROCESS_ENCODING,
-    )
+    # One `git worktree add -b` creates the branch from base_branch and checks it out; reuse the branch if it already exists.
+    if existing_branches is not None and worktree_branch in existing_branches:
+        add_args = [str(worktree_path), worktree_branch]
+    else:
+        add_args = ["-b", worktree_branch, str(worktree_path), base_branch]
+    r = _git(repo_root, "worktree", "add", *add_args, timeout=30)
+    if r.returncode != 0 and add_args[0] == "-b" and "already exists" in (r.stderr or ""):
+        r = _git(repo_root, "worktree", "add", str(worktree_path), worktree_branch, timeout=30)
     if r.returncode != 0:
         err = (r.stderr or r.stdout or "").strip()
         if err:
@@ -522,6 +796,147 @@ def ensure_worktree(
     return r.returncode == 0
 
 
+# Read end of the SIGCHLD wakeup pipe when open_exit_poller falls back to it; workers are then not watched one by one.
+_SIGCHLD_FD: int | None = None
+
+
+def _open_sigchld_pipe() -> int:
+    """Pipe that gets a byte on every SIGCHLD (any child, git/bd included, so wakeups may be spurious). Main thread only."""
+    r, w = os.pipe()
+    os.set_blocking(r, False)
+    os.set_blocking(w, False)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)  # set_wakeup_fd only fires for handled signals
+    signal.set_wakeup_fd(w)
+    return r
+
+
+def open_exit_poller():
+    """Poller that wakes when a worker exits: select.epoll over pidfds (Linux 5.3+), select.kqueue with
+    EVFILT_PROC (macOS/BSD), select.epoll over a SIGCHLD wakeup pipe (older Linux kernels / Python < 3.9),
+    or None where none of these exist (Windows)."""
+    global _SIGCHLD_FD
+    if hasattr(os, "pidfd_open") and hasattr(select, "epoll"):
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+        except OSError:
+            pass  # ENOSYS: kernel without pidfd support
+        else:
+            return select.epoll()
+    if hasattr(select, "kqueue"):
+        return select.kqueue()
+    if hasattr(select, "epoll") and hasattr(signal, "SIGCHLD"):
+        _SIGCHLD_FD = _open_sigchld_pipe()
+        poller = select.epoll()
+        poller.register(_SIGCHLD_FD, select.EPOLLIN)
+        return poller
+    return None
+
+
+def watch_worker_exit(poller, proc: subprocess.Popen) -> int | None:
+    """Register proc with poller; returns a handle for unwatch_worker_exit, or None if proc can't be watched
+    (the worker already exited) and has to be polled instead."""
+    if poller is None:
+        return None
+    if _SIGCHLD_FD is not None:
+        return -1  # every child exit already wakes the poller
+    if hasattr(select, "kqueue") and isinstance(poller, select.kqueue):
+        ev = select.kevent(
+            proc.pid,
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT,
+        )
+        try:
+            poller.control([ev], 0, 0)
+        except OSError:
+            return None
+        return proc.pid
+    try:
+        fd = os.pidfd_open(proc.pid)
+    except OSError:
+        return None
+    poller.register(fd, select.EPOLLIN)
+    return fd
+
+
+def unwatch_worker_exit(poller, handle: int | None) -> None:
+    """Release a handle from watch_worker_exit once its worker is reaped (kqueue drops exited pids itself)."""
+    if handle is None or _SIGCHLD_FD is not None:
+        return
+    if not (hasattr(select, "kqueue") and isinstance(poller, select.kqueue)):
+        os.close(handle)  # also drops it from the epoll set
+
+
+def wait_worker_exit(poller, timeout: float) -> None:
+    """Block until a watched worker exits or timeout seconds pass."""
+    if hasattr(select, "kqueue") and isinstance(poller, select.kqueue):
+        poller.control(None, 64, timeout)
+        return
+    poller.poll(timeout)
+    if _SIGCHLD_FD is not None:
+        try:
+            while os.read(_SIGCHLD_FD, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def signal_worker_tree(proc: subprocess.Popen, force: bool = False) -> None:
+    """SIGTERM (force: SIGKILL) the worker's whole process group. Windows: `taskkill /T /F` on its process tree."""
+    if sys.platform == "win32":
+        subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(proc.pid)], **_RUN_SILENT, creationflags=_WORKER_CREATIONFLAGS
+        )
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass  # the whole group has already exited
+
+
+def report_job_failure(what: str):
+    """Done-callback for a merge_pool job whose result is never collected: report the exception it raised."""
+
+    def callback(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            e = future.exception()
+            print(f"[merge] {what} failed: {type(e).__name__}: {e}", file=sys.stderr)
+
+    return callback
+
+
+# Signals that stop the dispatcher; SIGHUP is a closed terminal or dropped SSH session (POSIX only).
+_STOP_SIGNALS = tuple(getattr(signal, name) for name in ("SIGINT", "SIGTERM", "SIGHUP") if hasattr(signal, name))
+
+
+def _raise_keyboard_interrupt(signum: int, frame: Any) -> None:
+    # Only the first signal interrupts: a second Ctrl+C (or SIGHUP followed by SIGTERM) must not cut short
+    # the shutdown that stops the workers, which is bounded anyway (grace period, then SIGKILL).
+    for sig in _STOP_SIGNALS:
+        signal.signal(sig, signal.SIG_IGN)
+    raise KeyboardInterrupt
+
+
+def stop_on_termination_signals() -> None:
+    """Handle SIGTERM and SIGHUP like Ctrl+C. Workers lead their own sessions, so these no longer reach them:
+    the dispatcher has to survive long enough to stop their process groups."""
+    for sig in _STOP_SIGNALS:
+        signal.signal(sig, _raise_keyboard_interrupt)
+
+
+def terminate_worker(proc: subprocess.Popen, grace_secs: float = 10) -> None:
+    """Ask proc (and its process group) to exit; a background thread kills the group if proc outlives grace_secs."""
+    signal_worker_tree(proc)
+
+    def kill_after_grace() -> None:
+        try:
+            proc.wait(timeout=grace_secs)
+        except subprocess.TimeoutExpired:
+            signal_worker_tree(proc, force=True)
+
+    threading.Thread(target=kill_after_grace, name=f"kill-{proc.pid}", daemon=True).start()
+
+
 def run_worker(
     worktree_root: Path,
     task_content: str,
@@ -537,7 +952,6 @@ def run_worker(
     env = os.environ.copy()
     if sys.platform == "win32":
         env.setdefault("PYTHONIOENCODING", "utf-8")
-        env["_DISPATCH_CWD"] = str(worktree_root)
 
     if backend == "claude":
         return _run_worker_claude(worktree_root, task_content, worker_cmd, model, env)
@@ -559,26 +973,16 @@ def _run_worker_aider(
         "--yes",
         "--no-show-model-warnings",
     ]
-    if _USE_WRAPPER_WIN:
-        real_cmd = aider_args
-        wrapper_code = (
-            "import subprocess,sys,os; "
-            "i=sys.argv.index('--'); "
-            "r=subprocess.run(sys.argv[i+1:], cwd=os.environ.get('_DISPATCH_CWD','.'), "
-            "stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL); "
-            "sys.exit(r.returncode)"
-        )
-        cmd = [sys.executable, "-c", wrapper_code, "--"] + real_cmd
-    else:
-        cmd = aider_args
-
     return subprocess.Popen(
-        cmd,
-        cwd=worktree_root if not _USE_WRAPPER_WIN else None,
+        aider_args,
+        cwd=worktree_root,
         stdin=subprocess.DEVNULL,
-        stdout=_NULL_DEV,
-        stderr=_NULL_DEV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         env=env,
+        close_fds=_WORKER_CLOSE_FDS,
+        start_new_session=_WORKER_NEW_SESSION,
+        creationflags=_WORKER_CREATIONFLAGS,
     )
 
 
@@ -596,33 +1000,16 @@ def _run_worker_claude(
         "--model", model,
         "--dangerously-skip-permissions",
     ]
-    if _USE_WRAPPER_WIN:
-        wrapper_code = (
-            "import subprocess,sys,os; "
-            "i=sys.argv.index('--'); "
-            "r=subprocess.run(sys.argv[i+1:], cwd=os.environ.get('_DISPATCH_CWD','.'), "
-            "input=os.environ.get('_DISPATCH_PROMPT',''), text=True, "
-            "stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL); "
-            "sys.exit(r.returncode)"
-        )
-        env["_DISPATCH_PROMPT"] = task_content
-        cmd = [sys.executable, "-c", wrapper_code, "--"] + claude_args
-        return subprocess.Popen(
-            cmd,
-            cwd=None,
-            stdin=subprocess.DEVNULL,
-            stdout=_NULL_DEV,
-            stderr=_NULL_DEV,
-            env=env,
-        )
-
     proc = subprocess.Popen(
         claude_args,
         cwd=worktree_root,
         stdin=subprocess.PIPE,
-        stdout=_NULL_DEV,
-        stderr=_NULL_DEV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         env=env,
+        close_fds=_WORKER_CLOSE_FDS,
+        start_new_session=_WORKER_NEW_SESSION,
+        creationflags=_WORKER_CREATIONFLAGS,
     )
     try:
         proc.stdin.write(task_content.encode("utf-8"))
@@ -632,122 +1019,131 @@ def _run_worker_claude(
     return proc
 
 
+# Conflicts only in these files are resolved automatically by the checkout-based merge.
+_TRIVIAL_CONFLICT_FILES = frozenset({TASK_FILE, SUGGESTED_FILE, ".gitignore"})
+
+
+def _merge_via_merge_tree(repo_root: Path, branch_name: str, base_branch: str) -> tuple[bool, str | None] | None:
+    """Merge branch_name into base_branch in the object database (`git merge-tree --write-tree`, git >= 2.38).
+
+    repo_root's working tree is only touched if it has base_branch checked out, and then only by a fast-forward.
+    Returns None when the checkout-based merge should run instead (older git, unrelated histories,
+    or conflicts confined to dispatcher files).
+    """
+    r = _git(repo_root, "rev-parse", base_branch, branch_name, "--symbolic-full-name", "HEAD", timeout=10)
+    out = (r.stdout or "").split()
+    if r.returncode != 0 or len(out) != 3:
+        return None
+    base_oid, branch_oid, head_ref = out
+    r = _git(repo_root, "merge-base", base_oid, branch_oid, timeout=10)
+    merge_base = (r.stdout or "").strip() if r.returncode == 0 else ""
+    if merge_base == branch_oid:
+        return True, None  # already merged
+    if merge_base == base_oid:
+        new_oid = branch_oid  # fast-forward, as `git merge` would
+    else:
+        r = _git(repo_root, "merge-tree", "--write-tree", "--name-only", base_oid, branch_oid, timeout=60)
+        if r.returncode == 1:
+            # stdout: tree id, conflicted file names, blank line, merge messages
+            lines = (r.stdout or "").splitlines()
+            blank = lines.index("") if "" in lines else len(lines)
+            conflict_files = {f.strip() for f in lines[1:blank] if f.strip()}
+            if conflict_files and conflict_files <= _TRIVIAL_CONFLICT_FILES:
+                return None
+            msg = "\n".join(lines[blank + 1:]).strip() or "\n".join(sorted(conflict_files)) or branch_name
+            print(f"[merge] merge {branch_name} failed (conflict?): {msg}", file=sys.stderr)
+            return False, msg
+        if r.returncode != 0:
+            return None
+        tree = r.stdout.splitlines()[0].strip()
+        r = _git(repo_root, "commit-tree", tree, "-p", base_oid, "-p", branch_oid, "-m", f"Merge {branch_name} (dispatcher)", timeout=10)
+        if r.returncode != 0:
+            return None
+        new_oid = r.stdout.strip()
+    if head_ref == f"refs/heads/{base_branch}":
+        r = _git(repo_root, "merge", "--ff-only", new_oid, timeout=60)
+    else:
+        r = _git(repo_root, "update-ref", f"refs/heads/{base_branch}", new_oid, base_oid, timeout=10)
+    if r.returncode != 0:
+        msg = (r.stderr or r.stdout or "").strip() or branch_name
+        print(f"[merge] updating {base_branch} failed: {msg}", file=sys.stderr)
+        return False, msg
+    return True, None
+
+
 def merge_worktree_into_main(
     repo_root: Path,
     worktree_path: Path,
     branch_name: str,
     base_branch: str = "main",
+    use_merge_tree: bool = True,
 ) -> tuple[bool, str | None]:
     """Merge the worktree's branch into base_branch, then reset worktree to base for next task.
-    Returns (True, None) on success, (False, error_message) on failure."""
+    Returns (True, None) on success, (False, error_message) on failure.
+
+    use_merge_tree: merge without checking out base_branch in repo_root (see _merge_via_merge_tree);
+    falls back to checkout + `git merge` when that is not possible.
+    """
     # Commit any uncommitted changes in the worktree so we don't lose them
-    r = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        timeout=5,
-        **_SUBPROCESS_ENCODING,
-    )
+    r = _git(worktree_path, "status", "--porcelain", timeout=5)
     if r.returncode == 0 and (r.stdout or "").strip():
-        subprocess.run(["git", "add", "-A"], cwd=worktree_path, capture_output=True, timeout=10)
+        _git(worktree_path, "add", "-A", capture=False)
         # Don't commit dispatcher-only files (avoid add/add conflicts when merging into main)
-        subprocess.run(
-            ["git", "reset", "HEAD", TASK_FILE, SUGGESTED_FILE],
-            cwd=worktree_path,
-            capture_output=True,
-            timeout=5,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", f"Dispatcher: capture work ({branch_name})"],
-            cwd=worktree_path,
-            capture_output=True,
-            timeout=10,
-            **_SUBPROCESS_ENCODING,
-        )
+        _git(worktree_path, "reset", "HEAD", TASK_FILE, SUGGESTED_FILE, timeout=5, capture=False)
+        _git(worktree_path, "commit", "-m", f"Dispatcher: capture work ({branch_name})", capture=False)
+    else:
+        # Nothing uncommitted: if the worker made no commits either, there is nothing to merge.
+        r = _git(repo_root, "rev-list", "--count", f"{base_branch}..{branch_name}", timeout=5)
+        if r.returncode == 0 and (r.stdout or "").strip() == "0":
+            _reset_worktree_to_base(worktree_path, base_branch)
+            return True, None
+    if use_merge_tree:
+        result = _merge_via_merge_tree(repo_root, branch_name, base_branch)
+        if result is not None:
+            if result[0]:
+                _reset_worktree_to_base(worktree_path, base_branch)
+            return result
     # Checkout base and merge
-    r = subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=15,
-        **_SUBPROCESS_ENCODING,
-    )
+    r = _git(repo_root, "checkout", base_branch, timeout=15)
     if r.returncode != 0:
         msg = (r.stderr or r.stdout or "").strip()
         print(f"[merge] git checkout {base_branch} failed: {msg}", file=sys.stderr)
         return False, msg
-    r = subprocess.run(
-        ["git", "merge", branch_name, "-m", f"Merge {branch_name} (dispatcher)"],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=60,
-        **_SUBPROCESS_ENCODING,
-    )
+    r = _git(repo_root, "merge", branch_name, "-m", f"Merge {branch_name} (dispatcher)", timeout=60)
     if r.returncode != 0:
         # Try to resolve trivial conflicts (dispatcher-only files that we don't want in main)
         conflict_files = set()
-        r2 = subprocess.run(
-            ["git", "diff", "--name-only", "--diff-filter=U"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-            **_SUBPROCESS_ENCODING,
-        )
+        r2 = _git(repo_root, "diff", "--name-only", "--diff-filter=U", timeout=5)
         if r2.returncode == 0 and r2.stdout:
             conflict_files = {f.strip() for f in r2.stdout.splitlines() if f.strip()}
-        trivial = {TASK_FILE, SUGGESTED_FILE, ".gitignore"}
-        if conflict_files and conflict_files <= trivial:
+        if conflict_files and conflict_files <= _TRIVIAL_CONFLICT_FILES:
             # Resolve: drop .current_task.txt and suggested_tasks.txt from merge; keep main's .gitignore
             for f in (TASK_FILE, SUGGESTED_FILE):
                 if f in conflict_files:
-                    subprocess.run(["git", "rm", "-f", f], cwd=repo_root, capture_output=True, timeout=5)
+                    _git(repo_root, "rm", "-f", f, timeout=5, capture=False)
             if ".gitignore" in conflict_files:
-                subprocess.run(["git", "checkout", "--ours", ".gitignore"], cwd=repo_root, capture_output=True, timeout=5)
-                subprocess.run(["git", "add", ".gitignore"], cwd=repo_root, capture_output=True, timeout=5)
-            subprocess.run(["git", "add", "-A"], cwd=repo_root, capture_output=True, timeout=5)
-            r3 = subprocess.run(
-                ["git", "commit", "-m", f"Merge {branch_name} (dispatcher, resolve trivial conflicts)"],
-                cwd=repo_root,
-                capture_output=True,
-                timeout=10,
-                **_SUBPROCESS_ENCODING,
-            )
+                _git(repo_root, "checkout", "--ours", ".gitignore", timeout=5, capture=False)
+                _git(repo_root, "add", ".gitignore", timeout=5, capture=False)
+            _git(repo_root, "add", "-A", timeout=5, capture=False)
+            r3 = _git(repo_root, "commit", "-m", f"Merge {branch_name} (dispatcher, resolve trivial conflicts)", capture=False)
             if r3.returncode == 0:
                 # Merge completed; reset worktree and return success
-                subprocess.run(
-                    ["git", "reset", "--hard", base_branch],
-                    cwd=worktree_path,
-                    capture_output=True,
-                    timeout=10,
-                    **_SUBPROCESS_ENCODING,
-                )
-                print(f"[merge] resolved trivial conflicts ({branch_name}) -> {base_branch}", flush=True)
+                _git(worktree_path, "reset", "--hard", base_branch, capture=False)
+                log.info("[merge] resolved trivial conflicts (%s) -> %s", branch_name, base_branch)
                 return True, None
-        subprocess.run(
-            ["git", "merge", "--abort"],
-            cwd=repo_root,
-            capture_output=True,
-            timeout=10,
-        )
+        _git(repo_root, "merge", "--abort", capture=False)
         msg = (r.stderr or r.stdout or "").strip() or branch_name
         print(f"[merge] merge {branch_name} failed (conflict?): {msg}", file=sys.stderr)
         return False, msg
-    # Reset worktree to base so next task starts clean
-    r = subprocess.run(
-        ["git", "reset", "--hard", base_branch],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        timeout=10,
-        **_SUBPROCESS_ENCODING,
-    )
+    _reset_worktree_to_base(worktree_path, base_branch)
+    return True, None
+
+
+def _reset_worktree_to_base(worktree_path: Path, base_branch: str) -> None:
+    """Reset worktree to base so next task starts clean."""
+    r = _git(worktree_path, "reset", "--hard", base_branch)
     if r.returncode != 0:
         print(f"[merge] reset worktree failed: {r.stderr or r.stdout}", file=sys.stderr)
-    return True, None
 
 
 def create_merge_conflict_task(
@@ -766,37 +1162,31 @@ def create_merge_conflict_task(
         f"Git output:\n{detail[:1500]}"
     )
     if beads_mode:
-        before_ids = _bd_open_id_set(repo_root)
-        subprocess.run(
-            ["bd", "create", title, "--description", description],
-            cwd=repo_root,
-            capture_output=True,
-            timeout=15,
-            **_SUBPROCESS_ENCODING,
-        )
-        after_ids = _bd_open_id_set(repo_root)
-        new_id = next(iter(after_ids - before_ids), None)
-        print(f"[merge] created bead for resolving conflict: {branch_name}", flush=True)
+        _BD_CACHE.clear()
+        r = _run_bd(repo_root, "create", title, "--description", description, "--json", timeout=15)
+        if r.returncode != 0 and "--json" in (r.stderr or ""):
+            # bd without --json on create ("unknown flag: --json"): take the ID from its plain output.
+            r = _run_bd(repo_root, "create", title, "--description", description, timeout=15)
+        new_id = _created_bead_id(r.stdout) if r.returncode == 0 else None
+        log.info("[merge] created bead for resolving conflict: %s", branch_name)
         return new_id
-    path = task_queue_path(repo_root)
-    if path.exists():
-        data = json.loads(path.read_text(encoding="utf-8"))
-    else:
-        data = {"tasks": [], "next_id": 1}
-    task_id = f"task-{data['next_id']}"
-    data["tasks"].append({
-        "id": task_id,
-        "title": title,
-        "status": "pending",
-        "description": description,
-    })
-    data["next_id"] += 1
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"[merge] added to task_queue.json: {title}", flush=True)
+    with _TQ_LOCK:
+        data = load_task_queue(repo_root)
+        task_id = f"task-{data['next_id']}"
+        data["tasks"].append({
+            "id": task_id,
+            "title": title,
+            "status": "pending",
+            "description": description,
+        })
+        data["next_id"] += 1
+        save_task_queue(repo_root, data)
+    log.info("[merge] added to task_queue.json: %s", title)
     return task_id
 
 
 def main() -> int:
+    start_status_log()
     config_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CONFIG_PATH
     if not config_path.exists():
         print("Config not found:", config_path, file=sys.stderr)
@@ -824,9 +1214,14 @@ def main() -> int:
     else:
         parent = repo_root.parent
         worktree_roots = [parent / f"{prefix}{i}" for i in range(1, num_workers + 1)]
+    # Per-slot names, built once: worktree branch (ozon-w3) and log tag ([w3]).
+    slot_branches = [f"{prefix}{i}" for i in range(1, num_workers + 1)]
+    slot_tags = [f"[w{i}]" for i in range(1, num_workers + 1)]
     base_branch = config.get("branch", "main")
     auto_merge_worktrees = config.get("auto_merge_worktrees", True)
     use_merge_slot = config.get("merge_slot", True)
+    # Merge with `git merge-tree` (no checkout in repo_root); false = always checkout base + `git merge`.
+    use_merge_tree = bool(config.get("merge_tree", True))
     auto_retry_merge_on_conflict_close = config.get("auto_retry_merge_on_conflict_close", True)
     worker_timeout_secs = int(config.get("worker_timeout_secs", 1800) or 0)  # default 30 min; 0 = no timeout
     max_worker_retries = int(config.get("max_worker_retries", 2) or 0)
@@ -838,41 +1233,79 @@ def main() -> int:
     # Prune stale worktrees so we can recreate if user deleted worktrees/ with Remove-Item
     prune_stale_worktrees(repo_root)
     # Each worktree gets its own branch (worker-w1, worker-w2, ...) so we don't check out main twice
-    for i, wt in enumerate(worktree_roots, start=1):
-        worktree_branch = f"{prefix}{i}"
-        if not ensure_worktree(repo_root, wt, worktree_branch=worktree_branch, base_branch=base_branch):
-            print("Failed to create worktree:", wt, file=sys.stderr)
-            return 1
+    existing_branches = list_local_branches(repo_root)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(ensure_worktree, repo_root, wt, branch, base_branch, existing_branches)
+            for wt, branch in zip(worktree_roots, slot_branches)
+        ]
+        created = [f.result() for f in futures]
+    failed = [wt for wt, ok in zip(worktree_roots, created) if not ok]
+    for wt in failed:
+        print("Failed to create worktree:", wt, file=sys.stderr)
+    if failed:
+        return 1
 
-    slots: list[dict[str, Any] | None] = [None] * num_workers
+    # Slot state as parallel lists indexed by slot; slot_proc[i] is None while slot i is idle (or merging).
+    slot_proc: list[subprocess.Popen | None] = [None] * num_workers
+    slot_bead_id: list[str] = [""] * num_workers
+    slot_title: list[str] = [""] * num_workers
+    slot_exit_watch: list[int | None] = [None] * num_workers
+    slot_generation: list[int] = [-1] * num_workers  # bumped per start; matches live timeout_heap entries
+    slot_timed_out: list[bool] = [False] * num_workers
+    # Linux/macOS/BSD: block until a worker exits between polls instead of sleeping poll_interval_secs.
+    exit_poller = open_exit_poller()
     assigned_beads: set[str] = set()
     retry_counts: dict[str, int] = {}
-    retry_queue: list[dict[str, Any]] = []
+    retry_queue: deque[dict[str, Any]] = deque()
+    # Unassigned beads from the last bd ready/list query, handed out in order until empty or older than _BD_TTL.
+    ready_queue: deque[dict[str, Any]] = deque()
+    ready_fetched_at = 0.0
+    # Conflict retries collected by finish_merge, journaled once per loop iteration.
+    new_pending_retries: dict[str, str] = {}
+    # One thread, so merges (and the other jobs that touch repo_root's checkout) run one at a time, in order.
+    merge_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merge")
+    merging: dict[int, Future] = {}  # slot index -> merge of its worktree branch, in flight
+    # (deadline, generation, slot index) per started worker; entries whose slot has moved on to a newer
+    # generation are stale and skipped when they reach the top.
+    timeout_heap: list[tuple[float, int, int]] = []
+    assignment_seq = itertools.count()
+
+    def timeout_entry_is_live(entry: tuple[float, int, int]) -> bool:
+        return slot_proc[entry[2]] is not None and slot_generation[entry[2]] == entry[1]
+
+    def refill_ready_queue() -> None:
+        nonlocal ready_fetched_at
+        ready_queue.clear()
+        beads = bd_ready_json(repo_root)
+        if not beads:
+            beads = bd_list_open_json(repo_root)  # fallback: open issues when none are "ready" (e.g. all have blocking deps)
+        ready_fetched_at = time.monotonic()
+        for b in beads:
+            bid = b.get("id") or b.get("bead_id") or b.get("hash") or (b if isinstance(b, str) else None)
+            if not bid:
+                continue
+            if isinstance(b, dict):
+                bid = str(bid)
+            if bid not in assigned_beads:
+                ready_queue.append({"id": bid, "title": b.get("title", bid)})
 
     def get_next_ready_bead() -> dict[str, Any] | None:
         # Prioritize automatic retries before fetching fresh work.
         while retry_queue:
-            b = retry_queue.pop(0)
+            b = retry_queue.popleft()
             bid = b.get("id")
             if bid and bid not in assigned_beads:
                 return b
         if beads_mode:
-            beads = bd_ready_json(repo_root)
-            if not beads:
-                beads = bd_list_open_json(repo_root)  # fallback: open issues when none are "ready" (e.g. all have blocking deps)
-            for b in beads:
-                bid = b.get("id") or b.get("bead_id") or b.get("hash") or (b if isinstance(b, str) else None)
-                if not bid:
-                    continue
-                if isinstance(b, dict):
-                    bid = str(bid)
-                if bid not in assigned_beads:
-                    return {"id": bid, "title": b.get("title", bid)}
-            return None
-        task = get_next_pending_from_queue(repo_root)
-        if not task or task["id"] in assigned_beads:
+            if not ready_queue or time.monotonic() - ready_fetched_at >= _BD_TTL:
+                refill_ready_queue()
+            while ready_queue:
+                b = ready_queue.popleft()
+                if b["id"] not in assigned_beads:  # assigned since the refill
+                    return b
             return None
-        return task
+        return get_next_pending_from_queue(repo_root, assigned_beads)
 
     def task_content(bead_or_task: dict[str, Any]) -> str:
         title = bead_or_task.get("title", bead_or_task["id"])
@@ -899,36 +1332,50 @@ def main() -> int:
 
     def assign_slot(slot_idx: int) -> bool:
         bead = get_next_ready_bead()
-        if not bead:
+        if not bead or not claim_beads([bead]):
             return False
-        bid = bead["id"]
-        title = (bead.get("title") or bid)[:60]
-        assigned_beads.add(bid)
+        start_worker(slot_idx, bead)
+        return True
+
+    def claim_beads(beads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Mark beads/tasks in_progress in one bd call or one queue write; returns those claimed, in order."""
+        ids = [b["id"] for b in beads]
+        assigned_beads.update(ids)
         if beads_mode:
-            if not bd_claim(repo_root, bid):
-                assigned_beads.discard(bid)
-                return False
+            claimed = bd_claim_many(repo_root, ids)
         else:
-            mark_task_status(repo_root, bid, "in_progress")
-        content = task_content(bead)
-        wt = worktree_roots[slot_idx]
-        proc = run_worker(wt, content, worker_cmd, model, backend=worker_backend)
-        slots[slot_idx] = {
-            "bead_id": bid,
-            "bead_title": title,
-            "process": proc,
-            "started_at": time.monotonic(),
-            "timed_out": False,
-        }
-        print(f"[w{slot_idx + 1}] started {bid}: {title}", flush=True)
-        return True
+            mark_tasks_status(repo_root, ids, "in_progress", save=False)
+            claimed = set(ids)
+        assigned_beads.difference_update(set(ids) - claimed)
+        return [b for b in beads if b["id"] in claimed]
+
+    def start_worker(slot_idx: int, bead: dict[str, Any]) -> None:
+        record_worker(slot_idx, bead, launch_worker(slot_idx, bead))
+
+    def launch_worker(slot_idx: int, bead: dict[str, Any]) -> subprocess.Popen:
+        """Build the prompt (bd show) and spawn the worker. Touches only this slot's worktree: safe to run in parallel."""
+        return run_worker(worktree_roots[slot_idx], task_content(bead), worker_cmd, model, backend=worker_backend)
+
+    def record_worker(slot_idx: int, bead: dict[str, Any], proc: subprocess.Popen) -> None:
+        bid = bead["id"]
+        title = (bead.get("title") or bid)[:60]
+        generation = next(assignment_seq)
+        slot_proc[slot_idx] = proc
+        slot_bead_id[slot_idx] = bid
+        slot_title[slot_idx] = title
+        slot_exit_watch[slot_idx] = watch_worker_exit(exit_poller, proc)
+        slot_generation[slot_idx] = generation
+        slot_timed_out[slot_idx] = False
+        if worker_timeout_secs > 0:
+            heapq.heappush(timeout_heap, (time.monotonic() + worker_timeout_secs, generation, slot_idx))
+        log.info("%s started %s: %s", slot_tags[slot_idx], bid, title)
 
     def on_worker_done(slot_idx: int) -> None:
-        bid = slots[slot_idx]["bead_id"]
-        title = slots[slot_idx].get("bead_title", bid)
-        proc = slots[slot_idx]["process"]
+        bid = slot_bead_id[slot_idx]
+        title = slot_title[slot_idx]
+        proc = slot_proc[slot_idx]
         exit_code = proc.returncode if proc.returncode is not None else proc.poll()
-        timed_out = bool(slots[slot_idx].get("timed_out"))
+        timed_out = slot_timed_out[slot_idx]
 
         # Retry path for failed/timed-out workers.
         if exit_code not in (0, None):
@@ -938,55 +1385,68 @@ def main() -> int:
             if beads_mode:
                 bd_reopen(repo_root, bid)
             else:
-                mark_task_status(repo_root, bid, "pending")
-            slots[slot_idx] = None
+                mark_task_status(repo_root, bid, "pending", save=False)
+            slot_proc[slot_idx] = None
 
             if attempt <= max_worker_retries:
                 retry_queue.append({"id": bid, "title": title})
                 reason = "timeout" if timed_out else f"exit {exit_code}"
-                print(
-                    f"[w{slot_idx + 1}] retry {attempt}/{max_worker_retries} for {bid} ({reason})",
-                    flush=True,
-                )
+                log.info("%s retry %s/%s for %s (%s)", slot_tags[slot_idx], attempt, max_worker_retries, bid, reason)
             else:
-                print(
-                    f"[w{slot_idx + 1}] retries exhausted for {bid}; left open/pending",
-                    flush=True,
-                )
+                log.info("%s retries exhausted for %s; left open/pending", slot_tags[slot_idx], bid)
             return
 
         if beads_mode:
             bd_close(repo_root, bid)
         else:
-            mark_task_status(repo_root, bid, "done")
+            mark_task_status(repo_root, bid, "done", save=False)
         assigned_beads.discard(bid)
         retry_counts.pop(bid, None)
-        print(f"[w{slot_idx + 1}] done   {bid}", flush=True)
-        slots[slot_idx] = None
-        # Auto-merge this worktree's branch into main (Gas Town-style: merge slot + conflict bead + pending retry)
+        log.info("%s done   %s", slot_tags[slot_idx], bid)
+        slot_proc[slot_idx] = None
+        # Auto-merge this worktree's branch into main (Gas Town-style: merge slot + conflict bead + pending retry).
+        # The merge runs on merge_pool; the slot's worktree is reused only once finish_merge has collected it.
         if auto_merge_worktrees:
-            wt = worktree_roots[slot_idx]
-            worker_branch = f"{prefix}{slot_idx + 1}"
-            if use_merge_slot and not acquire_merge_slot(repo_root):
-                print(f"[w{slot_idx + 1}] merge slot busy, skipping merge for {worker_branch}", flush=True)
-            else:
-                try:
-                    ok, merge_err = merge_worktree_into_main(repo_root, wt, worker_branch, base_branch)
-                    if ok:
-                        print(f"[w{slot_idx + 1}] merged {worker_branch} -> {base_branch}", flush=True)
-                    elif merge_err and config.get("create_bead_on_merge_conflict", True):
-                        conflict_id = create_merge_conflict_task(repo_root, worker_branch, merge_err, beads_mode)
-                        if conflict_id and auto_retry_merge_on_conflict_close:
-                            pending = load_pending_merge_retries(repo_root)
-                            pending[worker_branch] = conflict_id
-                            save_pending_merge_retries(repo_root, pending)
-                finally:
-                    if use_merge_slot:
-                        release_merge_slot(repo_root)
+            merging[slot_idx] = merge_pool.submit(merge_worker_branch, slot_idx)
+
+    def merge_worker_branch(slot_idx: int) -> tuple[str, str] | object | None:
+        """Runs on merge_pool. Returns (branch, conflict task/bead id) when the merge should be retried later,
+        or MERGE_SLOT_BUSY if another process held the merge slot past MERGE_SLOT_TIMEOUT_SECS."""
+        wt = worktree_roots[slot_idx]
+        worker_branch = slot_branches[slot_idx]
+        if use_merge_slot and not acquire_merge_slot(repo_root):
+            log.info("%s merge slot busy, requeueing merge for %s", slot_tags[slot_idx], worker_branch)
+            return MERGE_SLOT_BUSY
+        try:
+            ok, merge_err = merge_worktree_into_main(repo_root, wt, worker_branch, base_branch, use_merge_tree)
+            if ok:
+                log.info("%s merged %s -> %s", slot_tags[slot_idx], worker_branch, base_branch)
+            elif merge_err and config.get("create_bead_on_merge_conflict", True):
+                conflict_id = create_merge_conflict_task(repo_root, worker_branch, merge_err, beads_mode)
+                if conflict_id and auto_retry_merge_on_conflict_close:
+                    return worker_branch, conflict_id
+        finally:
+            if use_merge_slot:
+                release_merge_slot(repo_root)
+        return None
+
+    def finish_merge(slot_idx: int, requeue: bool = True) -> None:
+        """Collect a finished merge; a merge that found the slot busy goes to the back of merge_pool's queue."""
+        try:
+            result = merging.pop(slot_idx).result()
+        except Exception as e:
+            # Counts as a failed merge: the branch keeps its commits and no retry is recorded.
+            print(f"[merge] merge {slot_branches[slot_idx]} failed: {type(e).__name__}: {e}", file=sys.stderr)
+            return
+        if result is MERGE_SLOT_BUSY:
+            if requeue:
+                merging[slot_idx] = merge_pool.submit(merge_worker_branch, slot_idx)
+        elif result:
+            new_pending_retries[result[0]] = result[1]
 
     mode_str = "Beads" if beads_mode else "task_queue.json"
     backend_str = f"claude ({model})" if worker_backend == "claude" else f"aider ({model})"
-    print(f"Dispatcher: {num_workers} workers, {mode_str}, backend={backend_str}. Press Ctrl+C to stop.", flush=True)
+    log.info("Dispatcher: %s workers, %s, backend=%s. Press Ctrl+C to stop.", num_workers, mode_str, backend_str)
 
     # Startup check: how much ready work?
     if beads_mode:
@@ -996,33 +1456,76 @@ def main() -> int:
             open_list = bd_list_open_json(repo_root)
             n_open = len(open_list)
             if n_open > 0:
-                print(f"No ready beads (deps blocking); using {n_open} open issue(s) instead. Assigning to workers...", flush=True)
+                log.info("No ready beads (deps blocking); using %s open issue(s) instead. Assigning to workers...", n_open)
             else:
-                print("No ready or open beads. Run 'bd list' in the repo to see issues. Create: 'bd create \"Task title\"'. To unblock: 'bd update <id> --status open' (if stuck in progress).", flush=True)
+                log.info("No ready or open beads. Run 'bd list' in the repo to see issues. Create: 'bd create \"Task title\"'. To unblock: 'bd update <id> --status open' (if stuck in progress).")
         else:
-            print(f"Ready beads: {n_ready}. Assigning to workers...", flush=True)
+            log.info("Ready beads: %s. Assigning to workers...", n_ready)
     else:
         data = load_task_queue(repo_root)
         n_pending = sum(1 for t in data["tasks"] if t.get("status") == "pending")
         if n_pending == 0:
-            print("No pending tasks in task_queue.json. Add entries or run with Beads.", flush=True)
+            log.info("No pending tasks in task_queue.json. Add entries or run with Beads.")
         else:
-            print(f"Pending tasks: {n_pending}. Assigning to workers...", flush=True)
+            log.info("Pending tasks: %s. Assigning to workers...", n_pending)
 
-    for i in range(num_workers):
-        assign_slot(i)
+    # Workers launched at startup, including any not yet recorded in slot_proc when the dispatcher is stopped.
+    startup_procs: list[subprocess.Popen] = []
+
+    def launch_startup_worker(slot_idx: int, bead: dict[str, Any]) -> subprocess.Popen:
+        proc = launch_worker(slot_idx, bead)
+        startup_procs.append(proc)
+        return proc
 
     last_retry_time = 0.0
+    last_retry_signature = -1
+    retry_future: Future | None = None
     last_bd_sync_time = 0.0
     last_auto_unblock_time = 0.0
+    stop_on_termination_signals()
     try:
+        # Fill every slot from one claim (one bd update / one queue write) instead of one per slot.
+        startup_beads: list[dict[str, Any]] = []
+        while len(startup_beads) < num_workers:
+            bead = get_next_ready_bead()
+            if not bead:
+                break
+            assigned_beads.add(bead["id"])  # so the next pick skips it
+            startup_beads.append(bead)
+        claimed = claim_beads(startup_beads)
+        if claimed:
+            # bd show + spawn for every slot at once; slot state is then recorded here on the main thread.
+            pool = ThreadPoolExecutor(max_workers=min(8, len(claimed)))
+            try:
+                procs = list(pool.map(launch_startup_worker, range(len(claimed)), claimed))
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+            for i, (bead, proc) in enumerate(zip(claimed, procs)):
+                record_worker(i, bead, proc)
+        startup_procs.clear()
+
         while True:
             now = time.monotonic()
-            if auto_retry_merge_on_conflict_close and (now - last_retry_time) >= RETRY_PENDING_INTERVAL_SECS:
-                retry_pending_merges(repo_root, worktree_roots, prefix, base_branch, beads_mode, use_merge_slot)
-                last_retry_time = now
+            if (
+                auto_retry_merge_on_conflict_close
+                and (now - last_retry_time) >= RETRY_PENDING_MIN_INTERVAL_SECS
+                and (retry_future is None or retry_future.done())
+            ):
+                # Sweep when a task/bead changed since the last sweep (the conflict task may have closed),
+                # and only if some merge is actually waiting; the interval sweep catches anything missed.
+                signature = task_state_signature(repo_root, beads_mode)
+                if signature != last_retry_signature or (now - last_retry_time) >= RETRY_PENDING_INTERVAL_SECS:
+                    last_retry_signature = signature
+                    last_retry_time = now
+                    if load_pending_merge_retries(repo_root):
+                        retry_future = merge_pool.submit(
+                            retry_pending_merges,
+                            repo_root, worktree_roots, prefix, base_branch, beads_mode, use_merge_slot, use_merge_tree,
+                        )
+                        retry_future.add_done_callback(report_job_failure("retrying pending merges"))
             if beads_mode and (now - last_bd_sync_time) >= bd_sync_interval_secs:
-                bd_sync(repo_root)
+                # bd sync commits in repo_root: keep it between merges
+                merge_pool.submit(bd_sync, repo_root).add_done_callback(report_job_failure("bd sync"))
                 last_bd_sync_time = now
             if beads_mode and auto_unblock_in_progress and (now - last_auto_unblock_time) >= auto_unblock_interval_secs:
                 ready_now = bd_ready_json(repo_root)
@@ -1039,35 +1542,83 @@ def main() -> int:
                         if unblocked >= auto_unblock_max_items:
                             break
                     if unblocked > 0:
-                        print(
-                            f"[auto-unblock] reopened {unblocked} in_progress bead(s) because queue was empty",
-                            flush=True,
-                        )
+                        log.info("[auto-unblock] reopened %s in_progress bead(s) because queue was empty", unblocked)
                 last_auto_unblock_time = now
+            # Worker timeout: free the slot if Aider runs too long (e.g. never exits)
+            while timeout_heap and timeout_heap[0][0] <= now:
+                entry = heapq.heappop(timeout_heap)
+                if not timeout_entry_is_live(entry):
+                    continue
+                i = entry[2]
+                if slot_proc[i].poll() is None:
+                    log.info("%s worker timeout (%ss), terminating", slot_tags[i], worker_timeout_secs)
+                    slot_timed_out[i] = True
+                    terminate_worker(slot_proc[i])  # reaped below on a later pass, once it has exited
+            out_of_work = False  # once one idle slot finds nothing ready, the rest won't either this tick
             for i in range(num_workers):
-                if slots[i] is None:
-                    assign_slot(i)
+                proc = slot_proc[i]
+                if proc is None:
+                    if i in merging:
+                        if not merging[i].done():
+                            continue
+                        finish_merge(i)
+                        if i in merging:  # requeued
+                            continue
+                    if not out_of_work:
+                        out_of_work = not assign_slot(i)
                     continue
-                proc = slots[i]["process"]
-                # Worker timeout: free the slot if Aider runs too long (e.g. never exits)
-                if worker_timeout_secs > 0 and (now - slots[i]["started_at"]) >= worker_timeout_secs:
-                    if proc.poll() is None:
-                        print(f"[w{i + 1}] worker timeout ({worker_timeout_secs}s), terminating", flush=True)
-                        slots[i]["timed_out"] = True
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=10)
-                        except subprocess.TimeoutExpired:
-                            proc.kill()
                 if proc.poll() is not None:
+                    unwatch_worker_exit(exit_poller, slot_exit_watch[i])
                     on_worker_done(i)
-                    assign_slot(i)
-            time.sleep(poll_interval_secs)
-    except KeyboardInterrupt:
-        for i in range(num_workers):
-            if slots[i] and slots[i]["process"].poll() is None:
-                slots[i]["process"].terminate()
-        return 0
+                    if i not in merging and not out_of_work:
+                        out_of_work = not assign_slot(i)
+            if not beads_mode:
+                flush_task_queue(repo_root)  # this tick's claims and completions, one write
+            if new_pending_retries:
+                add_pending_merge_retries(repo_root, new_pending_retries)
+                new_pending_retries.clear()
+            # Sleep until the next thing is due (timeout, retry sweep, bd sync, auto-unblock), or a worker exits.
+            now = time.monotonic()
+            wait_secs = float(RETRY_PENDING_INTERVAL_SECS)
+            if auto_retry_merge_on_conflict_close and (retry_future is None or retry_future.done()):
+                wait_secs = min(wait_secs, last_retry_time + RETRY_PENDING_INTERVAL_SECS - now)
+            if beads_mode:
+                wait_secs = min(wait_secs, last_bd_sync_time + bd_sync_interval_secs - now)
+                if auto_unblock_in_progress:
+                    wait_secs = min(wait_secs, last_auto_unblock_time + auto_unblock_interval_secs - now)
+            while timeout_heap and not timeout_entry_is_live(timeout_heap[0]):
+                heapq.heappop(timeout_heap)
+            if timeout_heap:
+                wait_secs = min(wait_secs, timeout_heap[0][0] - now)
+            if exit_poller is None or None in slot_proc or None in slot_exit_watch:
+                # Idle slots keep polling for new work (or for their merge) and unwatched workers need proc.poll().
+                wait_secs = min(wait_secs, poll_interval_secs)
+            wait_secs = max(wait_secs, 0.0)
+            if exit_poller is None:
+                time.sleep(wait_secs)
+            else:
+                wait_worker_exit(exit_poller, wait_secs)
+    except KeyboardInterrupt:  # Ctrl+C, SIGTERM or SIGHUP
+        pass
+    finally:
+        # Every exit stops the live worker groups: in their own sessions they would otherwise outlive the dispatcher.
+        live = [p for p in {*slot_proc, *startup_procs} if p is not None and p.poll() is None]
+        for proc in live:
+            signal_worker_tree(proc)
+        stop_deadline = time.monotonic() + 10
+        for proc in live:
+            try:
+                proc.wait(timeout=max(0.0, stop_deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                signal_worker_tree(proc, force=True)
+        # Let a merge that is already running finish rather than leave repo_root mid-merge.
+        merge_pool.shutdown(wait=True, cancel_futures=True)
+        for i in [i for i, f in merging.items() if f.done() and not f.cancelled()]:
+            finish_merge(i, requeue=False)  # an unmerged branch keeps its commits for the next run
+        if not beads_mode:
+            flush_task_queue(repo_root)
+        if new_pending_retries:
+            add_pending_merge_retries(repo_root, new_pending_retries)
     return 0
 
 
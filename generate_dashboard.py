@@ -165,55 +165,121 @@ def main():
     def project_from_key(key):
         return key.split("-", 1)[0] if key and "-" in str(key) else ""
 
+    # Projects, components and teams repeat across thousands of rows, so escape each distinct value once.
+    esc_cache = {}
+
+    def esc(s, _c=esc_cache, _e=html.escape):
+        r = _c.get(s)
+        return r if r is not None else _c.setdefault(s, _e(s))
+
+    pk_cache = {}
+
+    def esc_project_from_key(key):
+        r = pk_cache.get(key)
+        if r is None:
+            r = pk_cache[key] = esc(project_from_key(key))
+        return r
+
+    browse_url = html.escape(jira_base_url) + "/browse/" if jira_base_url else ""
+
     def link_key(key):
         k = html.escape(str(key))
-        if jira_base_url and k:
-            return f'<a href="{html.escape(jira_base_url)}/browse/{k}" target="_blank" style="color:var(--accent)">{k}</a>'
+        if browse_url and k:
+            return f'<a href="{browse_url}{k}" target="_blank" style="color:var(--accent)">{k}</a>'
         return k
 
-    blocked_rows = "".join(
-        f'<tr data-project="{html.escape(str(b.get("project", project_from_key(b.get("key", "")) or "")))}" '
-        f'data-components="{html.escape("|".join(b.get("components", [])))}" data-team="{html.escape(b.get("team", ""))}">'
-        f'<td>{link_key(b.get("key", ""))}</td><td>{round(float(b.get("age_days", 0)), 1)}</td></tr>'
-        for b in blocked_oldest_details
-    ) if blocked_oldest_details else "".join(
-        f'<tr data-project="{html.escape(project_from_key(b[0]))}"><td>{link_key(b[0])}</td><td>{round(float(b[1]), 1)}</td></tr>'
-        for b in blocked_oldest
-    ) if blocked_oldest else "<tr><td colspan=\"2\">None</td></tr>"
-
-    bugs_rows = "".join(
-        f'<tr data-project="{html.escape(b.get("project", ""))}" data-components="{html.escape("|".join(b.get("components", [])))}" data-team="{html.escape(b.get("team", ""))}">'
-        f'<td>{link_key(b.get("key", ""))}</td><td>{html.escape(b.get("project", ""))}</td><td>{round(float(b.get("age_days", 0)), 1)}</td><td>{html.escape((b.get("summary") or "")[:60])}</td></tr>'
-        for b in oldest_bugs
-    ) if oldest_bugs else "<tr><td colspan=\"4\">None</td></tr>"
-
-    sprint_rows = []
-    for s in sprint_metrics:
-        ratio = s.get("commitment_done_ratio")
-        ratio_str = f"{ratio:.2f}" if ratio is not None else "\u2014"
-        added = s.get("added_after_sprint_start")
-        removed = s.get("removed_during_sprint")
-        last24 = s.get("resolved_last_24h_pct")
-        last24_str = f"{last24}%" if last24 is not None else "\u2014"
-        a_d = s.get("added_and_done_count")
-        a_d_str = str(a_d) if a_d is not None else "\u2014"
-        sprint_components = sorted((s.get("component_breakdown") or {}).keys())
-        sprint_teams = sorted((s.get("team_breakdown") or {}).keys())
-        sprint_rows.append(
-            f'<tr data-project="{html.escape(s.get("project", ""))}" data-components="{html.escape("|".join(sprint_components))}" data-team="{html.escape("|".join(sprint_teams))}" data-date="{html.escape(str(s.get("end", "") or s.get("start", "") or ""))[:10]}">'
-            f'<td>{html.escape(s.get("project", ""))}</td>'
-            f'<td>{html.escape(s.get("sprint_name", ""))}</td>'
-            f'<td>{s.get("throughput_issues", 0)}</td>'
-            f'<td>{s.get("total_issues", 0)}</td>'
-            f'<td>{s.get("assignee_count", "")}</td>'
-            f'<td>{ratio_str}</td>'
-            f'<td>{added if added is not None else "\u2014"}</td>'
-            f'<td>{a_d_str}</td>'
-            f'<td>{removed if removed is not None else "\u2014"}</td>'
-            f'<td>{last24_str}</td>'
-            f'</tr>'
-        )
-    sprint_rows_str = "".join(sprint_rows) if sprint_rows else "<tr><td colspan=\"10\">No sprint data</td></tr>"
+    def _render_blocked_rows(details, oldest):
+        rows = []
+        append = rows.append
+        if details:
+            for b in details:
+                append(
+                    f'<tr data-project="{esc(str(b["project"])) if "project" in b else esc_project_from_key(b.get("key", ""))}" '
+                    f'data-components="{esc("|".join(b.get("components", [])))}" data-team="{esc(b.get("team", ""))}">'
+                    f'<td>{link_key(b.get("key", ""))}</td><td>{round(float(b.get("age_days", 0)), 1)}</td></tr>'
+                )
+        elif oldest:
+            for b in oldest:
+                append(f'<tr data-project="{esc_project_from_key(b[0])}"><td>{link_key(b[0])}</td><td>{round(float(b[1]), 1)}</td></tr>')
+        return "".join(rows) if rows else "<tr><td colspan=\"2\">None</td></tr>"
+
+    def _render_bugs_rows(bugs):
+        _esc = html.escape
+        rows = []
+        append = rows.append
+        for b in bugs:
+            project = esc(b.get("project", ""))
+            append(
+                f'<tr data-project="{project}" data-components="{esc("|".join(b.get("components", [])))}" data-team="{esc(b.get("team", ""))}">'
+                f'<td>{link_key(b.get("key", ""))}</td><td>{project}</td><td>{round(float(b.get("age_days", 0)), 1)}</td><td>{_esc((b.get("summary") or "")[:60])}</td></tr>'
+            )
+        return "".join(rows) if rows else "<tr><td colspan=\"4\">None</td></tr>"
+
+    def _render_sprint_rows(sprints):
+        _esc = html.escape
+        dash = "\u2014"
+        rows = []
+        append = rows.append
+        for s in sprints:
+            ratio = s.get("commitment_done_ratio")
+            ratio_str = f"{ratio:.2f}" if ratio is not None else dash
+            added = s.get("added_after_sprint_start")
+            removed = s.get("removed_during_sprint")
+            last24 = s.get("resolved_last_24h_pct")
+            last24_str = f"{last24}%" if last24 is not None else dash
+            a_d = s.get("added_and_done_count")
+            a_d_str = str(a_d) if a_d is not None else dash
+            sprint_components = sorted((s.get("component_breakdown") or {}).keys())
+            sprint_teams = sorted((s.get("team_breakdown") or {}).keys())
+            project = esc(s.get("project", ""))
+            append(
+                f'<tr data-project="{project}" data-components="{esc("|".join(sprint_components))}" data-team="{esc("|".join(sprint_teams))}" data-date="{_esc(str(s.get("end", "") or s.get("start", "") or ""))[:10]}">'
+                f'<td>{project}</td>'
+                f'<td>{_esc(s.get("sprint_name", ""))}</td>'
+                f'<td>{s.get("throughput_issues", 0)}</td>'
+                f'<td>{s.get("total_issues", 0)}</td>'
+                f'<td>{s.get("assignee_count", "")}</td>'
+                f'<td>{ratio_str}</td>'
+                f'<td>{added if added is not None else dash}</td>'
+                f'<td>{a_d_str}</td>'
+                f'<td>{removed if removed is not None else dash}</td>'
+                f'<td>{last24_str}</td>'
+                f'</tr>'
+            )
+        return "".join(rows) if rows else "<tr><td colspan=\"10\">No sprint data</td></tr>"
+
+    def _render_kanban_rows(boards):
+        _esc = html.escape
+        rows = []
+        append = rows.append
+        for k in boards:
+            project = esc(k.get("project", ""))
+            append(
+                f'<tr data-project="{project}"><td>{project}</td><td>{_esc(k.get("board_name", ""))}</td><td>{k.get("issue_count", 0)}</td>'
+                f'<td>{k.get("done_count", 0)}</td><td>{_esc(json.dumps(k.get("status_breakdown", {})))}</td></tr>'
+            )
+        return "".join(rows) if rows else "<tr><td colspan=\"5\">No Kanban boards</td></tr>"
+
+    def _render_epic_rows(epics):
+        _esc = html.escape
+        rows = []
+        append = rows.append
+        for e in sorted(epics, key=lambda x: (-1 if x.get("stale") else 0, -(x.get("age_days") or 0))):
+            stale = e.get("stale")
+            project = esc(e.get("project", ""))
+            append(
+                f'<tr data-project="{project}" data-stale="{"1" if stale else "0"}" data-date="{_esc(str(e.get("created_date") or "")[:10])}" data-components="{esc("|".join(e.get("components", [])))}" style="{"color:var(--red)" if stale else ""}">'
+                f'<td>{project}</td><td>{link_key(e.get("key", ""))}</td>'
+                f'<td>{_esc((e.get("summary", ""))[:50])}</td><td>{e.get("age_days", 0)}</td>'
+                f'<td>{e.get("total_children", 0)}</td><td>{e.get("done_children", 0)}</td>'
+                f'<td>{e.get("completion_pct", 0)}%</td><td>{"Yes" if stale else ""}</td></tr>'
+            )
+        return "".join(rows) if rows else "<tr><td colspan='8'>No epic data</td></tr>"
+
+    blocked_rows = _render_blocked_rows(blocked_oldest_details, blocked_oldest)
+    bugs_rows = _render_bugs_rows(oldest_bugs)
+    sprint_rows_str = _render_sprint_rows(sprint_metrics)
+    epic_rows = _render_epic_rows(epic_health)
 
     # Empty or bad structure: list (WIP + Done with Scope column) and breakdowns
     empty_bad_list_wip = data.get("empty_or_bad_list_wip") or []
@@ -268,10 +334,7 @@ def main():
     empty_bad_top_labels_wip_html = _top5_table(top_labels_wip)
     empty_bad_top_labels_done_html = _top5_table(top_labels_done)
 
-    kanban_rows = "".join(
-        f'<tr data-project="{html.escape(k.get("project", ""))}"><td>{html.escape(k.get("project", ""))}</td><td>{html.escape(k.get("board_name", ""))}</td><td>{k.get("issue_count", 0)}</td><td>{k.get("done_count", 0)}</td><td>{html.escape(json.dumps(k.get("status_breakdown", {})))}</td></tr>'
-        for k in kanban
-    ) if kanban else "<tr><td colspan=\"5\">No Kanban boards</td></tr>"
+    kanban_rows = _render_kanban_rows(kanban)
 
     # Releases: sort by released first, then release_date descending (null last)
     def _release_date_key(r):
@@ -443,18 +506,18 @@ def main():
   <div class="project-filter">
     <span class="pf-label">Project:</span>
     <label><input type="checkbox" id="projectAll" checked /> All</label>
-    {''.join(f'<label><input type="checkbox" class="project-cb" value="{html.escape(p)}" /> {html.escape(p)}</label>' for p in projects)}
+    {''.join(f'<label><input type="checkbox" class="project-cb" value="{esc(p)}" /> {esc(p)}</label>' for p in projects)}
   </div>
   <div class="project-filter">
     <span class="pf-label">Component:</span>
     <label><input type="checkbox" id="componentAll" checked /> All</label>
-    {''.join(f'<label><input type="checkbox" class="component-cb" value="{html.escape(c)}" /> {html.escape(c)}</label>' for c in all_components)}
+    {''.join(f'<label><input type="checkbox" class="component-cb" value="{esc(c)}" /> {esc(c)}</label>' for c in all_components)}
   </div>
   {''.join([
       '<div class="project-filter" id="teamFilterBar">',
       '<span class="pf-label">Team:</span>',
       '<label><input type="checkbox" id="teamAll" checked /> All</label>',
-      ''.join(f'<label><input type="checkbox" class="team-cb" value="{html.escape(t)}" /> {html.escape(t)}</label>' for t in teams),
+      ''.join(f'<label><input type="checkbox" class="team-cb" value="{esc(t)}" /> {esc(t)}</label>' for t in teams),
       '</div>',
   ]) if teams else ''}
   <p class="meta" id="filterScopeSummary">Scope: all projects, all components{', all teams' if teams else ''}. Metrics are exact.</p>
@@ -808,14 +871,7 @@ def main():
     <div class="table-wrap">
       <table id="tableEpics">
         <thead><tr><th data-sort="project">Project</th><th data-sort="key">Key</th><th>Summary</th><th data-sort="age_days">Age (d)</th><th data-sort="total_children">Children</th><th data-sort="done_children">Done</th><th data-sort="completion_pct">%</th><th>Stale</th></tr></thead>
-        <tbody>{''.join(
-            f'<tr data-project="{html.escape(e.get("project",""))}" data-stale="{"1" if e.get("stale") else "0"}" data-date="{html.escape(str(e.get("created_date") or "")[:10])}" data-components="{html.escape("|".join(e.get("components", [])))}" style="{"color:var(--red)" if e.get("stale") else ""}">'
-            f'<td>{html.escape(e.get("project",""))}</td><td>{link_key(e.get("key",""))}</td>'
-            f'<td>{html.escape((e.get("summary",""))[:50])}</td><td>{e.get("age_days",0)}</td>'
-            f'<td>{e.get("total_children",0)}</td><td>{e.get("done_children",0)}</td>'
-            f'<td>{e.get("completion_pct",0)}%</td><td>{"Yes" if e.get("stale") else ""}</td></tr>'
-            for e in sorted(epic_health, key=lambda x: (-1 if x.get("stale") else 0, -(x.get("age_days") or 0)))
-        ) if epic_health else "<tr><td colspan='8'>No epic data</td></tr>"}</tbody>
+        <tbody>{epic_rows}</tbody>
       </table>
     </div>
   </section>
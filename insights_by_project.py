@@ -3,11 +3,19 @@
 Read jira_analytics_latest.json (or given path), split metrics by project,
 and write by_project.json + INSIGHTS_AND_ACTIONS.md with next best actions.
 """
+import hashlib
 import json
 import os
 import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+
+# Optional: orjson decodes the analytics JSON several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def project_from_key(key):
     if not key or "-" not in key:
@@ -15,7 +23,23 @@ def project_from_key(key):
     return key.split("-", 1)[0]
 
 def load_data(path=None):
-    path = path or os.path.join(os.path.dirname(__file__), "jira_analytics_latest.json")
+    """
+    Parsed analytics JSON. Cached per (path, mtime), so repeated calls in one process skip
+    the decode until the file changes; the returned dict is shared, treat it as read-only.
+    """
+    path = os.path.abspath(path or os.path.join(os.path.dirname(__file__), "jira_analytics_latest.json"))
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+@lru_cache(maxsize=4)
+def _load_json_cached(path, mtime_ns):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json writes bare NaN, which orjson rejects; let json handle those files.
+            return json.loads(raw)
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
@@ -25,27 +49,27 @@ def build_by_project(data):
 
     # Blocked issues (key, age_days)
     for key, age in data.get("blocked_oldest", []):
-        p = project_from_key(key)
-        if p and p in by_project:
-            by_project[p]["blocked"].append({"key": key, "age_days": age})
+        d = by_project.get(project_from_key(key))
+        if d is not None:
+            d["blocked"].append({"key": key, "age_days": age})
 
     # Oldest open bugs (already have project)
     for b in data.get("oldest_open_bugs", []):
-        p = b.get("project")
-        if p and p in by_project:
-            by_project[p]["oldest_bugs"].append(b)
+        d = by_project.get(b.get("project"))
+        if d is not None:
+            d["oldest_bugs"].append(b)
 
     # Sprint metrics
     for s in data.get("sprint_metrics", []):
-        p = s.get("project")
-        if p and p in by_project:
-            by_project[p]["sprint_metrics"].append(s)
+        d = by_project.get(s.get("project"))
+        if d is not None:
+            d["sprint_metrics"].append(s)
 
     # Kanban (one per project)
     for k in data.get("kanban_boards", []):
-        p = k.get("project")
-        if p and p in by_project:
-            by_project[p]["kanban"] = k
+        d = by_project.get(k.get("project"))
+        if d is not None:
+            d["kanban"] = k
 
     return by_project
 
@@ -90,10 +114,12 @@ def write_by_project_json(by_project, out_path):
         json.dump(out, f, indent=2, ensure_ascii=False)
     return out
 
+_EXTRA_SOURCES = ("git_analytics", "octopus_analytics", "cicd_analytics", "scorecard", "unified_evidence")
+
 def _load_extra_data(base_dir):
     """Try to load git/octopus/cicd/scorecard data alongside Jira."""
     extras = {}
-    for name in ("git_analytics", "octopus_analytics", "cicd_analytics", "scorecard", "unified_evidence"):
+    for name in _EXTRA_SOURCES:
         path = os.path.join(base_dir, f"{name}_latest.json")
         if os.path.isfile(path):
             try:
@@ -192,11 +218,18 @@ def generate_insights_md(data, by_project, out_path):
         bugs = len(d.get("oldest_bugs", []))
         return (-blocked, -bugs, p)
 
-    for p in sorted(by_project.keys(), key=sort_key):
+    # Both per-project sections below use the same order and sprint summaries: compute them once.
+    ordered_projects = sorted(by_project.keys(), key=sort_key)
+    sprint_sums = {p: sprint_summary(by_project[p].get("sprint_metrics", [])) for p in ordered_projects}
+    releases_by_project = defaultdict(list)
+    for r in releases:
+        releases_by_project[r.get("project")].append(r)
+
+    for p in ordered_projects:
         d = by_project[p]
         blocked = d.get("blocked", [])
         bugs = d.get("oldest_bugs", [])
-        sprint_sum = sprint_summary(d.get("sprint_metrics", []))
+        sprint_sum = sprint_sums[p]
         kanban = d.get("kanban")
 
         lines.append(f"### {p}")
@@ -213,7 +246,7 @@ def generate_insights_md(data, by_project, out_path):
         if kanban:
             k = kanban
             proj_lines.append(f"- **Kanban:** {k.get('issue_count', 0)} on board, {k.get('done_count', 0)} done — {json.dumps(k.get('status_breakdown', {}))}")
-        proj_releases = [r for r in releases if r.get("project") == p]
+        proj_releases = releases_by_project.get(p)
         if proj_releases:
             proj_released = sum(1 for r in proj_releases if r.get("released"))
             proj_lines.append(f"- **Versions:** {len(proj_releases)} total, {proj_released} released")
@@ -252,12 +285,12 @@ def generate_insights_md(data, by_project, out_path):
     ])
 
     # Per-project actions
-    for p in sorted(by_project.keys(), key=sort_key):
+    for p in ordered_projects:
         d = by_project[p]
         blocked = d.get("blocked", [])
         bugs = d.get("oldest_bugs", [])
         kanban = d.get("kanban")
-        sprint_sum = sprint_summary(d.get("sprint_metrics", []))
+        sprint_sum = sprint_sums[p]
 
         actions = []
         if blocked:
@@ -351,6 +384,20 @@ def generate_insights_md(data, by_project, out_path):
     with open(out_path, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
 
+# Hashed with the inputs, so editing this script invalidates outputs built by the previous version.
+_SCRIPT_PATH = os.path.abspath(__file__)
+
+def _inputs_hash(src, base_dir):
+    """blake2b over this script, the Jira export and every extra *_latest.json that generate_insights_md reads."""
+    h = hashlib.blake2b(digest_size=16)
+    paths = [_SCRIPT_PATH, src] + [os.path.join(base_dir, f"{name}_latest.json") for name in _EXTRA_SOURCES]
+    for path in paths:
+        h.update(path.encode("utf-8"))
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
 def main():
     src = sys.argv[1] if len(sys.argv) > 1 else None
     output_dir = os.environ.get("OUTPUT_DIR") or os.path.dirname(os.path.abspath(__file__))
@@ -358,10 +405,25 @@ def main():
         candidate = os.path.join(output_dir, "jira_analytics_latest.json")
         if os.path.isfile(candidate):
             src = candidate
+    src = src or os.path.join(os.path.dirname(__file__), "jira_analytics_latest.json")
+    by_project_path = os.path.join(output_dir, "by_project.json")
+    insights_path = os.path.join(output_dir, "INSIGHTS_AND_ACTIONS.md")
+    hash_path = os.path.join(output_dir, ".insights.hash")
+
+    # Skip the rebuild when the inputs and this script are byte-identical to the last successful run (e.g. CI polling).
+    inputs_hash = _inputs_hash(os.path.abspath(src), output_dir)
+    if os.path.isfile(by_project_path) and os.path.isfile(insights_path) and os.path.isfile(hash_path):
+        with open(hash_path, encoding="utf-8") as f:
+            if f.read().strip() == inputs_hash:
+                print("by_project.json and INSIGHTS_AND_ACTIONS.md are up to date")
+                return
+
     data = load_data(src)
     by_project = build_by_project(data)
-    write_by_project_json(by_project, os.path.join(output_dir, "by_project.json"))
-    generate_insights_md(data, by_project, os.path.join(output_dir, "INSIGHTS_AND_ACTIONS.md"))
+    write_by_project_json(by_project, by_project_path)
+    generate_insights_md(data, by_project, insights_path)
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(inputs_hash)
     print("Wrote by_project.json and INSIGHTS_AND_ACTIONS.md")
 
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 import os
 import math
 import time
+import heapq
+import hashlib
+import shutil
 import json as _json
+import pickle
+import threading
 from datetime import datetime, timezone, timedelta
 from collections import Counter, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 
 # Load .env if present (keeps token out of terminal history)
 # Set DOTENV_PATH (e.g. /data/.env) in Docker to load from shared volume.
@@ -14,7 +24,17 @@ except ImportError:
     pass
 
 import requests
-import pandas as pd
+# Optional: httpx with HTTP/2 multiplexes concurrent Jira requests over one connection.
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:
+    httpx = None
+# Optional: orjson parses large search pages and cache files several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from dateutil import parser as dtparser
 
 
@@ -91,6 +111,40 @@ EMPTY_OR_BAD_SUMMARY_MIN_LENGTH = int(os.environ.get("JIRA_EMPTY_BAD_SUMMARY_MIN
 EMPTY_OR_BAD_IF_NO_LABELS = os.environ.get("JIRA_EMPTY_BAD_IF_NO_LABELS", "").strip().lower() in ("1", "true", "yes")
 EMPTY_OR_BAD_IF_NO_COMPONENT = os.environ.get("JIRA_EMPTY_BAD_IF_NO_COMPONENT", "").strip().lower() in ("1", "true", "yes")
 
+# Optional on-disk HTTP cache for Jira GETs (ETag / If-None-Match). Disabled when unset.
+# Set JIRA_CACHE_DIR (e.g. /data/.jira_cache) to reuse unchanged responses across runs.
+JIRA_CACHE_DIR = os.environ.get("JIRA_CACHE_DIR", "").strip()
+
+# Concurrent Jira requests for independent board/sprint fetches (keep modest for Jira Cloud rate limits).
+JIRA_MAX_WORKERS = max(1, int(os.environ.get("JIRA_MAX_WORKERS", "8")))
+# Worker processes for per-project/component/team scope metrics (CPU bound). 1 = serial.
+JIRA_SCOPE_PROCESSES = max(1, int(os.environ.get("JIRA_SCOPE_PROCESSES", str(min(os.cpu_count() or 1, 8)))))
+# Retries when Jira answers 429 Too Many Requests (honours Retry-After).
+JIRA_MAX_RETRIES = 4
+# Reuse identical search/sprint/board issue listings within one run; set to 0 on memory-constrained hosts.
+JIRA_MEMO_SEARCHES = os.environ.get("JIRA_MEMO_SEARCHES", "1").strip().lower() not in ("0", "false", "no")
+# Guards JiraClient._memo lookups; fetches run outside it.
+_MEMO_LOCK = threading.Lock()
+
+
+def _load_json_file(path):
+    """Parse a JSON file (orjson when available)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return _json.load(f)
+
+
+def _dump_json_file(path, data):
+    """Write compact JSON to path (orjson when available)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        _json.dump(data, f)
+
 
 # ----------------------------
 # Jira client
@@ -103,19 +157,95 @@ class JiraClient:
         if not self.base or not self.email or not self.token:
             raise RuntimeError("Missing env vars. Set JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN.")
 
-        self.session = requests.Session()
-        self.session.auth = (self.email, self.token)
-        self.session.headers.update({"Accept": "application/json"})
+        # httpx.Client and requests.Session share the .get(url, params=, headers=, timeout=) surface used by _get.
+        if httpx is not None:
+            self.session = httpx.Client(
+                http2=True,
+                auth=(self.email, self.token),
+                headers={"Accept": "application/json"},
+                limits=httpx.Limits(max_connections=JIRA_MAX_WORKERS, max_keepalive_connections=JIRA_MAX_WORKERS),
+                timeout=60.0,
+            )
+        else:
+            self.session = requests.Session()
+            self.session.auth = (self.email, self.token)
+            self.session.headers.update({"Accept": "application/json"})
+        self.cache_dir = JIRA_CACHE_DIR or None
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self._fields = None
+        self._memo = {} if JIRA_MEMO_SEARCHES else None
+
+    def _memoized(self, key, fetch):
+        """
+        Run-scoped memo for issue listings: a repeated identical request returns the first result.
+        Concurrent identical requests wait for a single fetch; a failed fetch is not memoized.
+        The returned list and issue dicts are shared by every caller: treat them as read-only
+        (per-issue caches such as "_changelog" are the only things stored on them).
+        """
+        if self._memo is None:
+            return fetch()
+        with _MEMO_LOCK:
+            pending = self._memo.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._memo[key] = Future()
+        if owner:
+            try:
+                pending.set_result(fetch())
+            except BaseException as e:
+                with _MEMO_LOCK:
+                    self._memo.pop(key, None)
+                pending.set_exception(e)
+                raise
+        return pending.result()
+
+    def _cache_path(self, url, params):
+        """On-disk cache file for a GET, keyed by URL + sorted params."""
+        key = url + "?" + _json.dumps(sorted((params or {}).items()), default=str)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
 
     def _get(self, path, params=None, timeout=60):
         url = self.base.rstrip("/") + path
-        r = self.session.get(url, params=params or {}, timeout=timeout)
+        params = params or {}
+        cached = None
+        headers = None
+        cache_path = self._cache_path(url, params) if self.cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                cached = _load_json_file(cache_path)
+            except (OSError, ValueError):
+                cached = None
+            if cached and cached.get("etag"):
+                headers = {"If-None-Match": cached["etag"]}
+        for attempt in range(JIRA_MAX_RETRIES + 1):
+            r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            if r.status_code != 429 or attempt == JIRA_MAX_RETRIES:
+                break
+            try:
+                wait = float(r.headers.get("Retry-After") or 0)
+            except (TypeError, ValueError):
+                wait = 0
+            time.sleep(wait if wait > 0 else 2 ** attempt)
+        if r.status_code == 304 and cached is not None:
+            return cached.get("body")
         if r.status_code >= 400:
             raise RuntimeError(f"GET {url} failed {r.status_code}: {r.text[:500]}")
-        return r.json()
+        data = orjson.loads(r.content) if orjson is not None else r.json()
+        etag = r.headers.get("ETag") if cache_path else None
+        if etag:
+            try:
+                _dump_json_file(cache_path, {"etag": etag, "body": data})
+            except OSError:
+                pass
+        return data
 
     def search(self, jql, fields=None, expand=None, max_results=1000):
         """Paginated /rest/api/3/search/jql (new API; old /rest/api/3/search returns 410)."""
+        key = ("search", jql, tuple(fields) if fields is not None else None, expand, max_results)
+        return self._memoized(key, lambda: self._search(jql, fields, expand, max_results))
+
+    def _search(self, jql, fields, expand, max_results):
         if max_results <= 0:
             return []
         all_issues = []
@@ -148,8 +278,62 @@ class JiraClient:
 
         return all_issues
 
+    def search_incremental(self, jql, fields=None, expand=None, max_results=1000):
+        """
+        search() that only re-downloads issues whose `updated` changed since the last run.
+        A cheap pass with fields=updated gives the current result set; changed or new keys are
+        fetched in full (key in (...) batches) and the rest come from the on-disk cache.
+        Falls back to a plain search() when JIRA_CACHE_DIR is not set, or when Jira rejects a key batch.
+        """
+        if not self.cache_dir:
+            return self.search(jql, fields=fields, expand=expand, max_results=max_results)
+        if fields is not None and "updated" not in fields:
+            fields = list(fields) + ["updated"]
+        cache_key = _json.dumps([jql, fields, expand])
+        path = os.path.join(self.cache_dir, "issues_" + hashlib.sha1(cache_key.encode("utf-8")).hexdigest() + ".json")
+        cached = {}
+        if os.path.exists(path):
+            try:
+                cached = _load_json_file(path)
+            except (OSError, ValueError):
+                cached = {}
+
+        index = self.search(jql, fields=["updated"], max_results=max_results)
+        stale = []
+        for it in index:
+            key = it.get("key")
+            prev = cached.get(key)
+            if prev is None or (prev.get("fields") or {}).get("updated") != (it.get("fields") or {}).get("updated"):
+                stale.append(key)
+        fresh = {}
+        try:
+            for i in range(0, len(stale), 100):
+                batch = stale[i:i + 100]
+                for it in self.search(f"key in ({', '.join(batch)})", fields=fields, expand=expand, max_results=len(batch)):
+                    fresh[it.get("key")] = it
+        except RuntimeError:
+            # Jira rejects the whole key-in JQL (400) if any key was deleted or hidden since the index query.
+            print("  (incremental: changed-issue fetch rejected; re-downloading the full result set)")
+            issues = self.search(jql, fields=fields, expand=expand, max_results=max_results)
+        else:
+            issues = []
+            for it in index:
+                key = it.get("key")
+                full = fresh.get(key) or cached.get(key)
+                if full is not None:
+                    issues.append(full)
+            print(f"  (incremental: {len(stale)} of {len(index)} issues re-downloaded)")
+        try:
+            _dump_json_file(path, {it.get("key"): it for it in issues})
+        except OSError:
+            pass
+        return issues
+
     def list_fields(self):
-        return self._get("/rest/api/3/field")
+        """All field definitions; fetched once per client (story points / team / sprint lookups share it)."""
+        if self._fields is None:
+            self._fields = self._get("/rest/api/3/field")
+        return self._fields
 
     def list_boards_for_project(self, project_key, max_results=50):
         # Jira Software Agile API
@@ -160,6 +344,10 @@ class JiraClient:
 
     def sprint_issues(self, sprint_id, fields=None, expand=None, max_results=1000):
         """Paginated: Agile API uses startAt (not nextPageToken)."""
+        key = ("sprint", sprint_id, tuple(fields) if fields is not None else None, expand, max_results)
+        return self._memoized(key, lambda: self._sprint_issues(sprint_id, fields, expand, max_results))
+
+    def _sprint_issues(self, sprint_id, fields, expand, max_results):
         if max_results <= 0:
             return []
         all_issues = []
@@ -203,6 +391,10 @@ class JiraClient:
 
     def board_issues(self, board_id, fields=None, max_results=2000):
         """Paginated: issues currently on a board (works for Kanban and Scrum)."""
+        key = ("board", board_id, tuple(fields) if fields is not None else None, max_results)
+        return self._memoized(key, lambda: self._board_issues(board_id, fields, max_results))
+
+    def _board_issues(self, board_id, fields, max_results):
         if max_results <= 0:
             return []
         all_issues = []
@@ -232,11 +424,58 @@ class JiraClient:
 def parse_dt(s):
     if not s:
         return None
+    if isinstance(s, str):
+        return _parse_iso_cached(s)
+    try:
+        return dtparser.isoparse(s)
+    except (TypeError, ValueError):
+        return None
+
+@lru_cache(maxsize=200000)
+def _parse_iso_cached(s):
+    """
+    Jira timestamps are strict ISO 8601 (e.g. 2026-01-05T10:00:00.000+0000), which
+    datetime.fromisoformat handles natively on Python 3.11+; dateutil covers the rest.
+    Memoized: the same created/resolutiondate strings are parsed by many helpers and scopes.
+    """
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
     try:
         return dtparser.isoparse(s)
     except (TypeError, ValueError):
         return None
 
+def run_parallel(fn, items, max_workers=None):
+    """Map fn over items on a bounded thread pool (Jira calls are I/O bound). Results keep input order."""
+    items = list(items)
+    if not items:
+        return []
+    workers = min(max_workers or JIRA_MAX_WORKERS, len(items))
+    if workers <= 1:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items))
+
+def _format_table(rows, columns):
+    """Plain-text table of dict rows (right-aligned columns, header first) for console summaries."""
+    def cell(v):
+        if v is None:
+            return "-"
+        return f"{v:.2f}" if isinstance(v, float) else str(v)
+
+    body = [[cell(r.get(c)) for c in columns] for r in rows]
+    widths = [max([len(c)] + [len(row[i]) for row in body]) for i, c in enumerate(columns)]
+    return "\n".join(
+        " ".join(v.rjust(w) for v, w in zip(row, widths))
+        for row in [list(columns)] + body
+    )
+
+def _top_n(counts, n):
+    """Top-n (key, count) items of a breakdown Counter as a dict, highest first (ties keep insertion order)."""
+    return dict(counts.most_common(n)) if counts else {}
+
 def iso_week(dt: datetime):
     y, w, _ = dt.isocalendar()
     return f"{y}-W{w:02d}"
@@ -244,7 +483,12 @@ def iso_week(dt: datetime):
 def percentile(values, p):
     if not values:
         return None
-    values = sorted(values)
+    return _percentile_sorted(sorted(values), p)
+
+def _percentile_sorted(values, p):
+    """Linear-interpolated percentile of an already sorted list (lets callers sort once for several p)."""
+    if not values:
+        return None
     k = (len(values) - 1) * (p / 100.0)
     f = math.floor(k)
     c = math.ceil(k)
@@ -266,6 +510,25 @@ def get_story_points_field_id(jira: JiraClient):
             candidates.append((fid, name))
     return candidates  # list of (id, name)
 
+def _story_points_getter(sp_field):
+    """
+    Per-issue story points reader for the sprint loop: 1.0 per issue when there is no story points
+    field, else the field as float (0.0 if missing/invalid). The field id is bound once, not looked up per call.
+    """
+    if not sp_field:
+        return lambda issue: 1.0
+
+    def get_sp(issue, _field=sp_field):
+        fields = issue.get("fields")
+        v = fields.get(_field) if fields else None
+        if v is None:
+            return 0.0
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            return 0.0
+    return get_sp
+
 def get_team_field_id(jira: JiraClient):
     """Find a custom field that looks like 'team' (e.g. Team, Squad, Development Team)."""
     fields = jira.list_fields()
@@ -288,6 +551,17 @@ def get_sprint_field_id(jira: JiraClient):
             return (fid, name)
     return (None, None)
 
+def get_epic_link_field_id(jira: JiraClient):
+    """Find the 'Epic Link' custom field (e.g. customfield_10014) so epic children can be grouped by epic."""
+    fields = jira.list_fields()
+    for f in fields:
+        fid, name = f.get("id"), (f.get("name") or "")
+        if fid is None or not name:
+            continue
+        if str(fid).startswith("customfield_") and name.strip().lower() == "epic link":
+            return (fid, name)
+    return (None, None)
+
 def _added_after_sprint_start(issues, sprint_id, sprint_name, start_dt, sprint_field_id):
     """
     Count issues that were added to this sprint after sprint start (via changelog).
@@ -299,13 +573,11 @@ def _added_after_sprint_start(issues, sprint_id, sprint_name, start_dt, sprint_f
     added_late_keys = []
     sprint_id_str = str(sprint_id)
     for it in issues:
-        histories = (it.get("changelog") or {}).get("histories") or []
         added_at = None  # when this issue was added to this sprint
-        for h in sorted(histories, key=lambda x: x.get("created", "")):
-            changed_at = parse_dt(h.get("created"))
+        for changed_at, _, items in _changelog(it):
             if not changed_at:
                 continue
-            for item in h.get("items") or []:
+            for item in items:
                 if item.get("field") != sprint_field_id and item.get("field") != "Sprint":
                     continue
                 to_val = item.get("to")
@@ -322,40 +594,23 @@ def _added_after_sprint_start(issues, sprint_id, sprint_name, start_dt, sprint_f
     return (len(added_late_keys), added_late_keys)
 
 def _component_breakdown(issues):
-    """Return dict: component name -> issue count. Issues can have 0 or more components."""
-    c = Counter()
-    for it in issues:
-        comps = (it.get("fields") or {}).get("components")
-        if not isinstance(comps, list):
-            c["(no component)"] += 1
-            continue
-        for comp in comps:
-            if isinstance(comp, dict):
-                name = comp.get("name") or comp.get("id") or "?"
-                c[name] += 1
-        if not comps:
-            c["(no component)"] += 1
-    return dict(c)
+    """Return Counter: component name -> issue count. Issues can have 0 or more components."""
+    return Counter(name for it in issues for name in _issue_components(it))
 
 def _team_breakdown(issues, team_field_id):
-    """Return dict: team value/name -> issue count. team_field_id is custom field id."""
+    """Return Counter: team value/name -> issue count. team_field_id is custom field id."""
     if not team_field_id:
-        return {}
-    c = Counter()
-    for it in issues:
-        raw = (it.get("fields") or {}).get(team_field_id)
-        if raw is None:
-            c["(no team)"] += 1
-            continue
-        if isinstance(raw, list):
-            for x in raw:
-                label = _team_field_value_to_label(x)
-                c[label] += 1
-            if not raw:
-                c["(no team)"] += 1
-        else:
-            c[_team_field_value_to_label(raw)] += 1
-    return dict(c)
+        return Counter()
+    return Counter(label for it in issues for label in _issue_team_labels(it, team_field_id))
+
+def _issue_team_labels(issue, team_field_id):
+    """Team labels for an issue (multi-value team fields give several); '(no team)' if unset."""
+    raw = (issue.get("fields") or {}).get(team_field_id)
+    if raw is None:
+        return ["(no team)"]
+    if isinstance(raw, list):
+        return [_team_field_value_to_label(x) for x in raw] or ["(no team)"]
+    return [_team_field_value_to_label(raw)]
 
 def _team_field_value_to_label(x):
     if x is None:
@@ -385,22 +640,40 @@ def categorize_status(issues):
     return c
 
 def throughput_weekly(issues, done_date_field="resolutiondate"):
+    if done_date_field == "resolutiondate":
+        return Counter(wk for wk in map(_resolved_week, issues) if wk)
     weekly = Counter()
     for it in issues:
         dt = parse_dt((it.get("fields") or {}).get(done_date_field))
-        if not dt:
-            continue
-        weekly[iso_week(dt)] += 1
+        if dt:
+            weekly[iso_week(dt)] += 1
     return weekly
 
 def lead_time_days(issue):
     fields = issue.get("fields") or {}
     created = parse_dt(fields.get("created"))
-    resolved = parse_dt(fields.get("resolutiondate"))
+    resolved = _resolved_dt(issue)
     if created and resolved:
         return (resolved - created).total_seconds() / 86400.0
     return None
 
+def _changelog(issue):
+    """
+    Changelog histories as (changed_at or None, author, items) tuples, oldest first.
+    Sorted and parsed once per issue and cached: cycle time, status paths/transitions,
+    assignee changes and sprint scope checks all walk it.
+    """
+    cached = issue.get("_changelog")
+    if cached is not None:
+        return cached
+    histories = (issue.get("changelog") or {}).get("histories") or []
+    hist = [
+        (parse_dt(h.get("created")), h.get("author") or {}, h.get("items") or [])
+        for h in sorted(histories, key=lambda x: x.get("created", ""))
+    ]
+    issue["_changelog"] = hist
+    return hist
+
 def cycle_time_days_from_changelog(issue):
     """
     Cycle time = time between first entering an "in progress" category and reaching "done".
@@ -408,17 +681,15 @@ def cycle_time_days_from_changelog(issue):
     """
     fields = issue.get("fields") or {}
     created = parse_dt(fields.get("created"))
-    resolved = parse_dt(fields.get("resolutiondate"))
+    resolved = _resolved_dt(issue)
     if not resolved:
         return None
 
-    histories = (issue.get("changelog") or {}).get("histories", [])
     in_progress_start = None
 
     # Find first time it moved into INPROGRESS_CATEGORY
-    for h in sorted(histories, key=lambda x: x.get("created", "")):
-        changed_at = parse_dt(h.get("created"))
-        for item in h.get("items", []):
+    for changed_at, _, items in _changelog(issue):
+        for item in items:
             if item.get("field") == "status":
                 # We only have status names here, but we can approximate via current statuses mapping if needed.
                 # As a practical heuristic: treat any transition to a status containing "In Progress", "Doing", "Dev", "Review" as in progress.
@@ -435,15 +706,15 @@ def cycle_time_days_from_changelog(issue):
     return None
 
 def summarize_time_metrics(values):
-    values = [v for v in values if v is not None and v >= 0]
+    values = sorted(v for v in values if v is not None and v >= 0)
     if not values:
         return {}
     return {
         "count": len(values),
         "avg_days": sum(values) / len(values),
-        "p50_days": percentile(values, 50),
-        "p85_days": percentile(values, 85),
-        "p95_days": percentile(values, 95),
+        "p50_days": _percentile_sorted(values, 50),
+        "p85_days": _percentile_sorted(values, 85),
+        "p95_days": _percentile_sorted(values, 95),
     }
 
 def bug_age_days(issue, now=None):
@@ -454,11 +725,54 @@ def bug_age_days(issue, now=None):
     return (now - created).total_seconds() / 86400.0
 
 def _is_done(issue):
-    """True if issue is in done status category; avoids KeyError on malformed data."""
+    """True if issue is in done status category; avoids KeyError on malformed data. Cached on the issue."""
+    done = issue.get("_done")
+    if done is None:
+        try:
+            done = issue["fields"]["status"]["statusCategory"]["key"] == DONE_CATEGORY
+        except (KeyError, TypeError):
+            done = False
+        issue["_done"] = done
+    return done
+
+def _created_week(issue):
+    """ISO week of fields.created (or None); cached on the issue for the weekly trend helpers."""
     try:
-        return issue["fields"]["status"]["statusCategory"]["key"] == DONE_CATEGORY
-    except (KeyError, TypeError):
-        return False
+        return issue["_created_week"]
+    except KeyError:
+        dt = parse_dt((issue.get("fields") or {}).get("created"))
+        week = issue["_created_week"] = iso_week(dt) if dt else None
+        return week
+
+def _resolved_week(issue):
+    """ISO week of the resolution date (or None); cached on the issue."""
+    try:
+        return issue["_resolved_week"]
+    except KeyError:
+        dt = _resolved_dt(issue)
+        week = issue["_resolved_week"] = iso_week(dt) if dt else None
+        return week
+
+def _resolved_month(issue):
+    """YYYY-MM of the resolution date (or None); cached on the issue."""
+    try:
+        return issue["_resolved_month"]
+    except KeyError:
+        dt = _resolved_dt(issue)
+        month = issue["_resolved_month"] = f"{dt.year:04d}-{dt.month:02d}" if dt else None
+        return month
+
+def _done_only(issues):
+    """Done-category subset, filtered once and shared by the done-only changelog/worklog helpers."""
+    return [it for it in issues if _is_done(it)]
+
+def _resolved_dt(issue):
+    """Parsed fields.resolutiondate (or None); cached on the issue since most helpers need it."""
+    try:
+        return issue["_resolved_dt"]
+    except KeyError:
+        dt = issue["_resolved_dt"] = parse_dt((issue.get("fields") or {}).get("resolutiondate"))
+        return dt
 
 
 # ----------------------------
@@ -575,52 +889,50 @@ def _status_by_component(issues):
         status_name = st.get("name") if isinstance(st, dict) else None
         if not status_name:
             continue
-        comps = (it.get("fields") or {}).get("components")
-        if not isinstance(comps, list) or not comps:
-            result["(no component)"][status_name] += 1
-        else:
-            for comp in comps:
-                if isinstance(comp, dict):
-                    name = comp.get("name") or comp.get("id") or "?"
-                    result[name][status_name] += 1
+        for name in _issue_components(it):
+            result[name][status_name] += 1
     return {k: dict(v) for k, v in result.items()}
 
+def _resolution_name(fields):
+    res = fields.get("resolution")
+    return (res.get("name") if isinstance(res, dict) else None) or "(unresolved)"
+
+def _issuetype_name(fields):
+    itype = fields.get("issuetype")
+    return (itype.get("name") if isinstance(itype, dict) else None) or "(unknown)"
+
+def _priority_name(fields):
+    pri = fields.get("priority")
+    return (pri.get("name") if isinstance(pri, dict) else None) or "(none)"
+
+def _assignee_name(fields):
+    assignee = fields.get("assignee")
+    if assignee and isinstance(assignee, dict):
+        return assignee.get("displayName") or assignee.get("name") or "?"
+    return "(unassigned)"
+
 def _resolution_breakdown(issues):
     """Counter of resolution types for done issues."""
-    c = Counter()
-    for it in issues:
-        res = (it.get("fields") or {}).get("resolution")
-        name = res.get("name") if isinstance(res, dict) else None
-        c[name or "(unresolved)"] += 1
-    return dict(c)
+    return Counter(_resolution_name(it.get("fields") or {}) for it in issues)
 
 def _issuetype_breakdown(issues):
-    c = Counter()
-    for it in issues:
-        itype = (it.get("fields") or {}).get("issuetype")
-        name = itype.get("name") if isinstance(itype, dict) else None
-        c[name or "(unknown)"] += 1
-    return dict(c)
+    return Counter(_issuetype_name(it.get("fields") or {}) for it in issues)
 
 def _priority_breakdown(issues):
-    c = Counter()
-    for it in issues:
-        pri = (it.get("fields") or {}).get("priority")
-        name = pri.get("name") if isinstance(pri, dict) else None
-        c[name or "(none)"] += 1
-    return dict(c)
+    return Counter(_priority_name(it.get("fields") or {}) for it in issues)
 
 def _unassigned_count(issues):
     return sum(1 for it in issues if not (it.get("fields") or {}).get("assignee"))
 
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 def _resolution_by_weekday(issues):
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
     c = Counter()
     for it in issues:
-        dt = parse_dt((it.get("fields") or {}).get("resolutiondate"))
+        dt = _resolved_dt(it)
         if dt:
-            c[days[dt.weekday()]] += 1
-    return {d: c.get(d, 0) for d in days}
+            c[_WEEKDAYS[dt.weekday()]] += 1
+    return {d: c.get(d, 0) for d in _WEEKDAYS}
 
 def _velocity_cv(throughputs):
     """Coefficient of variation = std/mean. Returns None if < 2 data points."""
@@ -633,15 +945,7 @@ def _velocity_cv(throughputs):
     return round((variance ** 0.5) / mean, 3)
 
 def _assignee_breakdown(issues):
-    c = Counter()
-    for it in issues:
-        assignee = (it.get("fields") or {}).get("assignee")
-        if assignee and isinstance(assignee, dict):
-            name = assignee.get("displayName") or assignee.get("name") or "?"
-            c[name] += 1
-        else:
-            c["(unassigned)"] += 1
-    return dict(c)
+    return Counter(_assignee_name(it.get("fields") or {}) for it in issues)
 
 def _gini_coefficient(counts):
     """Gini coefficient (0 = equal, 1 = one person does everything)."""
@@ -652,22 +956,62 @@ def _gini_coefficient(counts):
     total = sum(counts)
     if total == 0:
         return 0.0
-    cumulative = 0
-    gini_sum = 0
-    for i, x in enumerate(counts):
-        cumulative += x
-        gini_sum += (2 * (i + 1) - n - 1) * x
+    # sum((2i - n - 1) * x_i) for 1-based rank i, folded into one weighted sum
+    gini_sum = 2 * sum(i * x for i, x in enumerate(counts, 1)) - (n + 1) * total
     return round(gini_sum / (n * total), 3)
 
 def _bulk_closures(issues, threshold=10):
     """Days with > threshold resolutions."""
     daily = Counter()
     for it in issues:
-        dt = parse_dt((it.get("fields") or {}).get("resolutiondate"))
+        dt = _resolved_dt(it)
         if dt:
-            daily[dt.strftime("%Y-%m-%d")] += 1
+            daily[dt.date().isoformat()] += 1
+    return _bulk_closure_rows(daily, threshold)
+
+def _bulk_closure_rows(daily, threshold=10):
     return [{"date": d, "count": c} for d, c in sorted(daily.items()) if c > threshold]
 
+def _done_issue_breakdowns(issues, bulk_threshold=10):
+    """
+    One pass over a done-issue list for the per-issue breakdowns main() and _scope_metrics report:
+    resolution, issue type, assignee, weekday, bulk closure days and description/comment/link hygiene.
+    Same results as the individual helpers, but each issue's fields are read (and resolutiondate parsed) once.
+    """
+    resolution = Counter()
+    issuetype = Counter()
+    assignees = Counter()
+    weekday = Counter()
+    daily = Counter()
+    empty_desc = zero_comment = orphan = 0
+    min_len = EMPTY_OR_BAD_DESCRIPTION_MIN_LEN
+    for it in issues:
+        fields = it.get("fields") or {}
+        resolution[_resolution_name(fields)] += 1
+        issuetype[_issuetype_name(fields)] += 1
+        assignees[_assignee_name(fields)] += 1
+        dt = _resolved_dt(it)
+        if dt:
+            weekday[_WEEKDAYS[dt.weekday()]] += 1
+            daily[dt.date().isoformat()] += 1
+        if _is_empty_description(it, min_len=min_len):
+            empty_desc += 1
+        if _has_no_comments(fields):
+            zero_comment += 1
+        if _has_no_links(fields):
+            orphan += 1
+    n = len(issues)
+    return {
+        "resolution_breakdown": resolution,
+        "issuetype": issuetype,
+        "assignees": assignees,
+        "resolution_by_weekday": {d: weekday.get(d, 0) for d in _WEEKDAYS},
+        "bulk_closure_days": _bulk_closure_rows(daily, bulk_threshold),
+        "empty_description_pct": round(empty_desc / n * 100, 1) if n else 0,
+        "zero_comment_pct": round(zero_comment / n * 100, 1) if n else 0,
+        "orphan_pct": round(orphan / n * 100, 1) if n else 0,
+    }
+
 
 # ----------------------------
 # Phase 2 helper functions (changelog mining)
@@ -677,40 +1021,23 @@ _ACTIVE_STATUS_KEYWORDS = frozenset({
     "qa", "code review", "for review", "staging", "in testing",
 })
 
+@lru_cache(maxsize=256)
 def _is_active_status(name):
+    # Called per changelog transition but only sees a few dozen distinct status names.
     lower = (name or "").strip().lower()
     return lower in _ACTIVE_STATUS_KEYWORDS or any(
         k in lower for k in ("progress", "dev", "doing", "review", "test"))
 
 def _status_path_analysis(issues):
-    """Reconstruct status paths from changelog; detect issues that skip active work."""
+    """Reconstruct status paths from changelog; detect issues that skip active work. Expects done issues (_done_only)."""
     paths = Counter()
     skip_count = 0
     total = 0
 
     for it in issues:
-        if not _is_done(it):
-            continue
         total += 1
-        histories = (it.get("changelog") or {}).get("histories", [])
-        status_changes = []
-        for h in sorted(histories, key=lambda x: x.get("created", "")):
-            for item in h.get("items", []):
-                if item.get("field") == "status":
-                    status_changes.append(item.get("toString") or "")
-
-        if not status_changes:
-            st = (it.get("fields") or {}).get("status")
-            if isinstance(st, dict) and st.get("name"):
-                status_changes = [st["name"]]
-
-        if len(status_changes) > 5:
-            path_str = " -> ".join(status_changes[:2]) + " -> ... -> " + " -> ".join(status_changes[-2:])
-        else:
-            path_str = " -> ".join(status_changes) if status_changes else "(no transitions)"
+        path_str, visited_active = _status_path(it)
         paths[path_str] += 1
-
-        visited_active = any(_is_active_status(s) for s in status_changes[:-1])
         if not visited_active:
             skip_count += 1
 
@@ -721,84 +1048,124 @@ def _status_path_analysis(issues):
         "top_paths": [{"path": p, "count": c} for p, c in paths.most_common(15)],
     }
 
-def _time_in_status(issues):
-    """Compute time in each status from changelog transitions."""
-    status_durations = defaultdict(list)
+def _status_path(issue):
+    """(path string, visited an active status) for one issue; cached so every scope reuses it."""
+    cached = issue.get("_status_path")
+    if cached is not None:
+        return cached
+    status_changes = []
+    for _, _, items in _changelog(issue):
+        for item in items:
+            if item.get("field") == "status":
+                status_changes.append(item.get("toString") or "")
 
-    for it in issues:
-        fields = it.get("fields") or {}
-        created = parse_dt(fields.get("created"))
-        resolved = parse_dt(fields.get("resolutiondate"))
-        histories = (it.get("changelog") or {}).get("histories", [])
+    if not status_changes:
+        st = (issue.get("fields") or {}).get("status")
+        if isinstance(st, dict) and st.get("name"):
+            status_changes = [st["name"]]
 
-        transitions = []
-        for h in sorted(histories, key=lambda x: x.get("created", "")):
-            changed_at = parse_dt(h.get("created"))
-            if not changed_at:
-                continue
-            for item in h.get("items", []):
-                if item.get("field") == "status":
-                    transitions.append({
-                        "at": changed_at,
-                        "from": item.get("fromString") or "",
-                        "to": item.get("toString") or "",
-                    })
-
-        if not transitions:
-            continue
+    if len(status_changes) > 5:
+        path_str = " -> ".join(status_changes[:2]) + " -> ... -> " + " -> ".join(status_changes[-2:])
+    else:
+        path_str = " -> ".join(status_changes) if status_changes else "(no transitions)"
+    visited_active = any(_is_active_status(s) for s in status_changes[:-1])
+    issue["_status_path"] = (path_str, visited_active)
+    return issue["_status_path"]
 
-        prev_time = created
-        prev_status = transitions[0]["from"] if transitions else None
-        for t in transitions:
+def _status_transitions(issue):
+    """
+    Status transitions from changelog as (changed_at, from, to, author) tuples, oldest first.
+    Computed once per issue and cached on the issue dict (several changelog metrics reuse it).
+    """
+    cached = issue.get("_status_transitions")
+    if cached is not None:
+        return cached
+    transitions = []
+    for changed_at, author, items in _changelog(issue):
+        if not changed_at:
+            continue
+        for item in items:
+            if item.get("field") == "status":
+                transitions.append((changed_at, item.get("fromString") or "", item.get("toString") or "", author))
+    issue["_status_transitions"] = transitions
+    return transitions
+
+def _status_durations(issue):
+    """(status, hours) spans for one issue from its transitions; cached so every scope reuses it."""
+    cached = issue.get("_status_durations")
+    if cached is not None:
+        return cached
+    durations = []
+    transitions = _status_transitions(issue)
+    if transitions:
+        prev_time = parse_dt((issue.get("fields") or {}).get("created"))
+        prev_status = transitions[0][1]
+        for changed_at, _, to_status, _ in transitions:
             if prev_time and prev_status:
-                hours = (t["at"] - prev_time).total_seconds() / 3600.0
+                hours = (changed_at - prev_time).total_seconds() / 3600.0
                 if hours >= 0:
-                    status_durations[prev_status].append(hours)
-            prev_status = t["to"]
-            prev_time = t["at"]
+                    durations.append((prev_status, hours))
+            prev_status = to_status
+            prev_time = changed_at
 
+        resolved = _resolved_dt(issue)
         if prev_status and prev_time and resolved:
             hours = (resolved - prev_time).total_seconds() / 3600.0
             if hours >= 0:
-                status_durations[prev_status].append(hours)
+                durations.append((prev_status, hours))
+    issue["_status_durations"] = durations
+    return durations
+
+def _time_in_status(issues):
+    """Compute time in each status from changelog transitions."""
+    status_durations = defaultdict(list)
+
+    for it in issues:
+        for status, hours in _status_durations(it):
+            status_durations[status].append(hours)
 
     result = {}
     for status, durations in status_durations.items():
         if not durations:
             continue
-        durations_sorted = sorted(durations)
+        durations.sort()
         result[status] = {
-            "median_hours": round(percentile(durations_sorted, 50), 2),
-            "avg_hours": round(sum(durations_sorted) / len(durations_sorted), 2),
-            "count": len(durations_sorted),
+            "median_hours": round(_percentile_sorted(durations, 50), 2),
+            "avg_hours": round(sum(durations) / len(durations), 2),
+            "count": len(durations),
         }
     return result
 
+_DONE_STATUS_KEYWORDS = ("done", "closed", "resolved", "complete", "finished")
+
+@lru_cache(maxsize=256)
+def _is_done_status_name(name):
+    lower = (name or "").lower()
+    return any(k in lower for k in _DONE_STATUS_KEYWORDS)
+
+def _closer_name(issue):
+    """Author of the last transition into a done status ("" if none); cached on the issue."""
+    cached = issue.get("_closer")
+    if cached is not None:
+        return cached
+    closer = ""
+    for _, _, to_status, author in reversed(_status_transitions(issue)):
+        if _is_done_status_name(to_status):
+            closer = author.get("displayName") or author.get("name") or "?"
+            break
+    issue["_closer"] = closer
+    return closer
+
 def _closer_analysis(issues):
-    """Who makes the final transition to done status vs assignee."""
+    """Who makes the final transition to done status vs assignee. Expects done issues (_done_only)."""
     closers = Counter()
     closer_not_assignee = 0
     total = 0
     with_closer = 0
-    DONE_KW = {"done", "closed", "resolved", "complete", "finished"}
 
     for it in issues:
-        if not _is_done(it):
-            continue
         total += 1
-        histories = (it.get("changelog") or {}).get("histories", [])
-        closer = None
-        for h in sorted(histories, key=lambda x: x.get("created", ""), reverse=True):
-            for item in h.get("items", []):
-                if item.get("field") == "status":
-                    to_lower = (item.get("toString") or "").lower()
-                    if any(k in to_lower for k in DONE_KW):
-                        author = h.get("author") or {}
-                        closer = author.get("displayName") or author.get("name") or "?"
-                        break
-            if closer:
-                break
-
+        closer = _closer_name(it)
         if closer:
             with_closer += 1
             closers[closer] += 1
@@ -815,25 +1182,31 @@ def _closer_analysis(issues):
         "closer_not_assignee_pct": round(closer_not_assignee / with_closer * 100, 1) if with_closer else 0,
     }
 
+def _was_reopened(issue):
+    """True if the issue ever moved from a done status back to a non-done one; cached on the issue."""
+    cached = issue.get("_reopened")
+    if cached is not None:
+        return cached
+    reopened = False
+    was_done = False
+    for _, _, to_status, _ in _status_transitions(issue):
+        if _is_done_status_name(to_status):
+            was_done = True
+        elif was_done:
+            reopened = True
+            break
+    issue["_reopened"] = reopened
+    return reopened
+
 def _reopen_count(issues):
-    """Count issues re-opened (done -> non-done transition in changelog)."""
+    """Count issues re-opened at least once (done -> non-done transition in changelog)."""
     reopened = 0
     total = 0
-    DONE_KW = {"done", "closed", "resolved", "complete", "finished"}
 
     for it in issues:
         total += 1
-        histories = (it.get("changelog") or {}).get("histories", [])
-        was_done = False
-        for h in sorted(histories, key=lambda x: x.get("created", "")):
-            for item in h.get("items", []):
-                if item.get("field") == "status":
-                    to_lower = (item.get("toString") or "").lower()
-                    if any(k in to_lower for k in DONE_KW):
-                        was_done = True
-                    elif was_done:
-                        reopened += 1
-                        was_done = False
+        if _was_reopened(it):
+            reopened += 1
 
     return {
         "total": total,
@@ -859,6 +1232,17 @@ def _flow_efficiency(time_in_status_data):
         "efficiency_pct": round(active_total / total * 100, 1) if total > 0 else 0,
     }
 
+def _removed_from_sprint_count(report):
+    """Length of issueKeysRemovedFromSprint in a sprint (scope) report, or None if the report has no such list."""
+    if not isinstance(report, dict):
+        return None
+    contents = report.get("contents") or report.get("completedIssues")
+    if isinstance(contents, dict) and "issueKeysRemovedFromSprint" in contents:
+        removed = contents["issueKeysRemovedFromSprint"] or []
+    else:
+        removed = report.get("issueKeysRemovedFromSprint")
+    return len(removed) if isinstance(removed, list) else None
+
 def _sprint_end_closures(sprint_issues, sprint_end_dt):
     """Count issues resolved in the final 24h of a sprint."""
     if not sprint_end_dt:
@@ -871,7 +1255,7 @@ def _sprint_end_closures(sprint_issues, sprint_end_dt):
         if not _is_done(it):
             continue
         total_done += 1
-        resolved = parse_dt((it.get("fields") or {}).get("resolutiondate"))
+        resolved = _resolved_dt(it)
         if resolved and resolved >= cutoff and resolved <= upper:
             last_24h += 1
     pct = round(last_24h / total_done * 100, 1) if total_done else 0
@@ -892,28 +1276,28 @@ def _empty_description_pct(issues, min_len=None):
             empty += 1
     return round(empty / len(issues) * 100, 1)
 
+def _has_no_comments(fields):
+    comment = fields.get("comment")
+    if comment is None:
+        return True
+    if isinstance(comment, dict):
+        return comment.get("total", 0) == 0
+    return isinstance(comment, list) and len(comment) == 0
+
+def _has_no_links(fields):
+    links = fields.get("issuelinks")
+    return not links or (isinstance(links, list) and len(links) == 0)
+
 def _zero_comment_pct(issues):
     if not issues:
         return 0
-    zero = 0
-    for it in issues:
-        comment = (it.get("fields") or {}).get("comment")
-        if comment is None:
-            zero += 1
-        elif isinstance(comment, dict) and comment.get("total", 0) == 0:
-            zero += 1
-        elif isinstance(comment, list) and len(comment) == 0:
-            zero += 1
+    zero = sum(1 for it in issues if _has_no_comments(it.get("fields") or {}))
     return round(zero / len(issues) * 100, 1)
 
 def _orphan_pct(issues):
     if not issues:
         return 0
-    orphan = 0
-    for it in issues:
-        links = (it.get("fields") or {}).get("issuelinks")
-        if not links or (isinstance(links, list) and len(links) == 0):
-            orphan += 1
+    orphan = sum(1 for it in issues if _has_no_links(it.get("fields") or {}))
     return round(orphan / len(issues) * 100, 1)
 
 
@@ -943,16 +1327,17 @@ def _is_empty_or_bad_structure(
         description_min_len = EMPTY_OR_BAD_DESCRIPTION_MIN_LEN
     if _is_empty_description(issue, min_len=description_min_len):
         return True
+    fields = issue.get("fields") or {}
     if summary_min_length > 0:
-        summary = (issue.get("fields") or {}).get("summary")
+        summary = fields.get("summary")
         if summary is None or (isinstance(summary, str) and len(summary.strip()) < summary_min_length):
             return True
     if bad_if_no_labels:
-        labels = (issue.get("fields") or {}).get("labels")
+        labels = fields.get("labels")
         if not labels or (isinstance(labels, list) and len(labels) == 0):
             return True
     if bad_if_no_component:
-        comps = (issue.get("fields") or {}).get("components")
+        comps = fields.get("components")
         if not comps or (isinstance(comps, list) and len(comps) == 0):
             return True
     return False
@@ -1031,7 +1416,7 @@ def _empty_or_bad_list_details(issues, summary_max_len=60, team_field_id=None):
 
 
 def _label_breakdown(issues):
-    """Return dict: label name -> issue count. An issue can appear under multiple labels. '(no label)' for none."""
+    """Return Counter: label name -> issue count. An issue can appear under multiple labels. '(no label)' for none."""
     c = Counter()
     for it in issues:
         labels = (it.get("fields") or {}).get("labels")
@@ -1044,7 +1429,7 @@ def _label_breakdown(issues):
             elif isinstance(lab, dict):
                 c[lab.get("name") or lab.get("value") or "?"] += 1
         # If it has labels, we don't add to (no label); we've already counted each label.
-    return dict(c)
+    return c
 
 
 def _project_key(issue):
@@ -1085,7 +1470,8 @@ def _select_project_board(project_key, boards):
             points += 2
         return (points, -(board.get("id") or 0))
 
-    return sorted(boards, key=score, reverse=True)[0]
+    # max() keeps the first of equal scores, like sorted(reverse=True)[0] did.
+    return max(boards, key=score)
 
 
 def _scope_metrics(
@@ -1103,9 +1489,11 @@ def _scope_metrics(
     ages = [bug_age_days(it, now=now) for it in wip_list]
     ages = [a for a in ages if a is not None]
     status_dist = dict(status_distribution(wip_list))
-    ab_done = _assignee_breakdown(done_list)
+    done_bd = _done_issue_breakdowns(done_list)
+    ab_done = done_bd["assignees"]
     ac_done = [v for k, v in ab_done.items() if k != "(unassigned)"]
     tis = _time_in_status(done_90_list)
+    done_90_only = _done_only(done_90_list)
 
     lead_vals = [lead_time_days(it) for it in done_list]
     lead_vals = [v for v in lead_vals if v is not None]
@@ -1132,28 +1520,28 @@ def _scope_metrics(
         "lead_time_distribution": lead_time_distribution(done_list),
         "cycle_time_days": summarize_time_metrics(cycle_vals) if cycle_vals else None,
         "wip_issuetype": _issuetype_breakdown(wip_list),
-        "done_issuetype": _issuetype_breakdown(done_list),
+        "done_issuetype": done_bd["issuetype"],
         "wip_priority": _priority_breakdown(wip_list),
         "unassigned_open_count": unassigned_open,
         "unassigned_wip_count": unassigned_open,  # backward compatibility
-        "resolution_breakdown": _resolution_breakdown(done_list),
-        "resolution_by_weekday": _resolution_by_weekday(done_list),
-        "done_assignees": dict(sorted(ab_done.items(), key=lambda x: -x[1])[:20]),
+        "resolution_breakdown": done_bd["resolution_breakdown"],
+        "resolution_by_weekday": done_bd["resolution_by_weekday"],
+        "done_assignees": _top_n(ab_done, 20),
         "workload_gini": _gini_coefficient(ac_done),
-        "bulk_closure_days": _bulk_closures(done_list),
-        "status_path_analysis": _status_path_analysis(done_90_list),
+        "bulk_closure_days": done_bd["bulk_closure_days"],
+        "status_path_analysis": _status_path_analysis(done_90_only),
         "time_in_status": tis,
-        "closer_analysis": _closer_analysis(done_90_list),
+        "closer_analysis": _closer_analysis(done_90_only),
         "reopen_analysis": _reopen_count(done_90_list),
         "flow_efficiency": _flow_efficiency(tis),
         "empty_description_wip_pct": _empty_description_pct(wip_list),
-        "empty_description_done_pct": _empty_description_pct(done_list),
-        "zero_comment_done_pct": _zero_comment_pct(done_list),
-        "orphan_done_pct": _orphan_pct(done_list),
-        "wip_assignees": dict(sorted(_assignee_breakdown(wip_list).items(), key=lambda x: -x[1])[:20]),
-        "assignee_change_near_resolution": _assignee_change_near_resolution(done_90_list),
-        "comment_timing": _comment_timing(done_90_list),
-        "worklog_analysis": _worklog_analysis(done_90_list, sp_field=story_points_field),
+        "empty_description_done_pct": done_bd["empty_description_pct"],
+        "zero_comment_done_pct": done_bd["zero_comment_pct"],
+        "orphan_done_pct": done_bd["orphan_pct"],
+        "wip_assignees": _top_n(_assignee_breakdown(wip_list), 20),
+        "assignee_change_near_resolution": _assignee_change_near_resolution(done_90_only),
+        "comment_timing": _comment_timing(done_90_only),
+        "worklog_analysis": _worklog_analysis(done_90_only, sp_field=story_points_field),
         "created_by_week": _created_by_week(created_list),
         "sp_trend": _sp_trend(done_list, story_points_field),
         "bug_creation_by_week": _bug_creation_by_week(done_list, open_bug_list),
@@ -1165,38 +1553,79 @@ def _scope_metrics(
     return metrics
 
 
+def _scope_metrics_job(kwargs):
+    return _scope_metrics(**kwargs)
+
+
+def compute_scope_metrics(jobs):
+    """
+    Run _scope_metrics(**kwargs) for each job. Scopes share no state, so with JIRA_SCOPE_PROCESSES > 1
+    they are spread over a process pool; falls back to serial if the pool cannot start or a job cannot be pickled.
+    """
+    jobs = list(jobs)
+    workers = min(JIRA_SCOPE_PROCESSES, len(jobs))
+    if workers > 1:
+        # Scope sizes are very uneven (whole projects vs single components): hand out the biggest
+        # first, one at a time, so no worker is left finishing a large scope while the rest idle.
+        order = sorted(range(len(jobs)), key=lambda i: -_scope_job_size(jobs[i]))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                computed = list(ex.map(_scope_metrics_job, [jobs[i] for i in order]))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"  Process pool unavailable ({e}); computing scopes serially.")
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            # A job holding something that can't be pickled (e.g. a lock or local function in an issue dict).
+            print(f"  Scope job could not be sent to the process pool ({e}); computing scopes serially.")
+        else:
+            results = [None] * len(jobs)
+            for i, metrics in zip(order, computed):
+                results[i] = metrics
+            return results
+    return [_scope_metrics(**job) for job in jobs]
+
+
+def _scope_job_size(job):
+    """Rough cost of a scope: issue count, with changelog-bearing done_90 issues weighted higher."""
+    return (len(job["wip_list"]) + len(job["blocked_list"]) + len(job["done_list"]) +
+            len(job["open_bug_list"]) + len(job["created_list"]) + 4 * len(job["done_90_list"]))
+
+
 # ----------------------------
 # Phase 4/5/6: New metric helpers
 # ----------------------------
 
+def _late_assignee_changer(issue, hours):
+    """Who made the last assignee change within `hours` before resolution (None if nobody); cached per window."""
+    cached = issue.get("_late_assignee_change")
+    if cached is not None and cached[0] == hours:
+        return cached[1]
+    changer = None
+    resolved = _resolved_dt(issue)
+    if resolved:
+        cutoff = resolved - timedelta(hours=hours)
+        # Newest first: the first assignee change found is the latest; stop once past the cutoff.
+        for changed_at, author, items in reversed(_changelog(issue)):
+            if not changed_at:
+                continue
+            if changed_at < cutoff:
+                break
+            if any(item.get("field") == "assignee" for item in items):
+                changer = author.get("displayName") or "?"
+                break
+    issue["_late_assignee_change"] = (hours, changer)
+    return changer
+
 def _assignee_change_near_resolution(issues, hours=24):
-    """Detect issues where assignee changed within last N hours before resolution (from changelog)."""
+    """Detect issues where assignee changed within last N hours before resolution (from changelog). Expects done issues."""
     total = 0
     changed = 0
     offenders = Counter()
     for it in issues:
-        if not _is_done(it):
-            continue
         total += 1
-        resolved = parse_dt((it.get("fields") or {}).get("resolutiondate"))
-        if not resolved:
-            continue
-        cutoff = resolved - timedelta(hours=hours)
-        histories = (it.get("changelog") or {}).get("histories", [])
-        found = False
-        for h in sorted(histories, key=lambda x: x.get("created", ""), reverse=True):
-            changed_at = parse_dt(h.get("created"))
-            if not changed_at or changed_at < cutoff:
-                break
-            for item in h.get("items", []):
-                if item.get("field") == "assignee":
-                    changed += 1
-                    author = h.get("author") or {}
-                    offenders[author.get("displayName") or "?"] += 1
-                    found = True
-                    break
-            if found:
-                break
+        changer = _late_assignee_changer(it, hours)
+        if changer is not None:
+            changed += 1
+            offenders[changer] += 1
     return {
         "total": total,
         "changed_count": changed,
@@ -1205,35 +1634,40 @@ def _assignee_change_near_resolution(issues, hours=24):
     }
 
 
-def _comment_timing(issues):
-    """Analyze comment timing relative to resolution date."""
-    total_issues = 0
-    with_post_resolution = 0
-    total_comments = 0
-    post_res_comments = 0
-    for it in issues:
-        if not _is_done(it):
-            continue
-        total_issues += 1
-        resolved = parse_dt((it.get("fields") or {}).get("resolutiondate"))
-        if not resolved:
-            continue
-        comment = (it.get("fields") or {}).get("comment")
+def _comment_counts(issue):
+    """(comments, comments after resolution) for one resolved issue, (0, 0) otherwise; cached on the issue."""
+    cached = issue.get("_comment_counts")
+    if cached is not None:
+        return cached
+    n_comments = n_post = 0
+    resolved = _resolved_dt(issue)
+    if resolved:
+        comment = (issue.get("fields") or {}).get("comment")
         comments = []
         if isinstance(comment, dict):
             comments = comment.get("comments", [])
         elif isinstance(comment, list):
             comments = comment
-        if not comments:
-            continue
-        has_post = False
         for c in comments:
-            total_comments += 1
+            n_comments += 1
             created = parse_dt(c.get("created"))
             if created and created > resolved:
-                post_res_comments += 1
-                has_post = True
-        if has_post:
+                n_post += 1
+    issue["_comment_counts"] = (n_comments, n_post)
+    return issue["_comment_counts"]
+
+def _comment_timing(issues):
+    """Analyze comment timing relative to resolution date. Expects done issues (_done_only)."""
+    total_issues = 0
+    with_post_resolution = 0
+    total_comments = 0
+    post_res_comments = 0
+    for it in issues:
+        total_issues += 1
+        n_comments, n_post = _comment_counts(it)
+        total_comments += n_comments
+        post_res_comments += n_post
+        if n_post:
             with_post_resolution += 1
     return {
         "total_issues": total_issues,
@@ -1244,72 +1678,90 @@ def _comment_timing(issues):
     }
 
 
+def _worklog_entries(issue):
+    """Worklogs as (hours, author, weekday or None, started after resolution) tuples; cached on the issue."""
+    cached = issue.get("_worklog_entries")
+    if cached is not None:
+        return cached
+    worklog = (issue.get("fields") or {}).get("worklog")
+    worklogs = []
+    if isinstance(worklog, dict):
+        worklogs = worklog.get("worklogs", [])
+    elif isinstance(worklog, list):
+        worklogs = worklog
+    resolved = _resolved_dt(issue)
+    entries = []
+    for wl in worklogs:
+        author = wl.get("author") or wl.get("updateAuthor") or {}
+        started = parse_dt(wl.get("started"))
+        entries.append((
+            wl.get("timeSpentSeconds", 0) / 3600.0,
+            author.get("displayName") or "?",
+            started.weekday() if started else None,
+            bool(resolved and started and started > resolved),
+        ))
+    issue["_worklog_entries"] = entries
+    return entries
+
 def _worklog_analysis(issues, sp_field=None):
-    """Analyze worklog patterns from issues fetched with fields=worklog."""
+    """Analyze worklog patterns from done issues (_done_only) fetched with fields=worklog."""
     total_done = 0
     zero_worklog = 0
     post_resolution = 0
     bulk_entries = 0
     total_hours = 0
-    by_person = Counter()
-    by_dow = Counter()
-    sp_hours_pairs = []
+    # defaultdict(float): first-seen keys are filled in C rather than via Counter.__missing__
+    by_person = defaultdict(float)
+    dow_hours = [0.0] * 7  # indexed by datetime.weekday(); named via _WEEKDAYS at the end
+    # Welford running moments for the story points vs hours correlation (no pair list kept).
+    sp_n = 0
+    sp_mean_x = sp_mean_y = 0.0
+    sp_m2_x = sp_m2_y = sp_c_xy = 0.0
 
     for it in issues:
-        if not _is_done(it):
-            continue
         total_done += 1
-        resolved = parse_dt((it.get("fields") or {}).get("resolutiondate"))
-        worklog = (it.get("fields") or {}).get("worklog")
-        worklogs = []
-        if isinstance(worklog, dict):
-            worklogs = worklog.get("worklogs", [])
-        elif isinstance(worklog, list):
-            worklogs = worklog
-
-        if not worklogs:
+        fields = it.get("fields") or {}
+        entries = _worklog_entries(it)
+        if not entries:
             zero_worklog += 1
             continue
 
         has_post_res = False
         issue_hours = 0
-        for wl in worklogs:
-            secs = wl.get("timeSpentSeconds", 0)
-            hours = secs / 3600.0
+        for hours, person, weekday, after_resolution in entries:
             issue_hours += hours
             total_hours += hours
             if hours > 8:
                 bulk_entries += 1
-            author = wl.get("author") or wl.get("updateAuthor") or {}
-            by_person[author.get("displayName") or "?"] += hours
-            started = parse_dt(wl.get("started"))
-            if started:
-                by_dow[["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][started.weekday()]] += hours
-            if resolved and started and started > resolved:
+            by_person[person] += hours
+            if weekday is not None:
+                dow_hours[weekday] += hours
+            if after_resolution:
                 has_post_res = True
         if has_post_res:
             post_resolution += 1
 
         if sp_field:
-            sp_val = (it.get("fields") or {}).get(sp_field)
+            sp_val = fields.get(sp_field)
             if sp_val is not None and issue_hours > 0:
                 try:
-                    sp_hours_pairs.append((float(sp_val), issue_hours))
+                    x = float(sp_val)
                 except (TypeError, ValueError):
-                    pass
+                    continue
+                sp_n += 1
+                dx = x - sp_mean_x
+                sp_mean_x += dx / sp_n
+                dy = issue_hours - sp_mean_y
+                sp_mean_y += dy / sp_n
+                sp_m2_x += dx * (x - sp_mean_x)
+                sp_m2_y += dy * (issue_hours - sp_mean_y)
+                sp_c_xy += dx * (issue_hours - sp_mean_y)
 
     sp_correlation = None
-    if len(sp_hours_pairs) >= 5:
-        xs = [p[0] for p in sp_hours_pairs]
-        ys = [p[1] for p in sp_hours_pairs]
-        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
-        num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
-        dx = sum((x - mx) ** 2 for x in xs) ** 0.5
-        dy = sum((y - my) ** 2 for y in ys) ** 0.5
-        if dx > 0 and dy > 0:
-            sp_correlation = round(num / (dx * dy), 3)
-
-    weekend_hours = by_dow.get("Sat", 0) + by_dow.get("Sun", 0)
+    if sp_n >= 5 and sp_m2_x > 0 and sp_m2_y > 0:
+        sp_correlation = round(sp_c_xy / math.sqrt(sp_m2_x * sp_m2_y), 3)
+
+    weekend_hours = dow_hours[5] + dow_hours[6]
     worklog_gini = _gini_coefficient(list(by_person.values())) if by_person else 0
 
     return {
@@ -1320,12 +1772,12 @@ def _worklog_analysis(issues, sp_field=None):
         "post_resolution_worklog_pct": round(post_resolution / total_done * 100, 1) if total_done else 0,
         "bulk_entries_count": bulk_entries,
         "total_hours": round(total_hours, 1),
-        "by_person": dict(sorted(((k, round(v, 1)) for k, v in by_person.items()), key=lambda x: -x[1])[:20]),
-        "by_dow": {d: round(by_dow.get(d, 0), 1) for d in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]},
+        "by_person": dict(heapq.nlargest(20, ((k, round(v, 1)) for k, v in by_person.items()), key=itemgetter(1))),
+        "by_dow": {d: round(h, 1) for d, h in zip(_WEEKDAYS, dow_hours)},
         "weekend_pct": round(weekend_hours / total_hours * 100, 1) if total_hours > 0 else 0,
         "worklog_gini": worklog_gini,
         "sp_worklog_correlation": sp_correlation,
-        "sp_worklog_pairs_count": len(sp_hours_pairs),
+        "sp_worklog_pairs_count": sp_n,
     }
 
 
@@ -1333,42 +1785,48 @@ def _sp_trend(issues, sp_field):
     """Group average story points per issue by month, per project."""
     if not sp_field:
         return {"by_month": {}, "by_project": {}, "inflation_detected": False}
-    by_month = defaultdict(list)
-    by_proj_month = defaultdict(lambda: defaultdict(list))
+    # Running [sum, count] per bucket; averages only need the totals.
+    by_month = defaultdict(lambda: [0.0, 0])
+    by_proj_month = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
     for it in issues:
-        resolved = parse_dt((it.get("fields") or {}).get("resolutiondate"))
-        sp = (it.get("fields") or {}).get(sp_field)
-        if resolved and sp is not None:
+        fields = it.get("fields") or {}
+        month_key = _resolved_month(it)
+        sp = fields.get(sp_field)
+        if month_key and sp is not None:
             try:
                 sp_val = float(sp)
             except (TypeError, ValueError):
                 continue
-            month_key = resolved.strftime("%Y-%m")
-            by_month[month_key].append(sp_val)
-            pk = _project_key(it)
-            by_proj_month[pk][month_key].append(sp_val)
+            acc = by_month[month_key]
+            acc[0] += sp_val
+            acc[1] += 1
+            acc = by_proj_month[_project_key(it)][month_key]
+            acc[0] += sp_val
+            acc[1] += 1
 
     result = {}
     for month in sorted(by_month):
-        vals = by_month[month]
-        result[month] = {"avg_sp": round(sum(vals) / len(vals), 2), "count": len(vals)}
+        total, count = by_month[month]
+        result[month] = {"avg_sp": round(total / count, 2), "count": count}
 
     per_project = {}
     for pk, months in by_proj_month.items():
         per_project[pk] = {}
         for month in sorted(months):
-            vals = months[month]
-            per_project[pk][month] = {"avg_sp": round(sum(vals) / len(vals), 2), "count": len(vals)}
+            total, count = months[month]
+            per_project[pk][month] = {"avg_sp": round(total / count, 2), "count": count}
 
     months_sorted = sorted(by_month.keys())
     inflation_flag = False
     if len(months_sorted) >= 4:
         mid = len(months_sorted) // 2
-        first_half = [sp for m in months_sorted[:mid] for sp in by_month[m]]
-        second_half = [sp for m in months_sorted[mid:] for sp in by_month[m]]
-        if first_half and second_half:
-            avg_first = sum(first_half) / len(first_half)
-            avg_second = sum(second_half) / len(second_half)
+        first_sum = sum(by_month[m][0] for m in months_sorted[:mid])
+        first_count = sum(by_month[m][1] for m in months_sorted[:mid])
+        second_sum = sum(by_month[m][0] for m in months_sorted[mid:])
+        second_count = sum(by_month[m][1] for m in months_sorted[mid:])
+        if first_count and second_count:
+            avg_first = first_sum / first_count
+            avg_second = second_sum / second_count
             if avg_first > 0 and (avg_second - avg_first) / avg_first > 0.3:
                 inflation_flag = True
 
@@ -1377,39 +1835,26 @@ def _sp_trend(issues, sp_field):
 
 def _created_by_week(issues):
     """Group issues by creation week."""
-    weekly = Counter()
-    for it in issues:
-        created = parse_dt((it.get("fields") or {}).get("created"))
-        if created:
-            weekly[iso_week(created)] += 1
-    return dict(weekly)
+    return dict(Counter(wk for wk in map(_created_week, issues) if wk))
+
+
+def _is_bug(fields):
+    itype = fields.get("issuetype")
+    return isinstance(itype, dict) and (itype.get("name") or "").lower() == "bug"
 
 
 def _bug_creation_by_week(done_issues, open_bugs):
     """Count bug creation by week from both resolved and open bugs."""
-    weekly = Counter()
-    for it in done_issues:
-        itype = (it.get("fields") or {}).get("issuetype")
-        if isinstance(itype, dict) and (itype.get("name") or "").lower() == "bug":
-            created = parse_dt((it.get("fields") or {}).get("created"))
-            if created:
-                weekly[iso_week(created)] += 1
-    for it in open_bugs:
-        created = parse_dt((it.get("fields") or {}).get("created"))
-        if created:
-            weekly[iso_week(created)] += 1
+    weekly = Counter(_created_week(it) for it in done_issues if _is_bug(it.get("fields") or {}))
+    weekly.update(map(_created_week, open_bugs))
+    weekly.pop(None, None)
     return dict(weekly)
 
 
 def _bug_resolved_by_week(done_issues):
     """Count bug resolutions by week (resolved date)."""
-    weekly = Counter()
-    for it in done_issues:
-        itype = (it.get("fields") or {}).get("issuetype")
-        if isinstance(itype, dict) and (itype.get("name") or "").lower() == "bug":
-            dt = parse_dt((it.get("fields") or {}).get("resolutiondate"))
-            if dt:
-                weekly[iso_week(dt)] += 1
+    weekly = Counter(_resolved_week(it) for it in done_issues if _is_bug(it.get("fields") or {}))
+    weekly.pop(None, None)
     return dict(weekly)
 
 
@@ -1417,8 +1862,7 @@ def _bug_fix_time(done_issues):
     """Lead time stats for bugs only (created -> resolved)."""
     vals = []
     for it in done_issues:
-        itype = (it.get("fields") or {}).get("issuetype")
-        if isinstance(itype, dict) and (itype.get("name") or "").lower() == "bug":
+        if _is_bug(it.get("fields") or {}):
             lt = lead_time_days(it)
             if lt is not None:
                 vals.append(lt)
@@ -1426,15 +1870,20 @@ def _bug_fix_time(done_issues):
 
 
 def _issue_components(issue):
-    """Extract component names from an issue, defaulting to '(no component)'."""
+    """
+    Component names of an issue as a tuple, defaulting to ('(no component)',).
+    Cached on the issue: every breakdown and scope grouping reads it.
+    """
+    cached = issue.get("_components")
+    if cached is not None:
+        return cached
     comps = (issue.get("fields") or {}).get("components")
-    if not isinstance(comps, list) or not comps:
-        return ["(no component)"]
-    names = []
-    for c in comps:
-        if isinstance(c, dict):
-            names.append(c.get("name") or c.get("id") or "?")
-    return names if names else ["(no component)"]
+    names = ()
+    if isinstance(comps, list):
+        names = tuple(c.get("name") or c.get("id") or "?" for c in comps if isinstance(c, dict))
+    names = names or ("(no component)",)
+    issue["_components"] = names
+    return names
 
 
 def _jira_created_to_date_str(fields):
@@ -1451,6 +1900,21 @@ def _jira_created_to_date_str(fields):
         return None
 
 
+def _json_default(obj):
+    if isinstance(obj, float) and math.isnan(obj):
+        return None
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_results_json(path, results):
+    """Write the results JSON (indented). Tuples such as issue components are written as arrays by both encoders."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            _json.dump(results, f, indent=2, ensure_ascii=False, default=_json_default)
+
+
 # ----------------------------
 # Main
 # ----------------------------
@@ -1482,6 +1946,7 @@ def main():
         print("No custom field with 'team' in name found. Team breakdown will be empty.")
 
     SPRINT_FIELD_ID, _ = get_sprint_field_id(jira)
+    EPIC_LINK_FIELD_ID, _ = get_epic_link_field_id(jira)
     if SPRINT_FIELD_ID:
         print(f"Using Sprint field for scope changes: {SPRINT_FIELD_ID}")
     else:
@@ -1497,9 +1962,32 @@ def main():
     if STORY_POINTS_FIELD:
         fields_with_team.append(STORY_POINTS_FIELD)
 
-    print("\nPulling current (not done) issues for status distribution & Open aging...")
+    # The six issue pulls are independent; run them concurrently so wall time is the slowest one, not the sum.
     jql_wip = f'project in ({projects_jql}) AND statusCategory != {DONE_CATEGORY}'
-    wip_issues = jira.search(jql_wip, fields=fields_with_team, max_results=5000)
+    blocked_jql = f'project in ({projects_jql}) AND statusCategory != {DONE_CATEGORY} AND {BLOCKED_JQL}'
+    # last 180 days, adjust as needed
+    jql_done = f'project in ({projects_jql}) AND statusCategory = {DONE_CATEGORY} AND resolved >= -180d'
+    jql_created = f'project in ({projects_jql}) AND created >= -180d'
+    # Changelog is heavier; start with last 90 days to keep it reasonable.
+    jql_done_90 = f'project in ({projects_jql}) AND statusCategory = {DONE_CATEGORY} AND resolved >= -90d'
+    jql_open_bugs = f'project in ({projects_jql}) AND issuetype = Bug AND statusCategory != {DONE_CATEGORY}'
+
+    def _search_created():
+        # Optional trend input: a failure is reported below instead of aborting the run.
+        try:
+            return jira.search(jql_created, fields=["project", "issuetype", "created", "components"], max_results=10000)
+        except Exception as e:
+            return e
+
+    print("\nPulling open, blocked, done (180d), done with changelog (90d), open bug and created issues...")
+    wip_issues, blocked_issues, done_issues, created_result, done_issues_90, open_bugs = run_parallel(lambda pull: pull(), [
+        lambda: jira.search_incremental(jql_wip, fields=fields_with_team, max_results=5000),
+        lambda: jira.search_incremental(blocked_jql, fields=fields_with_team, max_results=2000),
+        lambda: jira.search_incremental(jql_done, fields=fields_with_team, max_results=10000),
+        _search_created,
+        lambda: jira.search_incremental(jql_done_90, fields=fields_with_team, expand="changelog", max_results=3000),
+        lambda: jira.search_incremental(jql_open_bugs, fields=fields_with_team, max_results=5000),
+    ])
 
     print(f"Open issues pulled: {len(wip_issues)}")
     status_dist = status_distribution(wip_issues)
@@ -1540,10 +2028,10 @@ def main():
     print("\nAging Open summary (days since created):", wip_aging)
     print(f"WIP (in flight): {wip_in_flight}")
     if results["wip_components"]:
-        print("Open by component:", dict(sorted(results["wip_components"].items(), key=lambda x: -x[1])[:10]))
+        print("Open by component:", _top_n(results["wip_components"], 10))
     results["teams"] = sorted(results["wip_teams"].keys()) if results["wip_teams"] else []
     if results["wip_teams"]:
-        print("Open by team:", dict(sorted(results["wip_teams"].items(), key=lambda x: -x[1])[:10]))
+        print("Open by team:", _top_n(results["wip_teams"], 10))
 
     # Phase 1 Open/WIP metrics
     results["wip_status_by_component"] = _status_by_component(wip_issues)
@@ -1567,37 +2055,32 @@ def main():
     results["empty_or_bad_by_assignee_wip"] = _assignee_breakdown(empty_bad_wip_list)
     results["empty_or_bad_by_component_wip"] = _component_breakdown(empty_bad_wip_list)
     results["empty_or_bad_by_label_wip"] = _label_breakdown(empty_bad_wip_list)
-    _top5 = lambda d: dict(sorted((d or {}).items(), key=lambda x: -x[1])[:5])
-    results["empty_or_bad_top_teams_wip"] = _top5(results["empty_or_bad_by_team_wip"])
-    results["empty_or_bad_top_assignees_wip"] = _top5(results["empty_or_bad_by_assignee_wip"])
-    results["empty_or_bad_top_components_wip"] = _top5(results["empty_or_bad_by_component_wip"])
-    results["empty_or_bad_top_labels_wip"] = _top5(results["empty_or_bad_by_label_wip"])
+    results["empty_or_bad_top_teams_wip"] = _top_n(results["empty_or_bad_by_team_wip"], 5)
+    results["empty_or_bad_top_assignees_wip"] = _top_n(results["empty_or_bad_by_assignee_wip"], 5)
+    results["empty_or_bad_top_components_wip"] = _top_n(results["empty_or_bad_by_component_wip"], 5)
+    results["empty_or_bad_top_labels_wip"] = _top_n(results["empty_or_bad_by_label_wip"], 5)
     print(f"Empty or bad structure (WIP): {results['empty_or_bad_count_wip']} / {len(wip_issues)} ({results['empty_or_bad_pct_wip']}%)")
 
     # Phase 6a: Open by assignee
     wip_ab = _assignee_breakdown(wip_issues)
-    results["wip_assignees"] = dict(sorted(wip_ab.items(), key=lambda x: -x[1])[:30])
+    results["wip_assignees"] = _top_n(wip_ab, 30)
     wip_per_person = [v for k, v in wip_ab.items() if k != "(unassigned)"]
     results["avg_wip_per_assignee"] = round(sum(wip_per_person) / len(wip_per_person), 1) if wip_per_person else 0
     print(f"Open assignees: {len(wip_ab)}, avg open/person: {results['avg_wip_per_assignee']}")
 
-    print("\nPulling blockers (heuristic JQL)...")
-    blocked_jql = f'project in ({projects_jql}) AND statusCategory != {DONE_CATEGORY} AND {BLOCKED_JQL}'
-    blocked_issues = jira.search(blocked_jql, fields=fields_with_team, max_results=2000)
-    print(f"Blocked issues: {len(blocked_issues)}")
+    print(f"\nBlocked issues: {len(blocked_issues)}")
     blocked_with_age = []
-    if blocked_issues:
-        # Show top 10 oldest blocked
-        for it in blocked_issues:
-            age = bug_age_days(it, now=now)
-            blocked_with_age.append((age or -1, it.get("key", "?"), (it.get("fields") or {}).get("summary", "") or ""))
-
-        blocked_with_age.sort(reverse=True)
+    for it in blocked_issues:
+        age = bug_age_days(it, now=now)
+        blocked_with_age.append((age or -1, it.get("key", "?"), (it.get("fields") or {}).get("summary", "") or ""))
+    # Top 10 oldest blocked; nlargest == sorted(reverse=True)[:10] without sorting the whole list.
+    oldest_blocked = heapq.nlargest(10, blocked_with_age)
+    if oldest_blocked:
         print("Oldest blocked issues (top 10):")
-        for age, key, _ in blocked_with_age[:10]:
+        for age, key, _ in oldest_blocked:
             print(f"  {key} - {age:.1f} days")
     results["blocked_count"] = len(blocked_issues)
-    results["blocked_oldest"] = [(key, round(age, 1)) for age, key, _ in sorted(blocked_with_age, reverse=True)[:10]]
+    results["blocked_oldest"] = [(key, round(age, 1)) for age, key, _ in oldest_blocked]
     blocked_issue_lookup = {it.get("key", "?"): it for it in blocked_issues}
     results["blocked_oldest_details"] = [
         {
@@ -1608,18 +2091,13 @@ def main():
             "components": _issue_components(blocked_issue_lookup.get(key, {})),
             "team": _get_issue_team(blocked_issue_lookup.get(key, {}), TEAM_FIELD_ID),
         }
-        for age, key, _ in sorted(blocked_with_age, reverse=True)[:10]
+        for age, key, _ in oldest_blocked
     ]
 
     # ---------
     # 2) Throughput per week (done issues)
     # ---------
-    print("\nPulling done issues for throughput + lead time...")
-    # last 180 days, adjust as needed
-    jql_done = f'project in ({projects_jql}) AND statusCategory = {DONE_CATEGORY} AND resolved >= -180d'
-    done_issues = jira.search(jql_done, fields=fields_with_team, max_results=10000)
-
-    print(f"Done issues pulled (last 180d): {len(done_issues)}")
+    print(f"\nDone issues pulled (last 180d): {len(done_issues)}")
     weekly = throughput_weekly(done_issues)
     weekly_sorted = sorted(weekly.keys())[-12:]
     results["throughput_by_week"] = {wk: weekly[wk] for wk in weekly_sorted}
@@ -1640,22 +2118,23 @@ def main():
     print("Lead time distribution:", lt_dist)
 
     # Phase 1 done-issues metrics
-    results["resolution_breakdown"] = _resolution_breakdown(done_issues)
-    results["done_issuetype"] = _issuetype_breakdown(done_issues)
-    results["resolution_by_weekday"] = _resolution_by_weekday(done_issues)
-    ab = _assignee_breakdown(done_issues)
-    results["done_assignees"] = dict(sorted(ab.items(), key=lambda x: -x[1])[:20])
+    done_bd = _done_issue_breakdowns(done_issues)
+    results["resolution_breakdown"] = done_bd["resolution_breakdown"]
+    results["done_issuetype"] = done_bd["issuetype"]
+    results["resolution_by_weekday"] = done_bd["resolution_by_weekday"]
+    ab = done_bd["assignees"]
+    results["done_assignees"] = _top_n(ab, 20)
     assignee_counts = [v for k, v in ab.items() if k != "(unassigned)"]
     results["workload_gini"] = _gini_coefficient(assignee_counts)
-    results["bulk_closure_days"] = _bulk_closures(done_issues)
-    print(f"Resolution types: {results['resolution_breakdown']}")
+    results["bulk_closure_days"] = done_bd["bulk_closure_days"]
+    print(f"Resolution types: {dict(results['resolution_breakdown'])}")
     print(f"Workload Gini: {results['workload_gini']}")
     print(f"Bulk closure days (>{10} resolutions): {len(results['bulk_closure_days'])}")
 
     # Phase 3 done-issues metrics
-    results["empty_description_done_pct"] = _empty_description_pct(done_issues)
-    results["zero_comment_done_pct"] = _zero_comment_pct(done_issues)
-    results["orphan_done_pct"] = _orphan_pct(done_issues)
+    results["empty_description_done_pct"] = done_bd["empty_description_pct"]
+    results["zero_comment_done_pct"] = done_bd["zero_comment_pct"]
+    results["orphan_done_pct"] = done_bd["orphan_pct"]
     print(f"Empty description (done): {results['empty_description_done_pct']}%")
     print(f"Zero comments (done): {results['zero_comment_done_pct']}%")
     print(f"Orphan issues (done): {results['orphan_done_pct']}%")
@@ -1670,10 +2149,10 @@ def main():
     results["empty_or_bad_by_assignee_done"] = _assignee_breakdown(empty_bad_done_list)
     results["empty_or_bad_by_component_done"] = _component_breakdown(empty_bad_done_list)
     results["empty_or_bad_by_label_done"] = _label_breakdown(empty_bad_done_list)
-    results["empty_or_bad_top_teams_done"] = _top5(results["empty_or_bad_by_team_done"])
-    results["empty_or_bad_top_assignees_done"] = _top5(results["empty_or_bad_by_assignee_done"])
-    results["empty_or_bad_top_components_done"] = _top5(results["empty_or_bad_by_component_done"])
-    results["empty_or_bad_top_labels_done"] = _top5(results["empty_or_bad_by_label_done"])
+    results["empty_or_bad_top_teams_done"] = _top_n(results["empty_or_bad_by_team_done"], 5)
+    results["empty_or_bad_top_assignees_done"] = _top_n(results["empty_or_bad_by_assignee_done"], 5)
+    results["empty_or_bad_top_components_done"] = _top_n(results["empty_or_bad_by_component_done"], 5)
+    results["empty_or_bad_top_labels_done"] = _top_n(results["empty_or_bad_by_label_done"], 5)
     print(f"Empty or bad structure (done): {results['empty_or_bad_count_done']} / {len(done_issues)} ({results['empty_or_bad_pct_done']}%)")
 
     # Phase 4a: Story point inflation
@@ -1682,24 +2161,19 @@ def main():
         print("  WARNING: Story point inflation detected (avg SP/issue up >30%)")
 
     # Phase 5a: Created vs Resolved trend
-    print("\nPulling created issues (last 180d) for trend analysis...")
-    jql_created = f'project in ({projects_jql}) AND created >= -180d'
     created_issues = []
-    try:
-        created_issues = jira.search(jql_created, fields=["project", "issuetype", "created", "components"], max_results=10000)
-        results["created_by_week"] = _created_by_week(created_issues)
-        print(f"  Created issues (last 180d): {len(created_issues)}")
-    except Exception as e:
+    if isinstance(created_result, Exception):
         results["created_by_week"] = {}
-        print(f"  Created issues query failed: {e}")
+        print(f"\n  Created issues query failed: {created_result}")
+    else:
+        created_issues = created_result
+        results["created_by_week"] = _created_by_week(created_issues)
+        print(f"\n  Created issues (last 180d): {len(created_issues)}")
 
     # ---------
     # 3) Cycle time from changelog (sample or full)
     # ---------
-    # Changelog is heavier; start with last 90 days to keep it reasonable.
-    print("\nPulling done issues (last 90d) WITH changelog for cycle time...")
-    jql_done_90 = f'project in ({projects_jql}) AND statusCategory = {DONE_CATEGORY} AND resolved >= -90d'
-    done_issues_90 = jira.search(jql_done_90, fields=fields_with_team, expand="changelog", max_results=3000)
+    print(f"\nDone issues with changelog (last 90d): {len(done_issues_90)}")
     cycle_times = [cycle_time_days_from_changelog(it) for it in done_issues_90]
     cycle_summary = summarize_time_metrics(cycle_times)
     results["cycle_time_days"] = cycle_summary
@@ -1707,11 +2181,12 @@ def main():
 
     # Phase 2 changelog-based metrics
     print("\nMining changelog for status paths, time-in-status, closers, reopens...")
-    results["status_path_analysis"] = _status_path_analysis(done_issues_90)
+    done_90_only = _done_only(done_issues_90)
+    results["status_path_analysis"] = _status_path_analysis(done_90_only)
     print(f"  Status skip: {results['status_path_analysis']['skip_count']}/{results['status_path_analysis']['total']} ({results['status_path_analysis']['skip_pct']}%)")
     tis = _time_in_status(done_issues_90)
     results["time_in_status"] = tis
-    results["closer_analysis"] = _closer_analysis(done_issues_90)
+    results["closer_analysis"] = _closer_analysis(done_90_only)
     print(f"  Closer != assignee: {results['closer_analysis']['closer_not_assignee_pct']}%")
     results["reopen_analysis"] = _reopen_count(done_issues_90)
     print(f"  Reopened: {results['reopen_analysis']['reopened_count']} ({results['reopen_analysis']['reopened_pct']}%)")
@@ -1719,32 +2194,30 @@ def main():
     print(f"  Flow efficiency: {results['flow_efficiency']['efficiency_pct']}%")
 
     # Phase 4c: Assignee change near resolution
-    results["assignee_change_near_resolution"] = _assignee_change_near_resolution(done_issues_90)
+    results["assignee_change_near_resolution"] = _assignee_change_near_resolution(done_90_only)
     print(f"  Assignee change near resolution: {results['assignee_change_near_resolution']['changed_pct']}%")
 
     # Phase 4e: Comment timing
-    results["comment_timing"] = _comment_timing(done_issues_90)
+    results["comment_timing"] = _comment_timing(done_90_only)
     print(f"  Post-resolution comments: {results['comment_timing']['post_resolution_comment_pct']}%")
 
     # Phase 4d/6b/6e: Worklog analysis
-    results["worklog_analysis"] = _worklog_analysis(done_issues_90, sp_field=STORY_POINTS_FIELD)
+    results["worklog_analysis"] = _worklog_analysis(done_90_only, sp_field=STORY_POINTS_FIELD)
     print(f"  Zero-worklog done: {results['worklog_analysis']['zero_worklog_pct']}%, Post-res worklogs: {results['worklog_analysis']['post_resolution_worklog_pct']}%")
 
     # ---------
     # 4) Bugs: open, average age, oldest
     # ---------
-    print("\nPulling open bugs...")
-    jql_open_bugs = f'project in ({projects_jql}) AND issuetype = Bug AND statusCategory != {DONE_CATEGORY}'
-    open_bugs = jira.search(jql_open_bugs, fields=fields_with_team, max_results=5000)
-    print(f"Open bugs: {len(open_bugs)}")
+    print(f"\nOpen bugs: {len(open_bugs)}")
 
     bug_ages = [(bug_age_days(it, now=now) or -1, it.get("key", "?"), (it.get("fields") or {}).get("summary", "") or "", _project_key(it)) for it in open_bugs]
     bug_age_values = [a for a, *_ in bug_ages if a >= 0]
-    print("Open bug age summary (days since created):", summarize_time_metrics(bug_age_values))
+    bug_age_summary = summarize_time_metrics(bug_age_values)
+    print("Open bug age summary (days since created):", bug_age_summary)
 
-    bug_ages.sort(reverse=True)
+    oldest_bugs = heapq.nlargest(15, bug_ages)
     results["open_bugs_count"] = len(open_bugs)
-    results["open_bugs_age_days"] = summarize_time_metrics(bug_age_values)
+    results["open_bugs_age_days"] = bug_age_summary
     open_bug_lookup = {it.get("key", "?"): it for it in open_bugs}
     results["oldest_open_bugs"] = [
         {
@@ -1755,28 +2228,17 @@ def main():
             "components": _issue_components(open_bug_lookup.get(key, {})),
             "team": _get_issue_team(open_bug_lookup.get(key, {}), TEAM_FIELD_ID),
         }
-        for age, key, summary, proj in bug_ages[:15]
+        for age, key, summary, proj in oldest_bugs
     ]
     print("\nOldest open bugs (top 15):")
-    for age, key, summary, proj in bug_ages[:15]:
+    for age, key, summary, proj in oldest_bugs:
         try:
             print(f"  {key} [{proj}] - {age:.1f} days - {summary[:80]}")
         except UnicodeEncodeError:
             print(f"  {key} [{proj}] - {age:.1f} days - (summary contains non-printable chars)")
 
     # Phase 5b: Bug creation rate
-    bug_created_weekly = Counter()
-    for it in done_issues:
-        itype = (it.get("fields") or {}).get("issuetype")
-        if isinstance(itype, dict) and (itype.get("name") or "").lower() == "bug":
-            created = parse_dt((it.get("fields") or {}).get("created"))
-            if created:
-                bug_created_weekly[iso_week(created)] += 1
-    for it in open_bugs:
-        created = parse_dt((it.get("fields") or {}).get("created"))
-        if created:
-            bug_created_weekly[iso_week(created)] += 1
-    results["bug_creation_by_week"] = dict(bug_created_weekly)
+    results["bug_creation_by_week"] = _bug_creation_by_week(done_issues, open_bugs)
     results["bug_resolved_by_week"] = _bug_resolved_by_week(done_issues)
     results["bug_fix_time_days"] = _bug_fix_time(done_issues)
     results["open_bugs_by_priority"] = _priority_breakdown(open_bugs)
@@ -1809,92 +2271,61 @@ def main():
     open_bugs_by_pc = defaultdict(lambda: defaultdict(list))
     created_by_pc = defaultdict(lambda: defaultdict(list))
 
-    def _group_project_scope(target, issues):
-        for issue in issues:
-            target[_project_key(issue)].append(issue)
-
-    def _group_component_scope(target, issues):
-        for issue in issues:
-            for comp_name in _issue_components(issue):
-                target[comp_name].append(issue)
-
-    def _group_project_component_scope(target, issues):
+    def _group_scopes(by_p, by_c, by_pc, issues):
+        """One pass per issue list: project, component and project+component buckets together."""
         for issue in issues:
             project_key = _project_key(issue)
+            by_p[project_key].append(issue)
+            pc = by_pc[project_key]
             for comp_name in _issue_components(issue):
-                target[project_key][comp_name].append(issue)
-
-    _group_project_scope(wip_by_p, wip_issues)
-    _group_project_scope(blocked_by_p, blocked_issues)
-    _group_project_scope(done_by_p, done_issues)
-    _group_project_scope(done_90_by_p, done_issues_90)
-    _group_project_scope(open_bugs_by_p, open_bugs)
-    _group_project_scope(created_by_p, created_issues)
-
-    _group_component_scope(wip_by_c, wip_issues)
-    _group_component_scope(blocked_by_c, blocked_issues)
-    _group_component_scope(done_by_c, done_issues)
-    _group_component_scope(done_90_by_c, done_issues_90)
-    _group_component_scope(open_bugs_by_c, open_bugs)
-    _group_component_scope(created_by_c, created_issues)
-
-    _group_project_component_scope(wip_by_pc, wip_issues)
-    _group_project_component_scope(blocked_by_pc, blocked_issues)
-    _group_project_component_scope(done_by_pc, done_issues)
-    _group_project_component_scope(done_90_by_pc, done_issues_90)
-    _group_project_component_scope(open_bugs_by_pc, open_bugs)
-    _group_project_component_scope(created_by_pc, created_issues)
+                by_c[comp_name].append(issue)
+                pc[comp_name].append(issue)
+
+    _group_scopes(wip_by_p, wip_by_c, wip_by_pc, wip_issues)
+    _group_scopes(blocked_by_p, blocked_by_c, blocked_by_pc, blocked_issues)
+    _group_scopes(done_by_p, done_by_c, done_by_pc, done_issues)
+    _group_scopes(done_90_by_p, done_90_by_c, done_90_by_pc, done_issues_90)
+    _group_scopes(open_bugs_by_p, open_bugs_by_c, open_bugs_by_pc, open_bugs)
+    _group_scopes(created_by_p, created_by_c, created_by_pc, created_issues)
+
+    # Every scope is independent: collect (target, key, inputs) and run them in one batch.
+    scope_targets = []
+    scope_jobs = []
+
+    def _add_scope(target, key, wip, blocked, done, done_90, bugs, created):
+        scope_targets.append((target, key))
+        scope_jobs.append({
+            "wip_list": wip,
+            "blocked_list": blocked,
+            "done_list": done,
+            "done_90_list": done_90,
+            "open_bug_list": bugs,
+            "created_list": created,
+            "story_points_field": STORY_POINTS_FIELD,
+            "now": now,
+            "team_field_id": TEAM_FIELD_ID,
+        })
 
     for pk in PROJECT_KEYS:
-        by_project[pk] = _scope_metrics(
-            wip_list=wip_by_p.get(pk, []),
-            blocked_list=blocked_by_p.get(pk, []),
-            done_list=done_by_p.get(pk, []),
-            done_90_list=done_90_by_p.get(pk, []),
-            open_bug_list=open_bugs_by_p.get(pk, []),
-            created_list=created_by_p.get(pk, []),
-            story_points_field=STORY_POINTS_FIELD,
-            now=now,
-            team_field_id=TEAM_FIELD_ID,
-        )
-
-    all_comp_names = sorted(set(
-        list(wip_by_c) + list(blocked_by_c) + list(done_by_c) +
-        list(done_90_by_c) + list(open_bugs_by_c) + list(created_by_c)
-    ))
+        _add_scope(by_project, pk, wip_by_p.get(pk, []), blocked_by_p.get(pk, []), done_by_p.get(pk, []),
+                   done_90_by_p.get(pk, []), open_bugs_by_p.get(pk, []), created_by_p.get(pk, []))
+
+    # set().union() takes the key views directly; no concatenated temporary lists.
+    all_comp_names = sorted(set().union(
+        wip_by_c, blocked_by_c, done_by_c, done_90_by_c, open_bugs_by_c, created_by_c))
     for cn in all_comp_names:
-        by_component[cn] = _scope_metrics(
-            wip_list=wip_by_c.get(cn, []),
-            blocked_list=blocked_by_c.get(cn, []),
-            done_list=done_by_c.get(cn, []),
-            done_90_list=done_90_by_c.get(cn, []),
-            open_bug_list=open_bugs_by_c.get(cn, []),
-            created_list=created_by_c.get(cn, []),
-            story_points_field=STORY_POINTS_FIELD,
-            now=now,
-            team_field_id=TEAM_FIELD_ID,
-        )
+        _add_scope(by_component, cn, wip_by_c.get(cn, []), blocked_by_c.get(cn, []), done_by_c.get(cn, []),
+                   done_90_by_c.get(cn, []), open_bugs_by_c.get(cn, []), created_by_c.get(cn, []))
 
     for pk in PROJECT_KEYS:
-        component_names = sorted(set(
-            list(wip_by_pc.get(pk, {})) + list(blocked_by_pc.get(pk, {})) +
-            list(done_by_pc.get(pk, {})) + list(done_90_by_pc.get(pk, {})) +
-            list(open_bugs_by_pc.get(pk, {})) + list(created_by_pc.get(pk, {}))
-        ))
-        if not component_names:
-            continue
+        component_names = sorted(set().union(
+            wip_by_pc.get(pk, {}), blocked_by_pc.get(pk, {}), done_by_pc.get(pk, {}),
+            done_90_by_pc.get(pk, {}), open_bugs_by_pc.get(pk, {}), created_by_pc.get(pk, {})))
         for cn in component_names:
-            by_project_component[pk][cn] = _scope_metrics(
-                wip_list=wip_by_pc.get(pk, {}).get(cn, []),
-                blocked_list=blocked_by_pc.get(pk, {}).get(cn, []),
-                done_list=done_by_pc.get(pk, {}).get(cn, []),
-                done_90_list=done_90_by_pc.get(pk, {}).get(cn, []),
-                open_bug_list=open_bugs_by_pc.get(pk, {}).get(cn, []),
-                created_list=created_by_pc.get(pk, {}).get(cn, []),
-                story_points_field=STORY_POINTS_FIELD,
-                now=now,
-                team_field_id=TEAM_FIELD_ID,
-            )
+            _add_scope(by_project_component[pk], cn,
+                       wip_by_pc.get(pk, {}).get(cn, []), blocked_by_pc.get(pk, {}).get(cn, []),
+                       done_by_pc.get(pk, {}).get(cn, []), done_90_by_pc.get(pk, {}).get(cn, []),
+                       open_bugs_by_pc.get(pk, {}).get(cn, []), created_by_pc.get(pk, {}).get(cn, []))
 
     # Per-team metrics (flat breakdown, like by_component)
     by_team = {}
@@ -1918,22 +2349,15 @@ def main():
         _group_team_scope(open_bugs_by_t, open_bugs)
         _group_team_scope(created_by_t, created_issues)
 
-        all_team_names = sorted(set(
-            list(wip_by_t) + list(blocked_by_t) + list(done_by_t) +
-            list(done_90_by_t) + list(open_bugs_by_t) + list(created_by_t)
-        ))
+        all_team_names = sorted(set().union(
+            wip_by_t, blocked_by_t, done_by_t, done_90_by_t, open_bugs_by_t, created_by_t))
         for tn in all_team_names:
-            by_team[tn] = _scope_metrics(
-                wip_list=wip_by_t.get(tn, []),
-                blocked_list=blocked_by_t.get(tn, []),
-                done_list=done_by_t.get(tn, []),
-                done_90_list=done_90_by_t.get(tn, []),
-                open_bug_list=open_bugs_by_t.get(tn, []),
-                created_list=created_by_t.get(tn, []),
-                story_points_field=STORY_POINTS_FIELD,
-                now=now,
-                team_field_id=TEAM_FIELD_ID,
-            )
+            _add_scope(by_team, tn, wip_by_t.get(tn, []), blocked_by_t.get(tn, []), done_by_t.get(tn, []),
+                       done_90_by_t.get(tn, []), open_bugs_by_t.get(tn, []), created_by_t.get(tn, []))
+
+    for (target, key), metrics in zip(scope_targets, compute_scope_metrics(scope_jobs)):
+        target[key] = metrics
+    if TEAM_FIELD_ID:
         print(f"Per-team metrics computed for {len(by_team)} teams.")
 
     results["by_project"] = by_project
@@ -1955,56 +2379,70 @@ def main():
     # ---------
     print("\nDiscovering boards per project (explicit override first, then scored fallback)...")
     boards = {}
-    for pk in PROJECT_KEYS:
+
+    # Per-project/board calls below are independent: fetch them on the thread pool, report in order.
+    def _project_boards(pk):
         try:
-            b = jira.list_boards_for_project(pk)
-            vals = b.get("values", [])
-            if vals:
-                selected_board = _select_project_board(pk, vals)
-                boards[pk] = selected_board
-                btype = selected_board.get("type", "unknown")
-                print(f"  {pk}: board {selected_board['id']} - {selected_board['name']} ({btype})")
-            else:
-                print(f"  {pk}: no boards found")
+            return jira.list_boards_for_project(pk).get("values", []), None
         except Exception as e:
-            print(f"  {pk}: failed to list boards ({e})")
+            return None, e
+
+    for pk, (vals, err) in zip(PROJECT_KEYS, run_parallel(_project_boards, PROJECT_KEYS)):
+        if err is not None:
+            print(f"  {pk}: failed to list boards ({err})")
+        elif vals:
+            selected_board = _select_project_board(pk, vals)
+            boards[pk] = selected_board
+            btype = selected_board.get("type", "unknown")
+            print(f"  {pk}: board {selected_board['id']} - {selected_board['name']} ({btype})")
+        else:
+            print(f"  {pk}: no boards found")
 
     # Kanban: for boards that don't support sprints, get current board issues and status breakdown
     results["kanban_boards"] = []
-    for pk, b in list(boards.items()):
+    kanban_boards = [(pk, b) for pk, b in boards.items() if b.get("type", "").lower() == "kanban"]
+
+    def _kanban_issues(board):
+        try:
+            return jira.board_issues(board[1]["id"], fields=fields_with_team, max_results=2000), None
+        except Exception as e:
+            return None, e
+
+    for (pk, b), (issues, err) in zip(kanban_boards, run_parallel(_kanban_issues, kanban_boards)):
         board_id = b["id"]
-        btype = b.get("type", "").lower()
-        if btype == "kanban":
-            try:
-                issues = jira.board_issues(board_id, fields=fields_with_team, max_results=2000)
-                dist = status_distribution(issues)
-                done_on_board = sum(1 for it in issues if _is_done(it))
-                results["kanban_boards"].append({
-                    "project": pk,
-                    "board_id": board_id,
-                    "board_name": b.get("name", ""),
-                    "issue_count": len(issues),
-                    "done_count": done_on_board,
-                    "status_breakdown": dict(dist),
-                })
-                print(f"  Kanban {pk}: {len(issues)} issues on board, {done_on_board} done")
-            except Exception as e:
-                print(f"  Kanban board {board_id} issues failed: {e}")
+        if err is not None:
+            print(f"  Kanban board {board_id} issues failed: {err}")
+            continue
+        dist = status_distribution(issues)
+        done_on_board = sum(1 for it in issues if _is_done(it))
+        results["kanban_boards"].append({
+            "project": pk,
+            "board_id": board_id,
+            "board_name": b.get("name", ""),
+            "issue_count": len(issues),
+            "done_count": done_on_board,
+            "status_breakdown": dict(dist),
+        })
+        print(f"  Kanban {pk}: {len(issues)} issues on board, {done_on_board} done")
 
     # Scrum: recent closed sprints
     sprint_rows = []
-    for pk, b in boards.items():
-        board_id = b["id"]
-        if (b.get("type") or "").lower() == "kanban":
-            continue
+    scrum_boards = [(pk, b["id"]) for pk, b in boards.items() if (b.get("type") or "").lower() != "kanban"]
+
+    def _closed_sprints(board):
         try:
-            sprints = jira.list_sprints(board_id, state="closed", max_results=50).get("values", [])
-            # take last 6 closed sprints
-            sprints = sorted(sprints, key=lambda x: (x.get("endDate") or "", x.get("id", 0)))[-6:]
-            for sp in sprints:
-                sprint_rows.append((pk, board_id, sp["id"], sp["name"], sp.get("startDate"), sp.get("endDate")))
+            return jira.list_sprints(board[1], state="closed", max_results=50).get("values", []), None
         except Exception as e:
-            print(f"Board {board_id} sprints failed: {e}")
+            return None, e
+
+    for (pk, board_id), (sprints, err) in zip(scrum_boards, run_parallel(_closed_sprints, scrum_boards)):
+        if err is not None:
+            print(f"Board {board_id} sprints failed: {err}")
+            continue
+        # take last 6 closed sprints
+        sprints = sorted(sprints, key=lambda x: (x.get("endDate") or "", x.get("id", 0)))[-6:]
+        for sp in sprints:
+            sprint_rows.append((pk, board_id, sp["id"], sp["name"], sp.get("startDate"), sp.get("endDate")))
 
     if sprint_rows:
         print(f"\nAnalyzing {len(sprint_rows)} sprints (recent closed)...")
@@ -2012,25 +2450,40 @@ def main():
         print("\nNo sprints found via boards; check board permissions or project-to-board mapping.")
         sprint_rows = []
 
-    def get_sp(issue):
-        if not STORY_POINTS_FIELD:
-            return 1.0
-        v = (issue.get("fields") or {}).get(STORY_POINTS_FIELD)
-        try:
-            return float(v) if v is not None else 0.0
-        except (TypeError, ValueError):
-            return 0.0
+    get_sp = _story_points_getter(STORY_POINTS_FIELD)
 
-    sprint_metrics = []
-    for pk, board_id, sprint_id, sprint_name, start, end in sprint_rows:
+    def _fetch_sprint(row):
+        """Network half of the sprint analysis: sprint issues and the removed-during-sprint count."""
+        _, board_id, sprint_id, _, start, _ = row
         # Pull sprint issues (include components, team; add changelog for scope metrics)
-        fields = list(fields_with_team)
         expand = "changelog" if SPRINT_FIELD_ID and start else None
-        issues = jira.sprint_issues(sprint_id, fields=fields, expand=expand, max_results=1000)
+        issues = jira.sprint_issues(sprint_id, fields=list(fields_with_team), expand=expand, max_results=1000)
 
-        committed = sum(get_sp(it) for it in issues)  # committed = everything in sprint snapshot (approx)
-        done = sum(get_sp(it) for it in issues if _is_done(it))
-        throughput = sum(1 for it in issues if _is_done(it))
+        # Both report getters return None instead of raising when the endpoint is unavailable.
+        report = jira.get_sprint_scope_report(board_id, sprint_id)
+        removed_during_sprint = _removed_from_sprint_count(report)
+        if removed_during_sprint is None:
+            report = jira.get_sprint_report(board_id, sprint_id)
+            removed_during_sprint = _removed_from_sprint_count(report)
+        if removed_during_sprint is None and isinstance(report, dict):
+            for key in ("puntedIssues", "removedIssues", "issuesNotCompletedInCurrentSprint"):
+                if isinstance(report.get(key), list):
+                    removed_during_sprint = len(report[key])
+                    break
+        return issues, removed_during_sprint
+
+    # Fetch every sprint concurrently (I/O bound); aggregation below stays serial.
+    sprint_metrics = []
+    for (pk, board_id, sprint_id, sprint_name, start, end), (issues, removed_during_sprint) in zip(
+            sprint_rows, run_parallel(_fetch_sprint, sprint_rows)):
+        # (story points, done) per issue, read once for the committed/done/scope aggregates below.
+        sp_done = [(get_sp(it), _is_done(it)) for it in issues]
+        committed = done = throughput = 0  # committed = everything in sprint snapshot (approx)
+        for sp, is_done in sp_done:
+            committed += sp
+            if is_done:
+                done += sp
+                throughput += 1
         assignee_count, assignee_names = _sprint_assignees(issues)
         component_breakdown = _component_breakdown(issues)
         team_breakdown = _team_breakdown(issues, TEAM_FIELD_ID) if TEAM_FIELD_ID else {}
@@ -2038,34 +2491,6 @@ def main():
         # Scope stability: added after sprint start (from changelog); removed during sprint (from report if available)
         start_dt = parse_dt(start) if start else None
         added_after_sprint_start, added_late_keys = _added_after_sprint_start(issues, sprint_id, sprint_name, start_dt, SPRINT_FIELD_ID) if SPRINT_FIELD_ID and start_dt else (0, [])
-        removed_during_sprint = None
-        report = None
-        try:
-            report = jira.get_sprint_scope_report(board_id, sprint_id)
-            if isinstance(report, dict):
-                contents = report.get("contents") or report.get("completedIssues")
-                if isinstance(contents, dict) and "issueKeysRemovedFromSprint" in contents:
-                    removed_during_sprint = len(contents.get("issueKeysRemovedFromSprint") or [])
-                elif isinstance(report.get("issueKeysRemovedFromSprint"), list):
-                    removed_during_sprint = len(report["issueKeysRemovedFromSprint"])
-        except Exception:
-            pass
-        if removed_during_sprint is None:
-            try:
-                report = jira.get_sprint_report(board_id, sprint_id)
-                if isinstance(report, dict):
-                    contents = report.get("contents") or report.get("completedIssues")
-                    if isinstance(contents, dict) and "issueKeysRemovedFromSprint" in contents:
-                        removed_during_sprint = len(contents.get("issueKeysRemovedFromSprint") or [])
-                    elif isinstance(report.get("issueKeysRemovedFromSprint"), list):
-                        removed_during_sprint = len(report["issueKeysRemovedFromSprint"])
-            except Exception:
-                pass
-        if removed_during_sprint is None and isinstance(report, dict):
-            for key in ("puntedIssues", "removedIssues", "issuesNotCompletedInCurrentSprint"):
-                if isinstance(report.get(key), list):
-                    removed_during_sprint = len(report[key])
-                    break
 
         ratio = (done / committed) if committed else None
         end_dt = parse_dt(end) if end else None
@@ -2073,7 +2498,7 @@ def main():
 
         # Phase 4b: Sprint scope padding — added late AND immediately done
         added_late_set = set(added_late_keys)
-        added_and_done = sum(1 for it in issues if it.get("key") in added_late_set and _is_done(it))
+        added_and_done = sum(1 for it, (_, is_done) in zip(issues, sp_done) if is_done and it.get("key") in added_late_set)
         added_and_done_pct = round(added_and_done / len(issues) * 100, 1) if issues else 0
 
         sprint_metrics.append({
@@ -2162,12 +2587,10 @@ def main():
             by_project[proj]["velocity_cv"] = cv
     results["velocity_cv_by_project"] = velocity_cv_by_project
     if sprint_metrics:
-        df = pd.DataFrame(sprint_metrics)
         print("\nSprint velocity & commitment vs done (recent):")
         # Show a compact view including assignee count
         view_cols = ["project", "sprint_name", "committed_points_or_count", "done_points_or_count", "commitment_done_ratio", "throughput_done_issues", "total_issues", "assignee_count", "added_after_sprint_start", "removed_during_sprint"]
-        view = df[[c for c in view_cols if c in df.columns]]
-        print(view.tail(20).to_string(index=False))
+        print(_format_table(sprint_metrics[-20:], view_cols))
     else:
         print("\nNo sprint metrics computed.")
 
@@ -2178,19 +2601,45 @@ def main():
     try:
         epic_jql = f'project in ({projects_jql}) AND issuetype = Epic AND statusCategory != {DONE_CATEGORY}'
         epics = jira.search(epic_jql, fields=["project", "status", "summary", "created", "components"], max_results=2000)
+
+        def _child_counts(children):
+            total_children = len(children)
+            done_children = sum(1 for c in children if _is_done(c))
+            return total_children, done_children, round(done_children / total_children * 100, 1) if total_children else 0
+
+        def _epic_children(ep):
+            """(total, done, completion pct) of an epic's children; zeros if the child query fails."""
+            child_jql = f'"Epic Link" = {ep.get("key", "?")}'
+            try:
+                return _child_counts(jira.search(child_jql, fields=["status"], max_results=500))
+            except Exception:
+                return 0, 0, 0
+
+        def _epic_children_batch(batch):
+            """Children of up to 50 epics in one query, grouped by the Epic Link field; None if the query fails."""
+            child_jql = f'"Epic Link" in ({", ".join(ep.get("key", "?") for ep in batch)})'
+            try:
+                children = jira.search(child_jql, fields=["status", EPIC_LINK_FIELD_ID], max_results=500 * len(batch))
+            except Exception:
+                return None
+            by_epic = defaultdict(list)
+            for c in children:
+                by_epic[(c.get("fields") or {}).get(EPIC_LINK_FIELD_ID)].append(c)
+            return [_child_counts(by_epic.get(ep.get("key"), [])) for ep in batch]
+
+        # With the Epic Link field id, one query per 50 epics; otherwise (or if a batch fails) one query per epic.
+        if EPIC_LINK_FIELD_ID:
+            child_counts = []
+            batches = [epics[i:i + 50] for i in range(0, len(epics), 50)]
+            for batch, counts in zip(batches, run_parallel(_epic_children_batch, batches)):
+                child_counts.extend(counts if counts is not None else run_parallel(_epic_children, batch))
+        else:
+            child_counts = run_parallel(_epic_children, epics)
         epic_data = []
-        for ep in epics:
+        for ep, (total_children, done_children, pct) in zip(epics, child_counts):
             ep_key = ep.get("key", "?")
             ep_fields = ep.get("fields") or {}
             ep_age = bug_age_days(ep, now=now)
-            child_jql = f'"Epic Link" = {ep_key}'
-            try:
-                children = jira.search(child_jql, fields=["status"], max_results=500)
-                total_children = len(children)
-                done_children = sum(1 for c in children if _is_done(c))
-                pct = round(done_children / total_children * 100, 1) if total_children else 0
-            except Exception:
-                total_children, done_children, pct = 0, 0, 0
             stale = (ep_age or 0) > 180 and pct < 20
             epic_row = {
                 "key": ep_key,
@@ -2225,33 +2674,42 @@ def main():
     # ---------
     print("\nPulling project versions for release tracking...")
     release_data = []
-    for pk in PROJECT_KEYS:
+
+    def _project_versions(pk):
         try:
-            versions = jira.list_project_versions(pk)
-            if not isinstance(versions, list):
-                continue
-            for v in versions:
-                released = v.get("released", False)
-                release_date = v.get("releaseDate")
-                release_data.append({
-                    "project": pk,
-                    "name": v.get("name", "?"),
-                    "released": released,
-                    "release_date": release_date,
-                })
+            return jira.list_project_versions(pk), None
         except Exception as e:
-            print(f"  {pk}: version fetch failed ({e})")
+            return None, e
+
+    for pk, (versions, err) in zip(PROJECT_KEYS, run_parallel(_project_versions, PROJECT_KEYS)):
+        if err is not None:
+            print(f"  {pk}: version fetch failed ({err})")
+            continue
+        if not isinstance(versions, list):
+            continue
+        for v in versions:
+            released = v.get("released", False)
+            release_date = v.get("releaseDate")
+            release_data.append({
+                "project": pk,
+                "name": v.get("name", "?"),
+                "released": released,
+                "release_date": release_date,
+            })
     results["releases"] = release_data
     released_versions = [r for r in release_data if r["released"]]
     results["total_released_versions"] = len(released_versions)
     # releases per month
+    # Jira release dates are plain YYYY-MM-DD: bucket on (year, month) ints, format each month once.
     rel_months = Counter()
     for r in released_versions:
-        if r.get("release_date"):
-            dt = parse_dt(r["release_date"])
-            if dt:
-                rel_months[dt.strftime("%Y-%m")] += 1
-    results["releases_per_month"] = dict(rel_months)
+        rd = r.get("release_date")
+        if rd and rd[4:5] == "-":
+            try:
+                rel_months[(int(rd[0:4]), int(rd[5:7]))] += 1
+            except ValueError:
+                pass
+    results["releases_per_month"] = {f"{y:04d}-{m:02d}": c for (y, m), c in rel_months.items()}
     print(f"  Total versions: {len(release_data)}, released: {len(released_versions)}")
 
     # Inject releases_per_month into per-project scopes
@@ -2289,16 +2747,16 @@ def main():
         print("Error:", e)
 
     # Save JSON for insights (Cursor, dashboards, etc.)
-    def _json_default(obj):
-        if isinstance(obj, float) and math.isnan(obj):
-            return None
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
     out_dir = os.environ.get("OUTPUT_DIR", os.path.dirname(os.path.abspath(__file__)))
     latest_path = os.path.join(out_dir, "jira_analytics_latest.json")
     ts_path = os.path.join(out_dir, f"jira_analytics_{run_ts.replace(':', '-')}.json")
-    for path in (latest_path, ts_path):
-        with open(path, "w", encoding="utf-8") as f:
-            _json.dump(results, f, indent=2, ensure_ascii=False, default=_json_default)
+    # Encode once into a temp file, copy it to the timestamped name, then swap it in as latest:
+    # at most one serialized copy is ever in memory (none with json, which streams to the file),
+    # and readers of the latest file never see a half-written one. orjson already writes NaN as null.
+    tmp_path = latest_path + ".tmp"
+    _write_results_json(tmp_path, results)
+    shutil.copyfile(tmp_path, ts_path)
+    os.replace(tmp_path, latest_path)
     print(f"\nResults saved to: {latest_path}")
     print(f"              and: {ts_path}")
     print("\nDone.")
@@ -0,0 +1,334 @@
+"""Tests for the dispatcher's merge slot, merges, pending-retry journal and task queue."""
+
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Repo root on path for `import dispatch_workers`
+_REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import dispatch_workers  # noqa: E402
+
+
+def _git_version():
+    try:
+        out = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout
+    except OSError:
+        return None
+    m = re.search(r"(\d+)\.(\d+)", out)
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+
+_GIT_VERSION = _git_version()
+
+
+class MergeSlotTests(unittest.TestCase):
+    def _acquire_while_released_after(self, repo_root, delay):
+        self.assertTrue(dispatch_workers.acquire_merge_slot(repo_root))
+        timer = threading.Timer(delay, dispatch_workers.release_merge_slot, (repo_root,))
+        timer.start()
+        started = time.monotonic()
+        try:
+            acquired = dispatch_workers.acquire_merge_slot(repo_root, timeout_secs=5)
+        finally:
+            timer.join()
+        elapsed = time.monotonic() - started
+        dispatch_workers.release_merge_slot(repo_root)
+        return acquired, elapsed
+
+    @unittest.skipIf(dispatch_workers.INotify is None, "inotify_simple not installed (Linux only)")
+    def test_acquire_merge_slot_wakes_on_release_via_inotify(self):
+        watchers = []
+        real_watcher = dispatch_workers._merge_lock_watcher
+
+        def spy_watcher(lock_path):
+            watcher = real_watcher(lock_path)
+            watchers.append(watcher)
+            return watcher
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                mock.patch.object(dispatch_workers, "_merge_lock_watcher", spy_watcher):
+            acquired, elapsed = self._acquire_while_released_after(Path(tmpdir), 0.2)
+
+        self.assertTrue(acquired)
+        self.assertEqual(len(watchers), 1)
+        self.assertIsNotNone(watchers[0])
+        # The polling fallback would only see the release at its 1-second re-check.
+        self.assertLess(elapsed, 0.9)
+
+    def test_acquire_merge_slot_polls_without_inotify(self):
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(dispatch_workers, "INotify", None):
+            acquired, elapsed = self._acquire_while_released_after(Path(tmpdir), 0.2)
+
+        self.assertTrue(acquired)
+        self.assertGreaterEqual(elapsed, 0.2)
+
+    def test_acquire_merge_slot_times_out_while_held(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            self.assertTrue(dispatch_workers.acquire_merge_slot(repo_root))
+            self.assertFalse(dispatch_workers.acquire_merge_slot(repo_root, timeout_secs=0.3))
+            dispatch_workers.release_merge_slot(repo_root)
+
+
+@unittest.skipIf(shutil.which("git") is None or _GIT_VERSION is None, "git not installed")
+class MergeWorktreeTests(unittest.TestCase):
+    """merge_worktree_into_main / _merge_via_merge_tree against a scratch repo with one worker worktree."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name) / "repo"
+        self.repo.mkdir()
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.email", "dispatcher@example.com")
+        self.git("config", "user.name", "Dispatcher Test")
+        self.commit(self.repo, "base.txt", "base\n", "base")
+        self.worktree = Path(tmp.name) / "w1"
+        self.git("worktree", "add", "-q", "-b", "ozon-w1", str(self.worktree), "main")
+
+    def git(self, *args, cwd=None):
+        r = subprocess.run(["git", *args], cwd=cwd or self.repo, capture_output=True, text=True)
+        self.assertEqual(r.returncode, 0, r.stderr)
+        return r.stdout.strip()
+
+    def commit(self, cwd, name, content, message):
+        (cwd / name).write_text(content, encoding="utf-8")
+        self.git("add", name, cwd=cwd)
+        self.git("commit", "-q", "-m", message, cwd=cwd)
+        return self.git("rev-parse", "HEAD", cwd=cwd)
+
+    def merge(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            return dispatch_workers.merge_worktree_into_main(self.repo, self.worktree, "ozon-w1", "main")
+
+    def test_fast_forward_moves_main_and_checked_out_tree(self):
+        branch_oid = self.commit(self.worktree, "feature.txt", "feature\n", "feature")
+
+        result = dispatch_workers._merge_via_merge_tree(self.repo, "ozon-w1", "main")
+
+        self.assertEqual(result, (True, None))
+        self.assertEqual(self.git("rev-parse", "main"), branch_oid)
+        self.assertEqual((self.repo / "feature.txt").read_text(encoding="utf-8"), "feature\n")
+
+    @unittest.skipIf(_GIT_VERSION is not None and _GIT_VERSION < (2, 38), "git merge-tree --write-tree needs git 2.38")
+    def test_diverged_branches_get_a_merge_commit(self):
+        base_oid = self.commit(self.repo, "main.txt", "main\n", "main change")
+        branch_oid = self.commit(self.worktree, "feature.txt", "feature\n", "feature")
+
+        result = self.merge()
+
+        self.assertEqual(result, (True, None))
+        parents = self.git("rev-list", "--parents", "-n", "1", "main").split()[1:]
+        self.assertEqual(parents, [base_oid, branch_oid])
+        self.assertEqual(self.git("log", "-1", "--format=%s", "main"), "Merge ozon-w1 (dispatcher)")
+        self.assertTrue((self.repo / "feature.txt").exists())
+        self.assertEqual(self.git("status", "--porcelain"), "")
+        # The worktree is reset to the new main for its next task.
+        self.assertEqual(self.git("rev-parse", "HEAD", cwd=self.worktree), self.git("rev-parse", "main"))
+
+    @unittest.skipIf(_GIT_VERSION is not None and _GIT_VERSION < (2, 38), "git merge-tree --write-tree needs git 2.38")
+    def test_real_conflict_returns_message_for_the_conflict_task(self):
+        base_oid = self.commit(self.repo, "base.txt", "main side\n", "main edit")
+        self.commit(self.worktree, "base.txt", "branch side\n", "branch edit")
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            result = dispatch_workers._merge_via_merge_tree(self.repo, "ozon-w1", "main")
+
+        ok, msg = result
+        self.assertFalse(ok)
+        self.assertIn("CONFLICT", msg)
+        self.assertIn("base.txt", msg)
+        self.assertEqual(self.git("rev-parse", "main"), base_oid)
+        self.assertEqual(self.git("status", "--porcelain"), "")
+
+    @unittest.skipIf(_GIT_VERSION is not None and _GIT_VERSION < (2, 38), "git merge-tree --write-tree needs git 2.38")
+    def test_trivial_file_conflicts_fall_back_to_checkout_merge(self):
+        task_file = dispatch_workers.TASK_FILE
+        self.commit(self.repo, task_file, "main task\n", "main task file")
+        self.commit(self.worktree, task_file, "worker task\n", "worker task file")
+        self.commit(self.worktree, "feature.txt", "feature\n", "feature")
+
+        self.assertIsNone(dispatch_workers._merge_via_merge_tree(self.repo, "ozon-w1", "main"))
+        result = self.merge()
+
+        self.assertEqual(result, (True, None))
+        self.assertEqual(
+            self.git("log", "-1", "--format=%s", "main"), "Merge ozon-w1 (dispatcher, resolve trivial conflicts)"
+        )
+        self.assertTrue((self.repo / "feature.txt").exists())
+        self.assertNotIn(task_file, self.git("ls-tree", "--name-only", "main").split())
+
+    @unittest.skipIf(_GIT_VERSION is not None and _GIT_VERSION < (2, 38), "git merge-tree --write-tree needs git 2.38")
+    def test_detached_head_in_repo_root_updates_ref_without_touching_tree(self):
+        self.commit(self.repo, "main.txt", "main\n", "main change")
+        self.git("checkout", "-q", "--detach")
+        head_before = self.git("rev-parse", "HEAD")
+        self.commit(self.worktree, "feature.txt", "feature\n", "feature")
+
+        result = dispatch_workers._merge_via_merge_tree(self.repo, "ozon-w1", "main")
+
+        self.assertEqual(result, (True, None))
+        self.assertEqual(self.git("rev-parse", "HEAD"), head_before)
+        self.assertFalse((self.repo / "feature.txt").exists())
+        self.assertEqual(self.git("rev-parse", "main^2"), self.git("rev-parse", "ozon-w1"))
+
+    def test_branch_without_new_commits_is_a_no_op(self):
+        main_before = self.git("rev-parse", "main")
+
+        with mock.patch.object(dispatch_workers, "_merge_via_merge_tree") as merge_tree:
+            result = self.merge()
+
+        self.assertEqual(result, (True, None))
+        merge_tree.assert_not_called()
+        self.assertEqual(self.git("rev-parse", "main"), main_before)
+
+
+class PendingMergeRetriesTests(unittest.TestCase):
+    """The pending-retry snapshot plus its append-only journal."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.log_path = self.root / dispatch_workers.PENDING_MERGE_RETRIES_LOG
+        self.forget_cache()
+
+    def forget_cache(self):
+        """What a freshly started dispatcher sees: nothing cached from this process."""
+        dispatch_workers._PENDING_CACHE.update(key=None, data=None)
+
+    def test_journal_is_replayed_over_the_snapshot(self):
+        dispatch_workers.save_pending_merge_retries(self.root, {"ozon-w1": "task-1", "ozon-w2": "task-2"})
+        dispatch_workers.add_pending_merge_retries(self.root, {"ozon-w3": "task-3"})
+        dispatch_workers.remove_pending_merge_retries(self.root, ["ozon-w1"])
+        self.assertTrue(self.log_path.exists())
+
+        self.forget_cache()
+
+        self.assertEqual(
+            dispatch_workers.load_pending_merge_retries(self.root), {"ozon-w2": "task-2", "ozon-w3": "task-3"}
+        )
+
+    def test_torn_last_journal_line_is_ignored(self):
+        dispatch_workers.save_pending_merge_retries(self.root, {"ozon-w1": "task-1"})
+        dispatch_workers.add_pending_merge_retries(self.root, {"ozon-w2": "task-2"})
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write('{"op":"add","branch":"ozon-w3","i')  # append cut short by a crash
+
+        self.forget_cache()
+
+        self.assertEqual(
+            dispatch_workers.load_pending_merge_retries(self.root), {"ozon-w1": "task-1", "ozon-w2": "task-2"}
+        )
+
+    def test_journal_is_compacted_into_the_snapshot_past_the_size_limit(self):
+        expected = {}
+        with mock.patch.object(dispatch_workers, "PENDING_MERGE_LOG_COMPACT_BYTES", 256):
+            for i in range(1, 11):
+                dispatch_workers.add_pending_merge_retries(self.root, {f"ozon-w{i}": f"task-{i}"})
+                expected[f"ozon-w{i}"] = f"task-{i}"
+                self.assertLessEqual(self.log_path.stat().st_size if self.log_path.exists() else 0, 256)
+
+        self.forget_cache()
+        snapshot = json.loads((self.root / dispatch_workers.PENDING_MERGE_RETRIES_FILE).read_text(encoding="utf-8"))
+        self.assertTrue(snapshot["pending"])
+        self.assertEqual(dispatch_workers.load_pending_merge_retries(self.root), expected)
+
+    def test_crash_between_snapshot_and_journal_unlink_replays_to_the_same_state(self):
+        dispatch_workers.save_pending_merge_retries(self.root, {"ozon-w1": "task-1", "ozon-w2": "task-2"})
+        dispatch_workers.add_pending_merge_retries(self.root, {"ozon-w3": "task-3", "ozon-w1": "task-9"})
+        dispatch_workers.remove_pending_merge_retries(self.root, ["ozon-w2"])
+        expected = dispatch_workers.load_pending_merge_retries(self.root)
+
+        # The snapshot of the folded state was written, but the process died before removing the journal.
+        with mock.patch.object(Path, "unlink"):
+            dispatch_workers.save_pending_merge_retries(self.root, expected)
+        self.assertTrue(self.log_path.exists())
+
+        self.forget_cache()
+
+        self.assertEqual(dispatch_workers.load_pending_merge_retries(self.root), expected)
+        self.assertEqual(expected, {"ozon-w1": "task-9", "ozon-w3": "task-3"})
+
+
+class TaskQueueFlushTests(unittest.TestCase):
+    """Status changes made with save=False and written by flush_task_queue."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.path = dispatch_workers.task_queue_path(self.root)
+        dispatch_workers._TQ_CACHE.update(path=None, mtime_ns=-1, size=-1, data=None, index=None)
+        dispatch_workers._TQ_UNSAVED.clear()
+        tasks = [{"id": f"task-{i}", "title": f"T{i}", "status": "pending"} for i in range(1, 4)]
+        dispatch_workers.save_task_queue(self.root, {"tasks": tasks, "next_id": 4})
+
+    def read_statuses(self):
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        return {t["id"]: t["status"] for t in data["tasks"]}
+
+    def add_task_like_split_task(self, title):
+        """Read-modify-write in place, as split_task.task_queue_add does from another process."""
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data["tasks"].append({"id": f"task-{data['next_id']}", "title": title, "status": "pending", "parent": None})
+        data["next_id"] += 1
+        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    def test_unsaved_marks_are_written_only_by_flush(self):
+        dispatch_workers.mark_tasks_status(self.root, ["task-1", "task-2"], "in_progress", save=False)
+        self.assertEqual(set(self.read_statuses().values()), {"pending"})
+
+        dispatch_workers.flush_task_queue(self.root)
+
+        self.assertEqual(
+            self.read_statuses(), {"task-1": "in_progress", "task-2": "in_progress", "task-3": "pending"}
+        )
+        self.assertEqual(dispatch_workers._TQ_UNSAVED, {})
+
+    def test_flush_keeps_external_tasks_and_unsaved_statuses(self):
+        dispatch_workers.mark_tasks_status(self.root, ["task-1", "task-2"], "in_progress", save=False)
+        dispatch_workers.mark_task_status(self.root, "task-3", "done", save=False)
+        self.add_task_like_split_task("Split subtask")
+
+        # The reloaded queue already carries this process's unsaved statuses.
+        self.assertEqual(
+            dispatch_workers.get_next_pending_from_queue(self.root), {"id": "task-4", "title": "Split subtask"}
+        )
+        dispatch_workers.flush_task_queue(self.root)
+
+        self.assertEqual(
+            self.read_statuses(),
+            {"task-1": "in_progress", "task-2": "in_progress", "task-3": "done", "task-4": "pending"},
+        )
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["next_id"], 5)
+
+    def test_external_rewrite_after_flush_is_not_overridden(self):
+        dispatch_workers.mark_task_status(self.root, "task-1", "in_progress", save=False)
+        dispatch_workers.flush_task_queue(self.root)
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data["tasks"][0]["status"] = "pending"  # e.g. reset by hand
+        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        dispatch_workers.flush_task_queue(self.root)
+
+        self.assertEqual(self.read_statuses()["task-1"], "pending")
+        self.assertEqual(dispatch_workers.get_next_pending_from_queue(self.root)["id"], "task-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
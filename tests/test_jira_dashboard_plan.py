@@ -1,9 +1,16 @@
+import contextlib
+import io
+import json
 import os
+import shutil
 import sys
 import tempfile
+import threading
+import time
 import types
 import unittest
 from datetime import datetime, timezone
+from unittest import mock
 
 import insights_by_project
 
@@ -85,6 +92,81 @@ class JiraDashboardPlanTests(unittest.TestCase):
         self.assertEqual(metrics["created_by_week"], expected)
         self.assertNotEqual(metrics["created_by_week"], jira_analytics._created_by_week([wip_issue, done_issue]))
 
+    def _scope_jobs(self):
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        jobs = []
+        for n, project in enumerate(["OZN", "PMBK", "OZN"]):
+            wip = [make_issue(key=f"{project}-{n}{i}", project=project, components=["API"]) for i in range(n + 2)]
+            done = [
+                make_issue(
+                    key=f"{project}-{n}{i}D",
+                    project=project,
+                    created="2026-01-05T00:00:00.000+0000",
+                    resolved=f"2026-02-0{i + 1}T00:00:00.000+0000",
+                    status="Done",
+                )
+                for i in range(n + 1)
+            ]
+            bugs = [make_issue(key=f"{project}-{n}B", project=project, issuetype="Bug")]
+            jobs.append({
+                "wip_list": wip,
+                "blocked_list": wip[:1],
+                "done_list": done,
+                "done_90_list": done,
+                "open_bug_list": bugs,
+                "created_list": wip + done + bugs,
+                "story_points_field": None,
+                "now": now,
+                "team_field_id": None,
+            })
+        return jobs
+
+    def _compute_scopes(self, jobs, processes):
+        out = io.StringIO()
+        with mock.patch.object(jira_analytics, "JIRA_SCOPE_PROCESSES", processes), contextlib.redirect_stdout(out):
+            return jira_analytics.compute_scope_metrics(jobs), out.getvalue()
+
+    def test_compute_scope_metrics_process_pool_matches_serial(self):
+        parallel, log = self._compute_scopes(self._scope_jobs(), 2)
+        serial, _ = self._compute_scopes(self._scope_jobs(), 1)
+
+        self.assertNotIn("serially", log)
+        self.assertEqual(len(parallel), 3)
+        self.assertEqual(parallel, serial)
+
+    def test_compute_scope_metrics_falls_back_to_serial_when_a_job_cannot_be_pickled(self):
+        jobs = self._scope_jobs()
+        jobs[1]["wip_list"][0]["_lock"] = threading.Lock()  # TypeError: cannot pickle '_thread.lock' object
+
+        results, log = self._compute_scopes(jobs, 2)
+        serial, _ = self._compute_scopes(self._scope_jobs(), 1)
+
+        self.assertIn("computing scopes serially", log)
+        self.assertEqual(results, serial)
+
+    def test_results_json_writes_issue_components_as_arrays(self):
+        with_components = make_issue(key="OZN-1", components=["API", "UI"])
+        without_components = make_issue(key="OZN-2")
+        self.assertIsInstance(jira_analytics._issue_components(with_components), tuple)
+        results = {
+            "blocked_oldest_details": [{"key": "OZN-1", "components": jira_analytics._issue_components(with_components)}],
+            "oldest_open_bugs": [{"key": "OZN-2", "components": jira_analytics._issue_components(without_components)}],
+            "epic_health": [{"key": "OZN-1", "components": jira_analytics._issue_components(with_components)}],
+        }
+
+        encoders = [None] + ([jira_analytics.orjson] if jira_analytics.orjson is not None else [])
+        for encoder in encoders:
+            with self.subTest(orjson=encoder is not None), tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "jira_analytics_latest.json")
+                with mock.patch.object(jira_analytics, "orjson", encoder):
+                    jira_analytics._write_results_json(path, results)
+                with open(path, encoding="utf-8") as fh:
+                    written = json.load(fh)
+
+                self.assertEqual(written["blocked_oldest_details"][0]["components"], ["API", "UI"])
+                self.assertEqual(written["oldest_open_bugs"][0]["components"], ["(no component)"])
+                self.assertEqual(written["epic_health"][0]["components"], ["API", "UI"])
+
     def test_select_project_board_prefers_location_match_then_type(self):
         boards = [
             {"id": 10, "name": "Shared Scrum", "type": "scrum", "location": {"projectKey": "OTHER"}},
@@ -108,6 +190,36 @@ class JiraDashboardPlanTests(unittest.TestCase):
         self.assertNotIn("53 open; median age ~398 days", text)
         self.assertIn(f"**Open bugs:** {data.get('open_bugs_count', 0)}", text)
 
+    def test_insights_main_skips_unchanged_inputs_and_rebuilds_after_script_change(self):
+        fixture_path = os.path.join(os.path.dirname(__file__), "..", "jira_analytics_latest.json")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "jira_analytics_latest.json")
+            shutil.copyfile(fixture_path, src)
+            script_copy = os.path.join(tmpdir, "insights_by_project.py")
+            shutil.copyfile(insights_by_project.__file__, script_copy)
+
+            def run():
+                out = io.StringIO()
+                with mock.patch.dict(os.environ, {"OUTPUT_DIR": tmpdir}), \
+                        mock.patch.object(sys, "argv", ["insights_by_project.py", src]), \
+                        mock.patch.object(insights_by_project, "_SCRIPT_PATH", script_copy), \
+                        contextlib.redirect_stdout(out):
+                    insights_by_project.main()
+                return out.getvalue()
+
+            self.assertIn("Wrote", run())
+            self.assertIn("up to date", run())
+
+            with open(script_copy, "a", encoding="utf-8") as fh:
+                fh.write("\n# changed\n")
+            self.assertIn("Wrote", run())
+            self.assertIn("up to date", run())
+
+            with open(src, "a", encoding="utf-8") as fh:
+                fh.write("\n")
+            self.assertIn("Wrote", run())
+
     def test_story_point_recommendation_depends_on_sp_history(self):
         data = {
             "run_iso_ts": "2026-03-12T00:00:00Z",
@@ -139,6 +251,203 @@ class JiraDashboardPlanTests(unittest.TestCase):
         self.assertIn("no story point trend data", text)
         self.assertNotIn("PMBK:** Scrum: no story point trend data", text)
 
+    def test_reopen_count_counts_issues_not_reopen_events(self):
+        flapping = make_issue(key="OZN-1", status="Done")
+        flapping["changelog"] = {"histories": [
+            {"created": f"2026-01-0{day}T00:00:00.000+0000", "items": [{"field": "status", "toString": to}]}
+            for day, to in enumerate(["Done", "In Progress", "Done", "In Progress", "Done"], start=1)
+        ]}
+        steady = make_issue(key="OZN-2", status="Done")
+        steady["changelog"] = {"histories": [
+            {"created": "2026-01-01T00:00:00.000+0000", "items": [{"field": "status", "toString": "Done"}]},
+        ]}
+
+        result = jira_analytics._reopen_count([flapping, steady])
+
+        self.assertEqual(result["reopened_count"], 1)
+        self.assertEqual(result["reopened_pct"], 50.0)
+
+    def test_assignee_change_near_resolution_reports_latest_change_in_window(self):
+        def history(created, name, field="assignee"):
+            return {"created": created, "author": {"displayName": name}, "items": [{"field": field}]}
+
+        late = make_issue(key="OZN-1", status="Done", resolved="2026-01-10T12:00:00.000+0000")
+        late["changelog"] = {"histories": [
+            history("2026-01-10T08:00:00.000+0000", "Bob"),
+            history("2026-01-01T00:00:00.000+0000", "Early"),
+            history("2026-01-10T10:00:00.000+0000", "Carol"),
+            history("2026-01-10T11:00:00.000+0000", "Status", field="status"),
+        ]}
+        early = make_issue(key="OZN-2", status="Done", resolved="2026-01-10T12:00:00.000+0000")
+        early["changelog"] = {"histories": [history("2026-01-08T00:00:00.000+0000", "Early")]}
+
+        self.assertEqual(jira_analytics._late_assignee_changer(late, 24), "Carol")
+        self.assertIsNone(jira_analytics._late_assignee_changer(early, 24))
+        self.assertIsNone(jira_analytics._late_assignee_changer(late, 1))
+
+    def test_jira_get_reuses_cached_body_on_304(self):
+        class FakeResponse:
+            def __init__(self, status_code, body=None, etag=None):
+                self.status_code = status_code
+                self._body = body
+                self.headers = {"ETag": etag} if etag else {}
+                self.text = ""
+                self.content = json.dumps(body).encode("utf-8")
+
+            def json(self):
+                return self._body
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+                self.responses = [FakeResponse(200, {"values": [1]}, etag='"v1"'), FakeResponse(304)]
+
+            def get(self, url, params=None, headers=None, timeout=None):
+                self.calls.append(headers)
+                return self.responses.pop(0)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = jira_analytics.JiraClient.__new__(jira_analytics.JiraClient)
+            client.base = "https://jira.example"
+            client.session = FakeSession()
+            client.cache_dir = tmpdir
+            client._fields = None
+
+            first = client._get("/rest/agile/1.0/board", params={"projectKeyOrId": "OZN"})
+            second = client._get("/rest/agile/1.0/board", params={"projectKeyOrId": "OZN"})
+
+        self.assertEqual(first, {"values": [1]})
+        self.assertEqual(second, {"values": [1]})
+        self.assertIsNone(client.session.calls[0])
+        self.assertEqual(client.session.calls[1], {"If-None-Match": '"v1"'})
+
+    def test_search_incremental_redownloads_only_changed_issues(self):
+        def issue(key, updated, summary):
+            return {"key": key, "fields": {"updated": updated, "summary": summary}}
+
+        server = {"OZN-1": issue("OZN-1", "t1", "one"), "OZN-2": issue("OZN-2", "t1", "two")}
+        full_fetches = []
+
+        def fake_search(jql, fields=None, expand=None, max_results=1000):
+            if fields == ["updated"]:
+                return [{"key": k, "fields": {"updated": v["fields"]["updated"]}} for k, v in server.items()]
+            keys = jql[len("key in ("):-1].split(", ")
+            full_fetches.append(keys)
+            return [server[k] for k in keys]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = jira_analytics.JiraClient.__new__(jira_analytics.JiraClient)
+            client.cache_dir = tmpdir
+            client.search = fake_search
+
+            first = client.search_incremental("project = OZN", fields=["summary"])
+            server["OZN-2"] = issue("OZN-2", "t2", "two v2")
+            del server["OZN-1"]
+            server["OZN-3"] = issue("OZN-3", "t2", "three")
+            second = client.search_incremental("project = OZN", fields=["summary"])
+
+        self.assertEqual([it["key"] for it in first], ["OZN-1", "OZN-2"])
+        self.assertEqual(full_fetches[1], ["OZN-2", "OZN-3"])
+        self.assertEqual([it["fields"]["summary"] for it in second], ["two v2", "three"])
+
+    def test_search_incremental_falls_back_to_full_search_when_key_batch_is_rejected(self):
+        class FakeResponse:
+            def __init__(self, status_code, body=None):
+                self.status_code = status_code
+                self._body = body
+                self.headers = {}
+                self.text = "Issue does not exist or you do not have permission to see it." if status_code >= 400 else ""
+                self.content = json.dumps(body).encode("utf-8")
+
+            def json(self):
+                return self._body
+
+        server = {
+            "OZN-1": {"key": "OZN-1", "fields": {"updated": "t1", "summary": "one"}},
+            "OZN-2": {"key": "OZN-2", "fields": {"updated": "t1", "summary": "two"}},
+        }
+        jqls = []
+
+        class FakeSession:
+            def get(self, url, params=None, headers=None, timeout=None):
+                jql = params["jql"]
+                jqls.append(jql)
+                if jql.startswith("key in ("):
+                    keys = jql[len("key in ("):-1].split(", ")
+                    if any(k not in server for k in keys):
+                        return FakeResponse(400, {"errorMessages": ["An issue with key 'OZN-2' does not exist"]})
+                    return FakeResponse(200, {"issues": [server[k] for k in keys]})
+                issues = list(server.values())
+                if params.get("fields") == "updated":
+                    del server["OZN-2"]  # deleted between the index query and the batch fetch
+                return FakeResponse(200, {"issues": issues})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = jira_analytics.JiraClient.__new__(jira_analytics.JiraClient)
+            client.base = "https://jira.example"
+            client.session = FakeSession()
+            client.cache_dir = tmpdir
+            client._memo = {}
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                issues = client.search_incremental("project = OZN", fields=["summary"])
+
+        self.assertEqual([it["key"] for it in issues], ["OZN-1"])
+        self.assertEqual(jqls, ["project = OZN", "key in (OZN-1, OZN-2)", "project = OZN"])
+
+    def test_search_reuses_identical_request_within_run(self):
+        client = jira_analytics.JiraClient.__new__(jira_analytics.JiraClient)
+        client._memo = {}
+        calls = []
+
+        def fake_get(path, params=None, timeout=60):
+            calls.append(params["jql"])
+            return {"issues": [{"key": "OZN-1"}]}
+
+        client._get = fake_get
+        first = client.search("project = OZN", fields=["status"])
+        second = client.search("project = OZN", fields=["status"])
+        client.search("project = OZN", fields=["summary"])
+
+        self.assertEqual(first, [{"key": "OZN-1"}])
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 2)
+
+    def test_concurrent_identical_searches_fetch_once(self):
+        client = jira_analytics.JiraClient.__new__(jira_analytics.JiraClient)
+        client._memo = {}
+        calls = []
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def fake_get(path, params=None, timeout=60):
+            calls.append(params["jql"])
+            if params["jql"] == "broken":
+                raise RuntimeError("Jira API 500")
+            fetching.set()
+            release.wait(5)
+            return {"issues": [{"key": "OZN-1"}]}
+
+        client._get = fake_get
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.search("project = OZN"))) for _ in range(2)]
+        threads[0].start()
+        self.assertTrue(fetching.wait(5))
+        threads[1].start()
+        time.sleep(0.1)  # let the second caller reach the memo while the first is still fetching
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        self.assertEqual(calls, ["project = OZN"])
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                client.search("broken")
+        self.assertEqual(calls.count("broken"), 2)
+
 
 if __name__ == "__main__":
     unittest.main()